@@ -0,0 +1,267 @@
+import base64
+import hashlib
+import json
+import uuid
+from datetime import datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import BooleanField, Count, ExpressionWrapper, Max, Q
+from django.http import HttpResponseNotModified, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+
+class KeysetFeed:
+    """
+    Keyset-paginated, optionally NDJSON-streamed feed over a `.values()`
+    queryset ordered by (updated_at, id), for the scraper endpoints.
+
+    Query params:
+      - `updated_since` (ISO datetime): only rows changed after this instant.
+      - `cursor` / `limit`: one page as {"results": [...], "next_cursor": ...};
+        `next_cursor` is also the delta point for the next poll.
+      - `stream=ndjson` (or `Accept: application/x-ndjson`): stream one JSON
+        object per line. (`format` is taken by DRF's format suffix override.)
+    Without any of these the feed is streamed as the plain JSON list the
+    scraper already expects. Rows are read in keyset chunks either way, and
+    `ETag` / `If-Modified-Since` short-circuit unchanged feeds with a 304.
+
+    When `active` (a Q) is given, the full feed only lists matching rows,
+    while `updated_since` deltas also carry rows that stopped matching, as
+    `{"id": ..., "deleted": true}` tombstones; live delta rows get
+    `"deleted": false`. Deltas rely on every change bumping `updated_at`.
+    """
+
+    DEFAULT_LIMIT = 500
+    MAX_LIMIT = 5000
+    STREAM_CHUNK = 1000
+    NDJSON = 'application/x-ndjson'
+
+    def __init__(self, request, queryset, fields, serialize, active=None):
+        self.request = request
+        self.queryset = queryset
+        self.fields = list({*fields, 'id', 'updated_at'})
+        self.serialize = serialize
+        self.active = active
+
+    # ─── Request parsing ───
+
+    def get_updated_since(self):
+        value = self.request.query_params.get('updated_since')
+        if not value:
+            return None
+        parsed = parse_datetime(value)
+        if parsed is None:
+            raise ValidationError({'updated_since': 'Expected an ISO 8601 datetime.'})
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    def get_limit(self):
+        try:
+            limit = int(self.request.query_params.get('limit', self.DEFAULT_LIMIT))
+        except (TypeError, ValueError):
+            raise ValidationError({'limit': 'Must be an integer.'})
+        return max(1, min(limit, self.MAX_LIMIT))
+
+    def wants_ndjson(self):
+        return self.request.query_params.get('stream') == 'ndjson' \
+            or self.NDJSON in self.request.headers.get('Accept', '')
+
+    def is_paginated(self):
+        params = self.request.query_params
+        return 'cursor' in params or 'limit' in params
+
+    # ─── Cursor ───
+
+    @staticmethod
+    def encode_cursor(row):
+        raw = f"{row['updated_at'].isoformat()}|{row['id']}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor):
+        try:
+            updated_at, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split('|', 1)
+            return datetime.fromisoformat(updated_at), str(uuid.UUID(pk))
+        except (ValueError, UnicodeDecodeError):
+            raise ValidationError({'cursor': 'Invalid cursor.'})
+
+    @staticmethod
+    def after(qs, updated_at, pk):
+        return qs.filter(Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, id__gt=pk))
+
+    # ─── Conditional GET ───
+
+    def fingerprint(self, qs):
+        stats = qs.order_by().aggregate(total=Count('id'), last_modified=Max('updated_at'))
+        last_modified = stats['last_modified'].isoformat() if stats['last_modified'] else ''
+        raw = f"{stats['total']}:{last_modified}:{self.request.GET.urlencode()}"
+        return quote_etag(hashlib.md5(raw.encode()).hexdigest()), stats['last_modified']
+
+    def is_not_modified(self, etag, last_modified):
+        if_none_match = self.request.headers.get('If-None-Match')
+        if if_none_match:
+            return etag in [tag.strip() for tag in if_none_match.split(',')]
+        since = parse_http_date_safe(self.request.headers.get('If-Modified-Since', ''))
+        return bool(since and last_modified and int(last_modified.timestamp()) <= since)
+
+    # ─── Reading ───
+
+    def iter_rows(self, qs):
+        """Keyset chunks so the full feed is never materialized."""
+        page = qs
+        while True:
+            rows = list(page[:self.STREAM_CHUNK])
+            if not rows:
+                return
+            yield from rows
+            last = rows[-1]
+            page = self.after(qs, last['updated_at'], last['id'])
+
+    def stream_json_list(self, qs):
+        yield '['
+        first = True
+        for row in self.iter_rows(qs):
+            yield ('' if first else ',') + json.dumps(self.serialize(row), cls=DjangoJSONEncoder)
+            first = False
+        yield ']'
+
+    def stream_ndjson(self, qs):
+        for row in self.iter_rows(qs):
+            yield json.dumps(self.serialize(row), cls=DjangoJSONEncoder) + '\n'
+
+    def serialize_delta(self, row):
+        if not row['feed_active']:
+            return {"id": str(row['id']), "deleted": True}
+        return {**self.serialize(row), "deleted": False}
+
+    def response(self):
+        qs = self.queryset
+        updated_since = self.get_updated_since()
+        if updated_since:
+            qs = qs.filter(updated_at__gt=updated_since)
+            if self.active is not None:
+                qs = qs.annotate(feed_active=ExpressionWrapper(self.active, output_field=BooleanField()))
+                self.fields.append('feed_active')
+                self.serialize = self.serialize_delta
+        elif self.active is not None:
+            qs = qs.filter(self.active)
+
+        etag, last_modified = self.fingerprint(qs)
+        headers = {'ETag': etag}
+        if last_modified:
+            headers['Last-Modified'] = http_date(last_modified.timestamp())
+
+        if self.is_not_modified(etag, last_modified):
+            response = HttpResponseNotModified()
+            for key, value in headers.items():
+                response[key] = value
+            return response
+
+        qs = qs.order_by('updated_at', 'id').values(*self.fields)
+
+        if self.is_paginated():
+            cursor = self.request.query_params.get('cursor')
+            if cursor:
+                qs = self.after(qs, *self.decode_cursor(cursor))
+            rows = list(qs[:self.get_limit()])
+            next_cursor = self.encode_cursor(rows[-1]) if rows else cursor
+            return Response({
+                'results': [self.serialize(row) for row in rows],
+                'next_cursor': next_cursor,
+                'has_more': len(rows) == self.get_limit(),
+            }, headers=headers)
+
+        if self.wants_ndjson():
+            response = StreamingHttpResponse(self.stream_ndjson(qs), content_type=self.NDJSON)
+        else:
+            response = StreamingHttpResponse(self.stream_json_list(qs), content_type='application/json')
+        for key, value in headers.items():
+            response[key] = value
+        return response
+
+
+class RecentFirstKeyset:
+    """
+    Newest-first keyset pagination over (created_at, id), for per-user
+    inboxes such as notifications.
+
+    Query params:
+      - `cursor` / `limit`: one page of older rows as
+        {"results": [...], "next_cursor": ..., "latest_cursor": ..., "has_more": ...};
+      - `since`: only rows newer than this cursor (the delta since the last
+        poll), oldest first, so the client can append them in order.
+
+    `latest_cursor` points at the newest row of the page and is what a client
+    passes back as `since`.
+    """
+
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 100
+
+    def __init__(self, request, queryset):
+        self.request = request
+        self.queryset = queryset
+
+    @staticmethod
+    def encode_cursor(obj):
+        raw = f"{obj.created_at.isoformat()}|{obj.pk}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor, param='cursor'):
+        try:
+            created_at, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split('|', 1)
+            return datetime.fromisoformat(created_at), str(uuid.UUID(pk))
+        except (ValueError, UnicodeDecodeError):
+            raise ValidationError({param: 'Invalid cursor.'})
+
+    @staticmethod
+    def older(qs, created_at, pk):
+        return qs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+
+    @staticmethod
+    def newer(qs, created_at, pk):
+        return qs.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk))
+
+    def get_limit(self):
+        try:
+            limit = int(self.request.query_params.get('limit', self.DEFAULT_LIMIT))
+        except (TypeError, ValueError):
+            raise ValidationError({'limit': 'Must be an integer.'})
+        return max(1, min(limit, self.MAX_LIMIT))
+
+    def is_paginated(self):
+        params = self.request.query_params
+        return any(param in params for param in ('cursor', 'limit', 'since'))
+
+    def since(self, since):
+        """Rows newer than the `since` cursor, oldest first."""
+        return list(self.newer(
+            self.queryset, *self.decode_cursor(since, 'since')
+        ).order_by('created_at', 'id')[:self.get_limit()])
+
+    def page(self):
+        """Returns (rows, next_cursor, latest_cursor, has_more)."""
+        params = self.request.query_params
+        since = params.get('since')
+        if since:
+            rows = self.since(since)
+            latest = self.encode_cursor(rows[-1]) if rows else since
+            return rows, None, latest, len(rows) == self.get_limit()
+
+        qs = self.queryset.order_by('-created_at', '-id')
+        cursor = params.get('cursor')
+        if cursor:
+            qs = self.older(qs, *self.decode_cursor(cursor))
+        limit = self.get_limit()
+        rows = list(qs[:limit + 1])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = self.encode_cursor(rows[-1]) if has_more else None
+        latest = self.encode_cursor(rows[0]) if rows and not cursor else None
+        return rows, next_cursor, latest, has_more
@@ -104,7 +104,7 @@ class CampaignSerializer(serializers.ModelSerializer):
             end_date = timezone.datetime.strptime(end_date, '%Y-%m-%d').date() + timedelta(days=1)
 
         data = AdPerformance.objects.filter(
-            ad_placement__ad__campaign=obj,
+            campaign=obj,
             date__gte=start_date,
             date__lt=end_date
         ).aggregate(
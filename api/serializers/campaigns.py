@@ -1,6 +1,6 @@
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
-from core.models import Campaign, Ad, Language, Category, AdPerformance, AdStatus
+from core.models import Campaign, Ad, Language, Category, AdPerformance, AdStatus, AdObjective
 from core.services.matching_engine import CampaignChannelMatcher
 from core.services.ad_placement_engine import AdPlacementEngine
 from core.utils.helper import *
@@ -270,4 +270,28 @@ class PerformanceSerializer(serializers.ModelSerializer):
                   'total_reactions', 'total_replies', 'views', 'forwards', 'ctr', 'cpc', 'cpm', 
                   'conversion_rate', 'engagement_rate', 'soft_ctr', 'viewability_rate', 'virality_rate',
                   'created_at', 'updated_at']
-        read_only_fields = fields
\ No newline at end of file
+        read_only_fields = fields
+
+class CampaignSimulationSerializer(serializers.Serializer):
+    """Targeting parameters for a read-only match preview (nothing is saved)."""
+    objective = serializers.ChoiceField(choices=AdObjective.choices)
+    initial_budget = serializers.DecimalField(max_digits=12, decimal_places=2, min_value=0)
+    cpm = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=0)
+    targeting_languages = serializers.PrimaryKeyRelatedField(
+        many=True, queryset=Language.objects.all(), required=False
+    )
+    targeting_categories = serializers.PrimaryKeyRelatedField(
+        many=True, queryset=Category.objects.all(), required=False
+    )
+    targeting_regions = serializers.JSONField(required=False, default=dict)
+
+    def validate_targeting_regions(self, value):
+        if not isinstance(value, dict) or not isinstance(value.get('countries', []), list):
+            raise ValidationError(_('Expected {"countries": [...]}.'))
+        return value
+
+
+class CampaignBulkActionSerializer(serializers.Serializer):
+    campaign_ids = serializers.ListField(
+        child=serializers.UUIDField(), allow_empty=False, max_length=500
+    )
@@ -1,11 +1,12 @@
 from django.conf import settings
-from django.db.models import Sum, Count, Q, F, DecimalField
+from django.db.models import Sum, Count, Q, F, DecimalField, IntegerField, OuterRef, Prefetch, Subquery
 from decimal import Decimal
 from rest_framework import serializers
 from django.contrib.admin.models import LogEntry
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from core.utils.security import generate_activation_code
+from core.utils.helper import normalize_channel_handle
 from creators.models import (
     CreatorChannel,
 )
@@ -95,20 +96,51 @@ class ChannelSerializer(serializers.ModelSerializer):
     def get_category(self, obj):
         return [cat.name for cat in obj.category.all()]
 
-    def get_stats(self, obj):
-        CREATOR_SHARE_MULTIPLIER = Decimal('1') - (Decimal(settings.PLATFORM_FEE) / Decimal('100'))
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Annotates the per-channel stats and prefetches everything the serializer
+        reads, so a channel list serializes in a constant number of queries.
+        Performance totals are correlated subqueries rather than joins, so they
+        don't multiply with the placement count.
+        """
         performance = AdPerformance.objects.filter(
-            ad_placement__channel=obj
-        ).aggregate(
-            total_impressions=Sum('impressions'),
-            total_earnings=Sum(F('cost') * CREATOR_SHARE_MULTIPLIER, output_field=DecimalField())
+            ad_placement__channel=OuterRef('pk')
+        ).order_by().values('ad_placement__channel')
+        return queryset.annotate(
+            active_ads=Count(
+                'ad_placements',
+                filter=Q(ad_placements__status__in=['running', 'approved']),
+                distinct=True,
+            ),
+            total_impressions=Subquery(
+                performance.annotate(total=Sum('impressions')).values('total'),
+                output_field=IntegerField(),
+            ),
+            total_cost=Subquery(
+                performance.annotate(total=Sum('cost')).values('total'),
+                output_field=DecimalField(max_digits=14, decimal_places=2),
+            ),
+        ).prefetch_related(
+            'language',
+            'category',
+            Prefetch(
+                'ad_placements',
+                queryset=AdPlacement.objects.filter(is_active=True)
+                .select_related('ad', 'channel')
+                .prefetch_related('performance')
+            ),
         )
+
+    def get_stats(self, obj):
+        if not hasattr(obj, 'active_ads'):
+            # Not loaded through setup_eager_loading (single instance)
+            obj = self.setup_eager_loading(CreatorChannel.objects.filter(pk=obj.pk)).get()
+        CREATOR_SHARE_MULTIPLIER = Decimal('1') - (Decimal(settings.PLATFORM_FEE) / Decimal('100'))
         return {
-            'active_ads': obj.ad_placements.filter(
-                status__in=['running', 'approved']
-            ).count(),
-            'total_impressions': performance['total_impressions'] or 0,
-            'total_earnings': round(float(performance['total_earnings'] or 0), 2),
+            'active_ads': obj.active_ads,
+            'total_impressions': obj.total_impressions or 0,
+            'total_earnings': round(float((obj.total_cost or 0) * CREATOR_SHARE_MULTIPLIER), 2),
             'engagement_rate': obj.ml_score
         }
         
@@ -387,6 +419,8 @@ class ChannelCreateSerializer(serializers.ModelSerializer):
     def validate_channel_link(self, value):
         if not value.startswith('https://t.me/') or len(value) < 20:
             raise serializers.ValidationError("Enter a valid Telegram channel link (e.g., https://t.me/yourchannel).")
+        if CreatorChannel.objects.filter(handle=normalize_channel_handle(value)).exists():
+            raise serializers.ValidationError("A channel with this link already exists.")
         return value
 
     def validate_min_cpm(self, value):
@@ -1,3 +1,58 @@
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from creators.models import CreatorChannel
+from users.models import User
+
+
+class ChannelMLScoreBulkUpdateTests(TestCase):
+
+    def setUp(self):
+        self.scraper = User.objects.create(username='scraper', phone_number='+251900000100')
+        owner = User.objects.create(username='creator', phone_number='+251900000101', user_type='creator')
+        self.channels = {
+            name: CreatorChannel.objects.create(
+                owner=owner,
+                channel_link=f"https://t.me/{name}",
+                title=name,
+                subscribers=1000,
+                min_cpm=5,
+                activation_code=f"code-{name}",
+            )
+            for name in ('good_one', 'good_two', 'bad_subs', 'bad_pp')
+        }
+        self.client = APIClient()
+        self.client.force_authenticate(self.scraper)
+
+    def test_bad_items_fail_alone(self):
+        response = self.client.patch(
+            reverse('update-ml-scores'),
+            [
+                {"username": "good_one", "ml_score": 0.8, "subscribers": "2500"},
+                {"username": "bad_subs", "ml_score": 0.5, "subscribers": "many"},
+                {"username": "bad_pp", "ml_score": 0.5, "pp_url": "https://t.me/" + "x" * 300},
+                {"username": "good_two", "ml_score": 0.6, "pp_url": "https://cdn.example.com/p.jpg"},
+                {"username": "missing", "ml_score": 0.1},
+            ],
+            format='json',
+            HTTP_X_DISPATCHED_BY='local-scraper',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            sorted(row['channel_link'] for row in response.data['updated']),
+            ['https://t.me/good_one', 'https://t.me/good_two'],
+        )
+        self.assertEqual(
+            sorted(row['error'] for row in response.data['failed']),
+            ['Invalid pp_url', 'Invalid subscribers', 'Not found'],
+        )
+
+        for channel in self.channels.values():
+            channel.refresh_from_db()
+        self.assertEqual(self.channels['good_one'].ml_score, 0.8)
+        self.assertEqual(self.channels['good_one'].subscribers, 2500)
+        self.assertEqual(self.channels['good_two'].pp_url, "https://cdn.example.com/p.jpg")
+        self.assertEqual(self.channels['bad_subs'].ml_score, 0)
+        self.assertEqual(self.channels['bad_pp'].ml_score, 0)
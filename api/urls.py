@@ -22,10 +22,13 @@ from api.views.creators import (
 )
 from api.views.campaigns import (
     CampaignViewSet,
+    CampaignSimulateAPIView,
+    CampaignBulkActionAPIView,
     CampaignSubmitAPIView,
     CampaignPauseAPIView,
     CampaignResumeAPIView,
     CampaignStopAPIView,
+    CampaignPerformanceStreamView,
     BalanceDepositRequestAPIView,
     BalanceDepositConfirmAPIView,
     BalanceDepositStatusAPIView,
@@ -46,6 +49,7 @@ from api.views.notifications import (
     NotificationMarkReadView,
     NotificationMarkUnreadView,
     NotificationMarkAllReadView,
+    NotificationPollView,
     NotificationUnreadCountView
 )
 
@@ -93,10 +97,13 @@ urlpatterns = [
     
     
     # Advertiser Endpoints (New)
+    path('advertiser/campaigns/simulate/', CampaignSimulateAPIView.as_view(), name='api_campaign_simulate'),
+    path('advertiser/campaigns/bulk/<str:action>/', CampaignBulkActionAPIView.as_view(), name='api_campaign_bulk_action'),
     path('advertiser/campaigns/<uuid:pk>/submit/', CampaignSubmitAPIView.as_view(), name='api_campaign_submit'),
     path('advertiser/campaigns/<uuid:pk>/pause/', CampaignPauseAPIView.as_view(), name='api_campaign_pause'),
     path('advertiser/campaigns/<uuid:pk>/resume/', CampaignResumeAPIView.as_view(), name='api_campaign_resume'),
     path('advertiser/campaigns/<uuid:pk>/stop/', CampaignStopAPIView.as_view(), name='api_campaign_stop'),
+    path('advertiser/campaigns/<uuid:pk>/performance/stream/', CampaignPerformanceStreamView.as_view(), name='api_campaign_performance_stream'),
     path('advertiser/balance/summary/', BalanceSummaryAPIView.as_view(), name='api_balance_summary'),
     path('advertiser/performance/', PerformanceListAPIView.as_view(), name='api_performance'),
     path('advertiser/performance/summary/', PerformanceSummaryAPIView.as_view(), name='api_performance_summary'),
@@ -111,6 +118,7 @@ urlpatterns = [
     path('notifications/<uuid:pk>/mark-unread/', NotificationMarkUnreadView.as_view(), name='notification-mark-unread'),
     path('notifications/mark-all-read/', NotificationMarkAllReadView.as_view(), name='notification-mark-all-read'),
     path('notifications/unread-count/', NotificationUnreadCountView.as_view(), name='notification-unread-count'),
+    path('notifications/poll/', NotificationPollView.as_view(), name='notification-poll'),
     
     
     
@@ -58,7 +58,7 @@ class DashboardAPIView(APIView):
 
     def get_performance_metrics(self, start_date, end_date):
         qs = AdPerformance.objects.filter(
-            ad_placement__ad__campaign__advertiser=self.request.user,
+            advertiser=self.request.user,
             date__gte=start_date,
             date__lte=end_date
         ).aggregate(
@@ -97,7 +97,7 @@ class DashboardAPIView(APIView):
 
     def get_chart_data(self, start_date, end_date):
         qs = AdPerformance.objects.filter(
-            ad_placement__ad__campaign__advertiser=self.request.user,
+            advertiser=self.request.user,
             date__gte=start_date,
             date__lte=end_date
         ).values('date').annotate(
@@ -139,7 +139,7 @@ class DashboardAPIView(APIView):
 
         # Categories
         categories = AdPerformance.objects.filter(
-            ad_placement__ad__campaign__advertiser=request.user,
+            advertiser=request.user,
             date__gte=start_date,
             date__lte=end_date
         ).values('ad_placement__channel__category__name').annotate(
@@ -5,7 +5,11 @@ import re
 import json
 import pandas as pd
 from io import BytesIO
-from django.http import HttpResponse
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views import View
 from datetime import timedelta
 from decimal import Decimal
 from django.conf import settings
@@ -21,14 +25,21 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import viewsets, permissions, status
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import ValidationError, AuthenticationFailed, NotFound
+from rest_framework.authentication import SessionAuthentication, TokenAuthentication
+from rest_framework.request import Request
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 from core.models import Campaign, Ad, AdStatus, AdPerformance
 from core.services.matching_engine import CampaignChannelMatcher
 from core.services.ad_placement_engine import AdPlacementEngine
+from core.services.campaign_simulation import CampaignSimulationService
+from core.services.campaign_lifecycle import CampaignLifecycleService
+from core.services.live_metrics import campaign_topic, get_broker
 from payments.services.payment_service import WalletService, EscrowService
 from payments.services.balance_service import BalanceService
-from api.serializers.campaigns import CampaignSerializer, PerformanceSerializer
+from api.serializers.campaigns import (
+    CampaignSerializer, CampaignSimulationSerializer, CampaignBulkActionSerializer, PerformanceSerializer
+)
 from api.serializers.payments import TransactionSerializer
 from api.permissions.campaigns import IsAdvertiser, IsOwnerOfCampaignOrAd
 
@@ -71,6 +82,31 @@ class CampaignViewSet(viewsets.ModelViewSet):
         return super().partial_update(request, *args, **kwargs)
 
 
+class CampaignSimulateAPIView(APIView):
+    """
+    Dry run of matching for the posted targeting: projected channels, cost and
+    views. Read-only and cached by targeting hash, so nothing is assigned,
+    activated or posted.
+    """
+    permission_classes = [IsAuthenticated, IsAdvertiser]
+
+    def post(self, request):
+        serializer = CampaignSimulationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        simulation = CampaignSimulationService(
+            objective=data['objective'],
+            initial_budget=data['initial_budget'],
+            cpm=data['cpm'],
+            targeting_categories=[category.pk for category in data.get('targeting_categories', [])],
+            targeting_languages=[language.pk for language in data.get('targeting_languages', [])],
+            targeting_regions=data.get('targeting_regions'),
+        )
+        result, cached = simulation.run()
+        return Response({**result, 'cached': cached}, status=status.HTTP_200_OK)
+
+
 class CampaignSubmitAPIView(APIView):
     permission_classes = [IsAuthenticated, IsAdvertiser]
 
@@ -114,45 +150,59 @@ class CampaignSubmitAPIView(APIView):
         except Exception as e:
             return Response({'error': f'Failed to submit campaign: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
-class CampaignPauseAPIView(APIView):
+class CampaignLifecycleAPIView(APIView):
+    """
+    Applies one lifecycle action to a single campaign through
+    CampaignLifecycleService, so placements are parked, restored or
+    taken down exactly as in the bulk endpoint.
+    """
     permission_classes = [IsAuthenticated, IsAdvertiser]
+    lifecycle_action = None
+    done_status = None
 
     def post(self, request, pk):
-        campaign = Campaign.objects.get(pk=pk, advertiser=request.user)
-        if campaign.status != 'active':
-            raise ValidationError(_("Can only pause active campaigns"))
-        campaign.status = 'on_hold'
-        campaign.save()
-        return Response({'status': 'paused'})
-
-class CampaignResumeAPIView(APIView):
+        result = CampaignLifecycleService(self.lifecycle_action, [pk], advertiser=request.user).run()
+        if result['failed']:
+            error = result['failed'][0]['error']
+            if error == 'Campaign not found':
+                raise NotFound(_("Campaign not found"))
+            raise ValidationError(error)
+        return Response({'status': self.done_status})
+
+class CampaignPauseAPIView(CampaignLifecycleAPIView):
+    lifecycle_action = 'pause'
+    done_status = 'paused'
+
+class CampaignResumeAPIView(CampaignLifecycleAPIView):
+    lifecycle_action = 'resume'
+    done_status = 'resumed'
+
+class CampaignStopAPIView(CampaignLifecycleAPIView):
+    lifecycle_action = 'stop'
+    done_status = 'stopped'
+
+class CampaignBulkActionAPIView(APIView):
+    """
+    Pause, resume or stop many of the advertiser's campaigns in one request.
+    Statuses change in a single transaction; Telegram posting/deletion runs
+    afterwards as one batched delivery.
+    """
     permission_classes = [IsAuthenticated, IsAdvertiser]
+    ALLOWED_ACTIONS = ('pause', 'resume', 'stop')
 
-    def post(self, request, pk):
-        campaign = Campaign.objects.get(pk=pk, advertiser=request.user)
-        if campaign.status != 'on_hold':
-            raise ValidationError(_("Can only resume paused campaigns"))
-        campaign.status = 'active'
-        matcher = CampaignChannelMatcher(campaign)
-        ranked = matcher.get_ranked_channels()
-        engine = AdPlacementEngine(campaign, ranked)
-        engine.activate_placements()
-        campaign.save()
-        return Response({'status': 'resumed'})
-
-class CampaignStopAPIView(APIView):
-    permission_classes = [IsAuthenticated, IsAdvertiser]
+    def post(self, request, action):
+        if action not in self.ALLOWED_ACTIONS:
+            return Response({'error': f"Unsupported action '{action}'"}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = CampaignBulkActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        result = CampaignLifecycleService(
+            action, serializer.validated_data['campaign_ids'], advertiser=request.user
+        ).run()
+        response_status = status.HTTP_200_OK if result['updated'] else status.HTTP_400_BAD_REQUEST
+        return Response(result, status=response_status)
 
-    def post(self, request, pk):
-        campaign = Campaign.objects.get(pk=pk, advertiser=request.user)
-        if campaign.status not in ['active', 'on_hold']:
-            raise ValidationError(_("Can only stop active or paused campaigns"))
-        campaign.status = 'stopped'
-        campaign.save()
-        escrows = campaign.escrows.filter(status='pending')
-        for escrow in escrows:
-            EscrowService.cancel(escrow.id)
-        return Response({'status': 'stopped'})
 
 class BalanceDepositRequestAPIView(APIView):
     permission_classes = [IsAuthenticated, IsAdvertiser]
@@ -336,7 +386,7 @@ class PerformanceListAPIView(APIView):
 
     def get_queryset(self):
         qs = AdPerformance.objects.filter(
-            ad_placement__ad__campaign__advertiser=self.request.user
+            advertiser=self.request.user
         ).prefetch_related(
             'ad_placement__ad__campaign',
             'ad_placement__channel__category',
@@ -347,7 +397,7 @@ class PerformanceListAPIView(APIView):
         end_date = self.request.query_params.get('end_date')
         campaign_id = self.request.query_params.get('ad_placement__ad__campaign')
         if campaign_id:
-            qs = qs.filter(ad_placement__ad__campaign_id=campaign_id)
+            qs = qs.filter(campaign_id=campaign_id)
         if start_date:
             qs = qs.filter(date__gte=start_date)
         if end_date:
@@ -377,7 +427,7 @@ class PerformanceSummaryAPIView(APIView):
 
     def get_queryset(self):
         # Base queryset for AdPerformance owned by the current advertiser
-        qs = AdPerformance.objects.filter(ad_placement__ad__campaign__advertiser=self.request.user) \
+        qs = AdPerformance.objects.filter(advertiser=self.request.user) \
             .prefetch_related(
                 'ad_placement__ad__campaign', 
                 'ad_placement__channel__category',
@@ -598,11 +648,94 @@ class PerformanceSummaryAPIView(APIView):
             return Response(result)
 
 
+class CampaignPerformanceStreamView(View):
+    """
+    Server-sent events stream of a campaign's performance, for live
+    dashboards. Sends one `snapshot` event with the campaign totals, then a
+    `tick` event with the metric deltas every time PerformanceLoggingEngine
+    logs one of its placements, and a comment every HEARTBEAT seconds to keep
+    proxies from closing the connection. Authenticates like the rest of the
+    API (session or token).
+
+    Streaming needs the ASGI app (config/asgi.py), e.g. gunicorn with
+    `-k uvicorn.workers.UvicornWorker`; under WSGI Django would buffer the
+    endless stream, so a WSGI request gets the snapshot alone with a `retry`
+    hint and EventSource clients fall back to polling every WSGI_RETRY_MS.
+    Ticks only reach this process if LIVE_METRICS_BROKER can see where they
+    are published: InProcessBroker only works when the performance logger
+    runs in the same ASGI process, otherwise use PostgresNotifyBroker.
+    """
+
+    HEARTBEAT = 15
+    WSGI_RETRY_MS = 30000
+
+    @staticmethod
+    def authenticate(request):
+        drf_request = Request(request, authenticators=[SessionAuthentication(), TokenAuthentication()])
+        try:
+            user = drf_request.user
+        except AuthenticationFailed:
+            return None
+        if not user.is_authenticated or not IsAdvertiser().has_permission(drf_request, None):
+            return None
+        return user
+
+    @staticmethod
+    def snapshot(campaign):
+        totals = AdPerformance.objects.filter(campaign=campaign).aggregate(
+            impressions=Coalesce(Sum('impressions'), 0),
+            clicks=Coalesce(Sum('clicks'), 0),
+            conversions=Coalesce(Sum('conversions'), 0),
+            views=Coalesce(Sum('views'), 0),
+            cost=Coalesce(Sum('cost'), Value(Decimal('0.00'))),
+        )
+        return {'campaign_id': str(campaign.id), 'status': campaign.status, 'total_spent': campaign.total_spent, **totals}
+
+    @staticmethod
+    def format_event(name, data):
+        return f"event: {name}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
+    async def get(self, request, pk):
+        user = await sync_to_async(self.authenticate)(request)
+        if user is None:
+            return JsonResponse({'detail': IsAdvertiser.message}, status=status.HTTP_403_FORBIDDEN)
+        campaign = await Campaign.objects.filter(pk=pk, advertiser=user).afirst()
+        if campaign is None:
+            return JsonResponse({'detail': 'Campaign not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        if not isinstance(request, ASGIRequest):
+            snapshot = await sync_to_async(self.snapshot)(campaign)
+            response = HttpResponse(
+                f"retry: {self.WSGI_RETRY_MS}\n" + self.format_event('snapshot', snapshot),
+                content_type='text/event-stream',
+            )
+            response['Cache-Control'] = 'no-cache'
+            return response
+
+        broker = get_broker()
+
+        async def events():
+            # Subscribe before reading the snapshot so no tick falls in between
+            subscription = broker.subscribe(campaign_topic(campaign.id))
+            try:
+                yield self.format_event('snapshot', await sync_to_async(self.snapshot)(campaign))
+                while True:
+                    event = await subscription.get(timeout=self.HEARTBEAT)
+                    yield ': keep-alive\n\n' if event is None else self.format_event('tick', event)
+            finally:
+                broker.unsubscribe(subscription)
+
+        response = StreamingHttpResponse(events(), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+
 class PerformanceExportAPIView(APIView):
     permission_classes = [IsAuthenticated, IsAdvertiser]
 
     def get_queryset(self):
-        qs = AdPerformance.objects.filter(ad_placement__ad__campaign__advertiser=self.request.user) \
+        qs = AdPerformance.objects.filter(advertiser=self.request.user) \
             .prefetch_related('ad_placement__ad__campaign', 'ad_placement__channel__category') \
             .prefetch_related('ad_placement__ad', 'ad_placement__channel')
         start_date = self.request.query_params.get('start_date')
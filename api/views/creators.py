@@ -1,8 +1,8 @@
+import logging
 from django.conf import settings
 from django.contrib.admin.models import LogEntry, ADDITION, CHANGE, DELETION
 from rest_framework.views import APIView
 from django.http import JsonResponse
-from collections import defaultdict
 from django.shortcuts import get_object_or_404
 from django.contrib.contenttypes.models import ContentType
 
@@ -17,7 +17,6 @@ from django.db.models import (
     Q, F, 
     Prefetch, 
     DecimalField, 
-    ExpressionWrapper,
     )
 from django.utils import timezone
 from datetime import datetime, timedelta
@@ -25,6 +24,10 @@ from django.db.models.functions import ExtractWeek, ExtractYear
 from decimal import Decimal, InvalidOperation
 
 from core.utils.security import decrypt_activation_code
+from core.services.ml_score_ingestion import ChannelScoreIngestionService
+from core.services.creator_dashboard import CreatorDashboardCache
+from core.services.earnings_series import EarningsSeriesService
+from core.services.notification_service import NotificationService
 from miniapp.utils import TelegramVerificationUtil
 from payments.services import WithdrawalService, BalanceService
 from payments.utils import get_creator_share
@@ -55,7 +58,6 @@ from api.serializers.creators import (
     ChannelSerializer,
     ChannelUpdateSerializer,
     AdPlacementSerializer,
-    DashboardSerializer,
     CategorySerializer,
     LanguageSerializer,
     ChannelCreateSerializer,
@@ -65,8 +67,11 @@ from api.serializers.creators import (
     WithdrawalRequestSerializer,
 )
 from api.serializers.payments import TransactionSerializer
+from api.pagination import KeysetFeed
 from api.serializers.notifications import NotificationSerializer
 
+logger = logging.getLogger(__name__)
+
 
 class IsCreatorUser(permissions.BasePermission):
     def has_permission(self, request, view):
@@ -75,22 +80,33 @@ class IsCreatorUser(permissions.BasePermission):
 
 
 class DashboardAPIView(APIView):
+    """
+    Creator dashboard, assembled from per-user cached fragments
+    (see CreatorDashboardCache) that are invalidated by the signals touching them.
+    """
     permission_classes = [IsCreatorUser, permissions.IsAuthenticated]
 
     def get(self, request):
-            
         user = request.user
         now = timezone.now()
-        first_day_of_month = now.replace(day=1).date()
-        next_month = (now.replace(day=28) + timedelta(days=4)).replace(day=1).date()
-        last_day_of_month = next_month - timedelta(days=1)
+        fragments = CreatorDashboardCache(user.id)
+
+        data = {}
+        data.update(fragments.get('placements', 'api', lambda: self.placements_fragment(user, now)))
+        data.update(fragments.get('earnings', f"api:{now:%Y-%m}", lambda: self.earnings_fragment(user, now)))
+        data.update(fragments.get('balance', 'api', lambda: self.balance_fragment(user)))
+        data.update(fragments.get('notifications', 'api', lambda: self.notifications_fragment(user)))
+        data.update(fragments.get('activity', 'api', lambda: self.activity_fragment(user)))
+        return Response(data)
+
+    def placements_fragment(self, user, now):
         time_threshold = now - timedelta(weeks=4)
 
         # 1. Top channels by subscribers
-        top_channels = CreatorChannel.objects.filter(
+        top_channels = ChannelSerializer.setup_eager_loading(CreatorChannel.objects.filter(
             owner=user,
             is_active=True
-        ).order_by('-subscribers')[:1]
+        )).order_by('-subscribers')[:1]
 
         # 2. Active ad placements with recent performance
         active_ad_placements = AdPlacement.objects.filter(
@@ -104,87 +120,49 @@ class DashboardAPIView(APIView):
             )
         )[:5]
 
+        return {
+            'top_channels': ChannelSerializer(top_channels, many=True).data,
+            'active_ad_placements': AdPlacementSerializer(active_ad_placements, many=True).data,
+        }
 
-        CREATOR_SHARE_MULTIPLIER = Decimal('1') - (Decimal(settings.PLATFORM_FEE) / Decimal('100'))
-        monthly_data = (
-            AdPerformance.objects.filter(
-                ad_placement__channel__owner=user,
-                date__range=(first_day_of_month, last_day_of_month)
-            )
-            .annotate(
-                creator_earning=ExpressionWrapper(
-                    F('cost') * CREATOR_SHARE_MULTIPLIER,
-                    output_field=DecimalField(max_digits=12, decimal_places=2)
-                )
-            )
-            .values('date', 'creator_earning')
-        )
-
-        weekly_totals = defaultdict(Decimal)
-
-        for item in monthly_data:
-            date = item['date']
-            earning = item['creator_earning']
-            
-
-            week_of_month = ((date.day - 1) // 7) + 1
-            weekly_totals[week_of_month] += earning
-
-
-        chart_data = []
-        week_labels = []
-        week_ranges = []
-
-        for week_num in range(1, 5):
-            chart_data.append(round(float(weekly_totals.get(week_num, 0)), 2))
-            week_labels.append(f"W{week_num}")
-
-            start_day = (week_num - 1) * 7 + 1
-            end_day = min(start_day + 6, last_day_of_month.day)
-            week_ranges.append(f"{start_day}–{end_day}")
+    def earnings_fragment(self, user, now):
+        return EarningsSeriesService.month_weeks_chart(user, timezone.localdate(now))
 
+    def balance_fragment(self, user):
         balance_info = BalanceService.get_balance_summary(user, role='creator')
-
-   
         payment_methods = UserPaymentMethod.objects.filter(user=user, is_active=True)
+        return {
+            'earning': {
+                'balance': balance_info['available'],
+                'locked': balance_info['escrow'],
+                'pending_balance': balance_info['escrow'],
+            },
+            'payment_methods': UserPaymentMethodSerializer(payment_methods, many=True).data,
+        }
 
- 
-        recent_transactions = Transaction.objects.filter(user=user, sub_balance='available').order_by('-timestamp')[:6]
-
-        
-        activity_logs = LogEntry.objects.filter(user_id=user.id).order_by('-action_time')[:6]
-        
+    def notifications_fragment(self, user):
         notifications = Notification.active_objects.filter(
             user=user,
             is_read=False,
             is_active=True
         ).order_by('-created_at')
-        
-        # notifications.update(is_read=True) 
-        
-        
-
-        # Prepare and serialize data
-        context = {
-            'top_channels': top_channels,
-            'active_ad_placements': active_ad_placements,
-            'earning': {
-                'balance': balance_info['available'],
-                'locked': balance_info['escrow'],
-                'pending_balance': balance_info['escrow'],
-            },
-            'payment_methods': payment_methods,
-            'recent_transactions': recent_transactions,
-            'chart_data': chart_data,
-            'week_labels': week_labels,
-            'week_ranges': week_ranges,
-            'activity_logs': activity_logs,
+        return {
             'notifications': NotificationSerializer(notifications, many=True).data,
-            'unread_count': Notification.active_objects.filter(user=user, is_read=False).count(),
+            'unread_count': NotificationService.unread_count(user),
         }
 
-        serializer = DashboardSerializer(context)
-        return Response(serializer.data)
+    def activity_fragment(self, user):
+        activity_logs = LogEntry.objects.filter(user_id=user.id).order_by('-action_time')[:6]
+        return {
+            'activity_logs': [
+                {
+                    'change_message': log.change_message,
+                    'action_flag_display': log.get_action_flag_display(),
+                    'timestamp': log.action_time.strftime('%Y-%m-%d %H:%M:%S')
+                }
+                for log in activity_logs
+            ],
+        }
     
   
 
@@ -193,16 +171,8 @@ class ChannelsAPIView(APIView):
 
     def get(self, request):
         user = request.user
-        channels = CreatorChannel.objects.filter(
-            owner=user,
-            is_active=True
-        ).prefetch_related(
-            'language',
-            'category',
-            Prefetch(
-                'ad_placements',
-                queryset=AdPlacement.objects.filter(is_active=True)
-            )
+        channels = ChannelSerializer.setup_eager_loading(
+            CreatorChannel.objects.filter(owner=user, is_active=True)
         )
 
         serializer = ChannelSerializer(channels, many=True)
@@ -218,7 +188,9 @@ class ChannelDetailAPIView(APIView):
             return None
 
     def get(self, request, id):
-        channel = self.get_object(id=id, user=request.user)
+        channel = ChannelSerializer.setup_eager_loading(
+            CreatorChannel.objects.filter(id=id, owner=request.user, is_active=True)
+        ).first()
         if not channel:
             return Response({'error': 'Channel not found'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -1139,27 +1111,19 @@ class VerifiedChannelListAPIView(APIView):
         if not is_request_trusted(request):
             return Response({"error": "Unauthorized"}, status=status.HTTP_403_FORBIDDEN)
 
-        channels = CreatorChannel.objects.filter(status=CreatorChannel.ChannelStatus.VERIFIED).select_related('owner__telegram_profile')
-        data = []
-
-        for channel in channels:
-            username = channel.channel_link.replace("https://t.me/", "").strip("/")
-            
-            try:
-                tg_id = channel.owner.telegram_profile.tg_id
-            except Exception as e:
-                print(e)
-                tg_id = None 
-
-            data.append({
-                "id": str(channel.id),
-                "username": username,
-                "owner": tg_id,
-                "subscribers": channel.subscribers,
-                "last_score_updated": channel.last_score_updated
-            })
-
-        return Response(data)
+        return KeysetFeed(
+            request,
+            CreatorChannel.objects.all(),
+            fields=['channel_link', 'owner__telegram_profile__tg_id', 'subscribers', 'last_score_updated'],
+            serialize=lambda row: {
+                "id": str(row['id']),
+                "username": row['channel_link'].replace("https://t.me/", "").strip("/"),
+                "owner": row['owner__telegram_profile__tg_id'],
+                "subscribers": row['subscribers'],
+                "last_score_updated": row['last_score_updated'],
+            },
+            active=Q(status=CreatorChannel.ChannelStatus.VERIFIED),
+        ).response()
 
 
 # class ChannelMLScoreBulkUpdateAPIView(APIView):
@@ -1274,166 +1238,10 @@ class ChannelMLScoreBulkUpdateAPIView(APIView):
         if not isinstance(updates, list):
             return Response({"error": "Expected a list of channel updates"}, status=status.HTTP_400_BAD_REQUEST)
 
-        updated = []
-        failed = []
-
-        for item in updates:
-            # 2. Extract Data from Payload
-            username = item.get("username")
-            ml_score = item.get("ml_score")
-            pp_url = item.get("pp_url")
-            subscribers = item.get("subscribers")
-            
-            avg_views_per_post = item.get("avg_views_per_post")
-            engagement_rate = item.get("engagement_rate")
-            top_views_post = item.get("top_views_post")
-
-            if not username or ml_score is None:
-                failed.append({"entry": item, "error": "Missing username or ml_score"})
-                continue
-
-            channel_link = f"https://t.me/{username}"
-
-            try:
-        
-                channel = CreatorChannel.objects.get(channel_link__iexact=channel_link)
-                previous_score = channel.ml_score or 0
-                
-                channel.ml_score = ml_score
-                channel.last_score_updated = timezone.now()
-
-                update_fields = ['ml_score', 'last_score_updated']
-                if pp_url:
-                    channel.pp_url = pp_url
-                    update_fields.append('pp_url')
-                if subscribers is not None:
-                    channel.subscribers = subscribers
-                    update_fields.append('subscribers')
-
-                channel.save(update_fields=update_fields)
-
-                
-                reputation, created = CreatorReputation.objects.get_or_create(
-                    creator_channel=channel
-                )
-                
-                estimated_cost_min = Decimal('0.00')
-                estimated_cost_max = Decimal('0.00')
-                
-                try:
-                    FIXED_CPM = channel.min_cpm if channel.min_cpm is not None else Decimal('0.0')
-                    if not isinstance(FIXED_CPM, Decimal):
-                        FIXED_CPM = Decimal(str(FIXED_CPM))
-                except InvalidOperation:
-                    FIXED_CPM = Decimal('0.0')
-
-            
-                if FIXED_CPM > Decimal('0.00'):
-                    
-                    min_views = int(avg_views_per_post or 0)
-                    max_views = int(top_views_post or 0)
-                    
-                    # Cost = (Views / 1000) * CPM
-                    views_ratio_min = Decimal(min_views) / Decimal(1000)
-                    estimated_cost_min = views_ratio_min * FIXED_CPM
-                    
-                    views_ratio_max = Decimal(max_views) / Decimal(1000)
-                    estimated_cost_max = views_ratio_max * FIXED_CPM
-
-                
-                if engagement_rate is not None:
-                    try:
-                        reputation.avg_engagement_rate = round(float(engagement_rate), 2)
-                    except (TypeError, ValueError):
-                        reputation.avg_engagement_rate = 0.0 
-                
-                reputation.estimated_views_avg = int(avg_views_per_post or 0)
-                reputation.estimated_views_max = int(top_views_post or 0)
-                
-                # Assign and quantize Decimal values
-                reputation.estimated_cost_min = estimated_cost_min.quantize(Decimal('0.01'))
-                reputation.estimated_cost_max = estimated_cost_max.quantize(Decimal('0.01'))
-                reputation.last_reviewed = timezone.now()
-                
-                reputation.save(
-                    update_fields=[
-                        'avg_engagement_rate', 
-                        'estimated_views_avg', 
-                        'estimated_views_max',
-                        'estimated_cost_min',
-                        'estimated_cost_max',
-                        'last_reviewed',
-                        'updated_at',
-                    ]
-                )
-                
-                if channel.owner:
-                    title = "Channel Performance Updated"
-                    diff = round(ml_score - previous_score, 2)
-
-                    is_active_notification = True
-                    
-                    if previous_score is None or previous_score == 0:
-                        trend = "for the first time"
-                        tone = "Your channel just received its first performance score."
-                        is_active_notification = True
-                    elif diff > 0.2:
-                        trend = "increased ↗"
-                        tone = "Great! Your channel's performance is improving."
-                    elif diff < -0.2:
-                        trend = "decreased ↘"
-                        tone = "Heads up! Your channel's performance has dropped."
-                    else:
-                        trend = "remained the same"
-                        tone = "Your performance score hasn't changed."
-                        is_active_notification = False
-                        
-                    message = (
-                        # Improved initial flow
-                        f"Your channel \"{channel.title}\" has a new performance analysis, resulting in a score update.\n"
-                        
-                        # Existing score summary
-                        f"Score {trend} from {previous_score:.2f} to {ml_score:.2f}. {tone}\n\n"
-                        
-                        f"💰 Estimated Value Per Single Ad: ETB{reputation.estimated_cost_min:.2f} - ETB{reputation.estimated_cost_max:.2f}\n"
-                        f"This is the estimated value for just one ad post per uv. **The more high-quality ads you run with us, the higher your total revenue potential!** Keep delivering great content to maximize your earnings on our platform."
-                    )
-                    
-                    # message = (
-                    #     # Achievement & Partnership Focus
-                    #     f"🌟 **Performance Review Ready!** Your channel, \"{channel.title}\", has received an updated performance analysis on our platform.\n"
-                        
-                    #     # Feedback & Encouragement (Keep the score update but wrap it in positive language)
-                    #     f"Your Channel Quality Score has {trend} from **{previous_score:.2f} to {ml_score:.2f}**! {tone}\n"
-                        
-                    #     # Value & Potential (Clear Earning Potential)
-                    #     f"This improved performance significantly raises your value to our advertisers. Here is your current earning potential:\n"
-                        
-                    #     f"💰 **Estimated Value Per Single Ad Slot:** ETB{reputation.estimated_cost_min:.2f} - ETB{reputation.estimated_cost_max:.2f}\n\n"
-                        
-                    #     # Call to Action & Shared Goal
-                    #     f"This is the estimated value for just one post. **The more high-quality ads you run with us, the higher your total revenue potential!** Keep delivering great content to maximize your earnings on our platform."
-                    # )
-                    Notification.objects.create(
-                        user=channel.owner, 
-                        title=title,
-                        message=message,
-                        type='Analytics Update',
-                        is_active=is_active_notification
-                    )
-
-                updated.append({
-                    "channel_link": channel_link,
-                    "ml_score": ml_score,
-                    "pp_url": pp_url,
-                    "subscribers": subscribers
-                })
-                
-            except CreatorChannel.DoesNotExist:
-                failed.append({"channel_link": channel_link, "error": "Not found"})
-               
-            except Exception as e:
-                failed.append({"channel_link": channel_link, "error": f"Internal error: {str(e)}"})
-         
+        try:
+            updated, failed = ChannelScoreIngestionService(updates).run()
+        except Exception as e:
+            logger.error(f"* ML score ingestion failed: {str(e)}")
+            return Response({"error": f"Internal error: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        return Response({"updated": updated, "failed": failed})
\ No newline at end of file
+        return Response({"updated": updated, "failed": failed})
@@ -1,3 +1,5 @@
+import time
+
 from rest_framework.views import APIView
 from rest_framework.generics import GenericAPIView
 from rest_framework import permissions, status
@@ -5,7 +7,9 @@ from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
 from core.models import Notification
+from core.services.notification_service import NotificationService
 from api.serializers.notifications import NotificationSerializer
+from api.pagination import RecentFirstKeyset
 from django.contrib.auth import get_user_model
 from rest_framework.exceptions import ValidationError, PermissionDenied
 from django.http import Http404
@@ -26,6 +30,17 @@ class NotificationListCreateView(GenericAPIView):
         return self.queryset.filter(user=self.request.user, is_active=True)
 
     def get(self, request, *args, **kwargs):
+        keyset = RecentFirstKeyset(request, DjangoFilterBackend().filter_queryset(request, self.get_queryset(), self))
+        if keyset.is_paginated():
+            rows, next_cursor, latest_cursor, has_more = keyset.page()
+            return Response({
+                'results': self.get_serializer(rows, many=True).data,
+                'next_cursor': next_cursor,
+                'latest_cursor': latest_cursor,
+                'has_more': has_more,
+            }, status=status.HTTP_200_OK)
+
+        # Unpaginated list for clients that don't send a cursor yet
         queryset = self.filter_queryset(self.get_queryset())
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -92,8 +107,7 @@ class NotificationMarkReadView(APIView):
             notification = Notification.objects.get(pk=pk, user=request.user, is_active=True)
         except Notification.DoesNotExist:
             raise Http404
-        notification.is_read = True
-        notification.save()
+        NotificationService.set_read(notification, True)
         return Response({'status': 'notification marked as read'}, status=status.HTTP_200_OK)
 
 class NotificationMarkUnreadView(APIView):
@@ -104,23 +118,74 @@ class NotificationMarkUnreadView(APIView):
             notification = Notification.objects.get(pk=pk, user=request.user, is_active=True)
         except Notification.DoesNotExist:
             raise Http404
-        notification.is_read = False
-        notification.save()
+        NotificationService.set_read(notification, False)
         return Response({'status': 'notification marked as unread'}, status=status.HTTP_200_OK)
 
 class NotificationMarkAllReadView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def patch(self, request, *args, **kwargs):
-        updated = Notification.objects.filter(user=request.user, is_active=True, is_read=False).update(is_read=True)
+        updated = NotificationService.mark_all_read(request.user)
         return Response(
             {'status': f'{updated} notifications marked as read'},
             status=status.HTTP_200_OK
         )
 
+class NotificationPollView(APIView):
+    """
+    Long-poll for new notifications: holds the request for up to `timeout`
+    seconds (max MAX_TIMEOUT) until notifications newer than the `since`
+    cursor exist, then returns them oldest first with the new `latest_cursor`.
+    Without `since` it returns the current latest cursor immediately.
+
+    Each open poll holds a worker (or thread) for its whole duration, so
+    MAX_TIMEOUT stays well under gunicorn's default 30s worker timeout. Serve
+    it from threaded (`--worker-class gthread --threads N`) or async workers
+    sized for the number of open Mini Apps; with plain sync workers a few
+    clients can occupy every worker.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    DEFAULT_TIMEOUT = 10
+    MAX_TIMEOUT = 15
+    POLL_INTERVAL = 2.0
+
+    def get_timeout(self, request):
+        try:
+            timeout = float(request.query_params.get('timeout', self.DEFAULT_TIMEOUT))
+        except (TypeError, ValueError):
+            raise ValidationError({'timeout': 'Must be a number of seconds.'})
+        return max(0, min(timeout, self.MAX_TIMEOUT))
+
+    def get(self, request, *args, **kwargs):
+        queryset = Notification.objects.filter(user=request.user, is_active=True)
+        keyset = RecentFirstKeyset(request, queryset)
+        since = request.query_params.get('since')
+        if not since:
+            latest = queryset.order_by('-created_at', '-id').first()
+            return Response({
+                'results': [],
+                'latest_cursor': keyset.encode_cursor(latest) if latest else None,
+                'timed_out': False,
+            }, status=status.HTTP_200_OK)
+
+        deadline = time.monotonic() + self.get_timeout(request)
+        while True:
+            rows = keyset.since(since)
+            if rows or time.monotonic() >= deadline:
+                break
+            time.sleep(self.POLL_INTERVAL)
+
+        return Response({
+            'results': NotificationSerializer(rows, many=True).data,
+            'latest_cursor': keyset.encode_cursor(rows[-1]) if rows else since,
+            'timed_out': not rows,
+        }, status=status.HTTP_200_OK)
+
+
 class NotificationUnreadCountView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, *args, **kwargs):
-        unread_count = Notification.objects.filter(user=request.user, is_read=False, is_active=True).count()
+        unread_count = NotificationService.unread_count(request.user)
         return Response({'unread_count': unread_count}, status=status.HTTP_200_OK)
\ No newline at end of file
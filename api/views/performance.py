@@ -1,4 +1,5 @@
 from django.conf import settings
+from django.db.models import Q
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
@@ -6,6 +7,7 @@ from rest_framework.response import Response
 from core.models import AdPlacement
 from decimal import Decimal
 from core.services.ad_performance_engine import PerformanceLoggingEngine
+from api.pagination import KeysetFeed
 
 TRUSTED_DISPATCHER_HEADER = "X-Dispatched-By"
 TRUSTED_DISPATCHER_VALUE = "local-scraper" 
@@ -23,23 +25,22 @@ class ActiveAdPlacementsView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        placements = AdPlacement.objects.filter(
-            is_active=True,
-            status__in=["approved", "running", "completed"],
-            content_platform_id__isnull=False
-        )
-
-        data = []
-        for p in placements:
-            data.append({
-                "id": str(p.id),
-                "content_platform_id": p.content_platform_id,
-                "ad_headline": p.ad.headline,
-                "channel_username": p.channel.channel_link.strip('@'),
-            })
-            
-
-        return Response(data, status=status.HTTP_200_OK)
+        return KeysetFeed(
+            request,
+            AdPlacement.objects.all(),
+            fields=['content_platform_id', 'ad__headline', 'channel__channel_link'],
+            serialize=lambda row: {
+                "id": str(row['id']),
+                "content_platform_id": row['content_platform_id'],
+                "ad_headline": row['ad__headline'],
+                "channel_username": row['channel__channel_link'].strip('@'),
+            },
+            active=Q(
+                is_active=True,
+                status__in=["approved", "running", "completed"],
+                content_platform_id__isnull=False
+            ),
+        ).response()
 
 
 class RecordAdPerformanceView(APIView):
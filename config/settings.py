@@ -236,6 +236,17 @@ MINIAPP = os.getenv('MINIAPP', 'miniapp')
 INTERNAL_VERIFY_API_URL = os.getenv('INTERNAL_VERIFY_API_URL')
 TELEGRAM_SECRET_TOKEN = os.getenv('TELEGRAM_SECRET_TOKEN', '')
 PLATFORM_FEE = os.getenv('PLATFORM_FEE', 15)
+
+# Pub/sub behind the live campaign performance stream, which is served by the
+# ASGI app (config/asgi.py, e.g. gunicorn -k uvicorn.workers.UvicornWorker).
+# InProcessBroker only delivers ticks logged in the same process; use
+# core.services.live_metrics.PostgresNotifyBroker when running several processes
+LIVE_METRICS_BROKER = os.getenv('LIVE_METRICS_BROKER', 'core.services.live_metrics.InProcessBroker')
+
+# Optional (start_hour, end_hour) window in each channel's local time with no
+# scheduled reposts, e.g. (22, 8); None reposts around the clock
+REPOST_QUIET_HOURS = None
+
 CHAPA_SECRET_KEY = os.getenv('CHAPA_SECRET_KEY', 'csecret')
 
 
@@ -1,90 +1,180 @@
 import asyncio
 import logging
+import os
+import threading
+from email.utils import parseaddr
+
 import httpx
 from django.core.mail.backends.base import BaseEmailBackend
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+
+class BrevoTransport:
+    """
+    One long-lived, pooled httpx.AsyncClient per process, driven by its own
+    event-loop thread, so every send reuses warm connections instead of
+    opening a client (and an event loop) per call. Requests are capped at
+    MAX_CONCURRENCY in flight; 429 and 5xx responses are retried with
+    exponential backoff, honouring Retry-After.
+    """
+
+    URL = "https://api.brevo.com/v3/smtp/email"
+    MAX_CONNECTIONS = 10
+    MAX_CONCURRENCY = 10
+    MAX_RETRIES = 3
+    BACKOFF = 1.0  # seconds, doubled per retry
+    TIMEOUT = 10.0
+
+    _instance = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls):
+        with cls._lock:
+            # A forked worker can't use its parent's loop thread
+            if cls._instance is None or cls._instance.pid != os.getpid():
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, name='brevo-email', daemon=True).start()
+        self.client = None
+        self.semaphore = None
+        self.run(self.setup())
+
+    async def setup(self):
+        self.client = httpx.AsyncClient(
+            timeout=self.TIMEOUT,
+            limits=httpx.Limits(max_connections=self.MAX_CONNECTIONS, max_keepalive_connections=self.MAX_CONNECTIONS),
+            headers={
+                "Content-Type": "application/json",
+                "api-key": settings.SENDINBLUE_API_KEY,
+            },
+        )
+        self.semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+    def run(self, coro):
+        """Runs `coro` on the transport loop and waits for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def retry_delay(self, attempt, response=None):
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return self.BACKOFF * (2 ** attempt)
+
+    async def post(self, payload):
+        async with self.semaphore:
+            for attempt in range(self.MAX_RETRIES + 1):
+                response = None
+                try:
+                    response = await self.client.post(self.URL, json=payload)
+                except httpx.TransportError as e:
+                    error = str(e)
+                else:
+                    if response.status_code in (200, 201, 202):
+                        return True
+                    error = f"{response.status_code}: {response.text}"
+                    if response.status_code != 429 and response.status_code < 500:
+                        break
+
+                if attempt < self.MAX_RETRIES:
+                    await asyncio.sleep(self.retry_delay(attempt, response))
+
+        logger.error(f": Failed to send email via Brevo API: {error}")
+        return False
+
+    async def post_all(self, payloads):
+        return await asyncio.gather(*(self.post(payload) for payload in payloads))
+
+
 class BrevoEmailBackend(BaseEmailBackend):
-    def send_messages(self, email_messages):
-        success = False
-        loop = asyncio.new_event_loop() 
-        asyncio.set_event_loop(loop) 
-        tasks = [self._send_email(message) for message in email_messages]
+    """
+    Sends Django email messages through Brevo's transactional API.
 
-        try:
-            
-            success = loop.run_until_complete(asyncio.gather(*tasks))
-        except Exception as e:
-            logger.error(f"Error running async tasks for emails: {str(e)}")
-        finally:
-            loop.close()  
+    Messages with the same subject and body are sent as one request using
+    Brevo's `messageVersions` (up to BATCH_SIZE recipients' versions per
+    request); the rest go out one request each, concurrently, over the shared
+    BrevoTransport. Returns the number of messages accepted by Brevo.
+    """
 
-        return success
+    BATCH_SIZE = 1000  # Brevo's messageVersions limit
 
-    async def _send_email(self, message):
-        to_email = message.to[0]
-        subject = message.subject
-        text_content = message.body 
+    @staticmethod
+    def recipients(addresses):
+        recipients = []
+        for address in addresses:
+            name, email = parseaddr(address)
+            recipients.append({"email": email, "name": name or email})
+        return recipients
+
+    @staticmethod
+    def content(message):
         html_content = None
-        if message.alternatives:
-            for content, mimetype in message.alternatives:
-                if mimetype == 'text/html':
-                    html_content = content
-                    break
-
-        if not html_content:
-            html_content = message.body 
-
-        to_name = message.to[0]
-
-        success = await self.send_confirmation_email(
-            to_email=to_email,
-            subject=subject,
-            html_content=html_content,
-            text_content=text_content, 
-            to_name=to_name,
-        )
+        for content, mimetype in getattr(message, 'alternatives', None) or []:
+            if mimetype == 'text/html':
+                html_content = content
+                break
+        if message.content_subtype == 'html':
+            html_content = message.body
+        return message.subject, html_content or message.body, message.body
 
-        if not success:
-            logger.error(f"Failed to send confirmation email to {to_email}")
-
-    async def send_confirmation_email(
-        self, to_email: str, subject: str, html_content: str, text_content: str = None, to_name: str = "User"
-    ) -> bool:
-        url = "https://api.brevo.com/v3/smtp/email"
-        headers = {
-            "Content-Type": "application/json",
-            "api-key": settings.SENDINBLUE_API_KEY,
-        }
-
-        payload = {
-            "sender": {
-                "name": settings.FROM_NAME,
-                "email": settings.FROM_EMAIL
-            },
-            "to": [{
-                "email": to_email,
-                "name": to_name,
-            }],
-            "subject": subject,
-            "htmlContent": html_content,
-        }
+    def envelope(self, message):
+        envelope = {"to": self.recipients(message.to)}
+        if message.cc:
+            envelope["cc"] = self.recipients(message.cc)
+        if message.bcc:
+            envelope["bcc"] = self.recipients(message.bcc)
+        return envelope
+
+    def build_payloads(self, email_messages):
+        """Returns [(payload, number of messages it carries)]."""
+        groups = {}
+        for message in email_messages:
+            if not message.to:
+                continue
+            groups.setdefault(self.content(message), []).append(message)
 
-        if text_content:
-            payload["textContent"] = text_content
+        payloads = []
+        for (subject, html_content, text_content), messages in groups.items():
+            base = {
+                "sender": {
+                    "name": settings.FROM_NAME,
+                    "email": settings.FROM_EMAIL
+                },
+                "subject": subject,
+                "htmlContent": html_content,
+            }
+            if text_content:
+                base["textContent"] = text_content
+
+            if len(messages) == 1:
+                payloads.append(({**base, **self.envelope(messages[0])}, 1))
+                continue
+            for start in range(0, len(messages), self.BATCH_SIZE):
+                chunk = messages[start:start + self.BATCH_SIZE]
+                payloads.append(({**base, "messageVersions": [self.envelope(m) for m in chunk]}, len(chunk)))
+        return payloads
+
+    def send_messages(self, email_messages):
+        if not email_messages:
+            return 0
+        payloads = self.build_payloads(email_messages)
+        if not payloads:
+            return 0
 
         try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(url, json=payload, headers=headers, timeout=10.0)
-                resp.raise_for_status() 
-                if resp.status_code in (200, 201, 202):
-                    return True
-                else:
-                    logger.error(f"Failed to send email via Brevo API: {resp} : {resp.text}")
-                    print(f"Failed to send email via Brevo API: {resp} : {resp.text}")
-                    return False
+            transport = BrevoTransport.get()
+            results = transport.run(transport.post_all([payload for payload, _ in payloads]))
         except Exception as e:
-            logger.error(f"Error sending email via Brevo API: {str(e)}")
-            return False
+            logger.error(f": Error sending emails via Brevo API: {str(e)}")
+            return 0
+
+        sent = sum(count for (_, count), ok in zip(payloads, results) if ok)
+        if sent < len(email_messages):
+            logger.error(f": Brevo accepted {sent} of {len(email_messages)} emails")
+        return sent
@@ -1,61 +1,33 @@
-import hashlib
-import json
-import os
+from concurrent.futures import ThreadPoolExecutor
+
 from django.apps import apps
+from django.db import connections
 from django.core.management.base import BaseCommand
-from django.db import transaction
 from django.db.utils import ProgrammingError
-from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
-from django.db.models.fields.related import ManyToManyField
-
-IGNORED_FIELDS = {'created_at', 'updated_at', 'last_login', 'date_joined', 'password'}
-
-def get_record_hash(instance, ignore_fields=None):
-    """
-    Create a hash of a model instance's data, excluding ignored fields,
-    and converting related model instances to their PKs.
-    """
-    if ignore_fields is None:
-        ignore_fields = IGNORED_FIELDS
-
-    data = {}
-    for field in instance._meta.fields:
-        name = field.name
-        if name in ignore_fields:
-            continue
-        try:
-            value = getattr(instance, name)
-            # If it's a related model instance, store its PK instead
-            if hasattr(field, 'remote_field') and field.remote_field:
-                value = value.pk if value else None
-        except Exception:
-            value = None
-        data[name] = value
-
-    string = json.dumps(data, sort_keys=True)
-    return hashlib.md5(string.encode()).hexdigest()
-
-
-def get_m2m_data(instance):
-    """Return a dict of M2M field name -> set of related primary keys."""
-    m2m_data = {}
-    for field in instance._meta.many_to_many:
-        try:
-            m2m_qs = getattr(instance, field.name).all()
-            m2m_data[field.name] = set(m2m_qs.values_list('pk', flat=True))
-        except Exception:
-            m2m_data[field.name] = set()
-    return m2m_data
+
+from core.models import BackupCheckpoint
+from core.services.backup_sync import ParallelBackupRunner
+from core.services.backup_verify import ModelChecksumVerifier
 
 
 class Command(BaseCommand):
     help = "Backs up all model data from the default DB to the Supabase DB."
 
     def add_arguments(self, parser):
+        parser.add_argument('action', nargs='?', choices=['sync', 'verify'], default='sync',
+                            help='sync (default) copies data, verify compares chunk checksums of both databases')
+        parser.add_argument('--chunk-size', type=int, default=10000, help='Rows per top-level verify checksum')
         parser.add_argument('--dry-run', action='store_true', help='Simulate changes without saving')
         parser.add_argument('--quiet', action='store_true', help='Suppress standard output (errors still shown)')
         parser.add_argument('--log', type=str, help='Write backup logs to this file path')
+        parser.add_argument('--incremental', action='store_true',
+                            help='Only copy rows changed since the last successful run of each model')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows per keyset page / bulk upsert')
+        parser.add_argument('--workers', type=int, default=4, help='Models copied in parallel per dependency level')
+        parser.add_argument('--resume', action='store_true',
+                            help='Continue an interrupted run: skip completed models, restart others from their last PK')
+        parser.add_argument('--models', nargs='+', metavar='app_label.Model', help='Limit the backup to these models')
 
     def log(self, message, options, error=False):
         if not options['quiet'] or error:
@@ -64,87 +36,113 @@ class Command(BaseCommand):
             with open(options['log'], 'a') as log_file:
                 log_file.write(f"[{timezone.now()}] {message}\n")
 
+    def get_models(self, options):
+        models = [
+            model for model in apps.get_models()
+            if model is not BackupCheckpoint and not model._meta.proxy
+        ]
+        if options.get('models'):
+            wanted = {label.lower() for label in options['models']}
+            models = [model for model in models if model._meta.label_lower in wanted]
+        return models
+
     def handle(self, *args, **options):
+        if options['action'] == 'verify':
+            return self.verify(options)
+
         supabase_db = 'supabase'
         default_db = 'default'
         dry_run = options['dry_run']
+        mode = "incremental" if options['incremental'] else "full"
 
-        self.log("🚀 Starting backup to Supabase...", options)
-
-        all_models = apps.get_models()
-        global_inserted = global_updated = global_skipped = global_errors = global_m2m_synced = 0
+        self.log(f"🚀 Starting {mode} backup to Supabase...", options)
 
-        for model in all_models:
-            model_name = model._meta.label
+        totals = {'inserted': 0, 'updated': 0, 'skipped': 0, 'm2m_synced': 0}
+        errors = []
 
+        models = []
+        for model in self.get_models(options):
             if not model._meta.managed or model._meta.abstract:
-                self.log(f"⚠️  Skipping unmanaged/abstract model: {model_name}", options)
+                self.log(f"⚠️  Skipping unmanaged/abstract model: {model._meta.label}", options)
                 continue
+            models.append(model)
 
-            try:
-                default_records = model.objects.using(default_db).all()
-                count = default_records.count()
-                inserted = updated = skipped = errors = m2m_synced = 0
-
-                self.log(f"📦 Backing up {model_name} ({count} records)...", options)
-
-                for record in default_records:
-                    try:
-                        supabase_record = model.objects.using(supabase_db).get(pk=record.pk)
-
-                        record_hash = get_record_hash(record)
-                        supabase_hash = get_record_hash(supabase_record)
-
-                        if record_hash != supabase_hash:
-                            if not dry_run:
-                                with transaction.atomic(using=supabase_db):
-                                    record.save(using=supabase_db)
-                            updated += 1
-                        else:
-                            skipped += 1
-
-                        # 🔁 Handle Many-to-Many fields
-                        default_m2m = get_m2m_data(record)
-                        supabase_m2m = get_m2m_data(supabase_record)
-
-                        for field_name in default_m2m:
-                            if default_m2m[field_name] != supabase_m2m[field_name]:
-                                if not dry_run:
-                                    getattr(supabase_record, field_name).set(default_m2m[field_name], using=supabase_db)
-                                m2m_synced += 1
-
-                    except model.DoesNotExist:
-                        if not dry_run:
-                            with transaction.atomic(using=supabase_db):
-                                record.save(using=supabase_db)
-                                # Save M2M after instance saved
-                                m2m_data = get_m2m_data(record)
-                                for field_name, related_pks in m2m_data.items():
-                                    getattr(record, field_name).set(related_pks, using=supabase_db)
-                        inserted += 1
-
-                    except Exception as e:
-                        errors += 1
-                        self.log(f"* Error processing {model_name} pk={record.pk}: {e}", options, error=True)
-
-                self.log(
-                    f"✅ {model_name}: {inserted} inserted, {updated} updated, {skipped} unchanged, "
-                    f"{m2m_synced} M2M synced, {errors} errors", options
-                )
-
-                global_inserted += inserted
-                global_updated += updated
-                global_skipped += skipped
-                global_errors += errors
-                global_m2m_synced += m2m_synced
-
-            except ProgrammingError as e:
-                self.log(f"⚠️ Skipping {model_name} (DB not ready?): {e}", options, error=True)
-            except Exception as e:
-                self.log(f"* Failed to process {model_name}: {e}", options, error=True)
+        def on_result(model, stats, error):
+            model_name = model._meta.label
+            if error is not None:
+                errors.append(model_name)
+                if isinstance(error, ProgrammingError):
+                    self.log(f"⚠️ Skipping {model_name} (DB not ready?): {error}", options, error=True)
+                else:
+                    self.log(f"* Failed to process {model_name}: {error}", options, error=True)
+                return
+
+            self.log(
+                f"✅ {model_name}: {stats['inserted']} inserted, {stats['updated']} updated, "
+                f"{stats['skipped']} unchanged, {stats['m2m_synced']} M2M synced", options
+            )
+            for key in totals:
+                totals[key] += stats[key]
+
+        ParallelBackupRunner(
+            models,
+            workers=options['workers'],
+            resume=options['resume'],
+            on_result=on_result,
+            source=default_db,
+            target=supabase_db,
+            batch_size=options['batch_size'],
+            incremental=options['incremental'],
+            dry_run=dry_run,
+        ).run()
 
         self.log("🎉 Backup complete!", options)
         self.log(
-            f"📊 Summary: {global_inserted} inserted, {global_updated} updated, "
-            f"{global_skipped} skipped, {global_m2m_synced} M2M synced, {global_errors} errors", options
+            f"📊 Summary: {totals['inserted']} inserted, {totals['updated']} updated, "
+            f"{totals['skipped']} skipped, {totals['m2m_synced']} M2M synced, {len(errors)} errors", options
         )
+        if errors:
+            self.log(f"🔁 Re-run with --resume to retry: {', '.join(sorted(errors))}", options, error=True)
+
+    def verify(self, options):
+        self.log("🔍 Verifying Supabase backup checksums...", options)
+        models = [
+            model for model in self.get_models(options)
+            if model._meta.managed and not model._meta.abstract
+        ]
+        drifted = 0
+
+        def verify_model(model):
+            try:
+                return ModelChecksumVerifier(
+                    model, source='default', target='supabase', chunk_size=options['chunk_size']
+                ).run()
+            except Exception as e:
+                return {'error': e}
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(max_workers=max(options['workers'], 1)) as executor:
+            results = zip(models, executor.map(verify_model, models))
+            for model, result in results:
+                model_name = model._meta.label
+                if 'error' in result:
+                    drifted += 1
+                    self.log(f"* Failed to verify {model_name}: {result['error']}", options, error=True)
+                    continue
+                if result['in_sync']:
+                    self.log(f"✅ {model_name}: in sync ({result['chunks']} chunks)", options)
+                    continue
+
+                drifted += 1
+                self.log(
+                    f"❌ {model_name}: {result['mismatched_chunks']}/{result['chunks']} chunks differ | "
+                    f"{len(result['missing'])} missing, {len(result['extra'])} extra, "
+                    f"{len(result['changed'])} changed", options, error=True
+                )
+                for kind in ('missing', 'extra', 'changed'):
+                    if result[kind]:
+                        sample = ', '.join(str(pk) for pk in result[kind][:20])
+                        self.log(f"   {kind}: {sample}{' ...' if len(result[kind]) > 20 else ''}", options, error=True)
+
+        self.log(f"📊 Verify summary: {len(models) - drifted} in sync, {drifted} drifted", options)
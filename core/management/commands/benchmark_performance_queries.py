@@ -0,0 +1,87 @@
+import time
+import logging
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Sum
+from django.utils import timezone
+
+from core.models import AdPerformance, AdPlacement
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Prints query plans and timings for the AdPerformance hot paths, "
+        "comparing the legacy 3-level join against the denormalized/indexed queries."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--advertiser', type=str, help='Advertiser user id (defaults to the busiest one)')
+        parser.add_argument('--days', type=int, default=30, help='Date range to aggregate over')
+        parser.add_argument('--runs', type=int, default=5, help='Timed executions per query')
+        parser.add_argument('--analyze', action='store_true', help='Use EXPLAIN ANALYZE (Postgres only)')
+
+    def handle(self, *args, **options):
+        advertiser = self.get_advertiser(options['advertiser'])
+        placement = AdPlacement.objects.filter(ad__campaign__advertiser=advertiser).first()
+        since = timezone.now().date() - timedelta(days=options['days'])
+
+        self.stdout.write(f"🔎 Benchmarking on {connection.vendor} for advertiser {advertiser.pk} (last {options['days']} days)")
+
+        cases = [
+            (
+                'Advertiser date-range aggregate',
+                AdPerformance.objects.filter(
+                    ad_placement__ad__campaign__advertiser=advertiser, date__gte=since
+                ).values('date').annotate(impressions=Sum('impressions'), cost=Sum('cost')),
+                AdPerformance.objects.filter(
+                    advertiser=advertiser, date__gte=since
+                ).values('date').annotate(impressions=Sum('impressions'), cost=Sum('cost')),
+            ),
+        ]
+        if placement:
+            cases.append((
+                'Latest tick for placement',
+                AdPerformance.objects.filter(ad_placement=placement).order_by('-timestamp')[:1],
+                AdPerformance.objects.filter(ad_placement=placement).order_by('-timestamp')
+                    .values_list('timestamp', flat=True)[:1],
+            ))
+
+        for title, before, after in cases:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n== {title} =="))
+            for label, qs in (('before', before), ('after', after)):
+                self.stdout.write(self.style.HTTP_INFO(f"-- {label}"))
+                self.stdout.write(self.explain(qs, options['analyze']))
+                elapsed = self.time_query(qs, options['runs'])
+                self.stdout.write(f"⏱️  avg {elapsed * 1000:.2f} ms over {options['runs']} runs")
+
+    def get_advertiser(self, advertiser_id):
+        User = get_user_model()
+        if advertiser_id:
+            try:
+                return User.objects.get(pk=advertiser_id)
+            except User.DoesNotExist:
+                raise CommandError(f"Advertiser {advertiser_id} does not exist")
+
+        row = AdPerformance.objects.exclude(advertiser__isnull=True) \
+            .values('advertiser').annotate(rows=Sum('impressions')).order_by('-rows').first()
+        if not row:
+            raise CommandError("No AdPerformance rows to benchmark")
+        return User.objects.get(pk=row['advertiser'])
+
+    def explain(self, qs, analyze):
+        if analyze and connection.vendor == 'postgresql':
+            return qs.explain(analyze=True, buffers=True)
+        return qs.explain()
+
+    def time_query(self, qs, runs):
+        total = 0.0
+        for _ in range(max(runs, 1)):
+            start = time.perf_counter()
+            list(qs.all())
+            total += time.perf_counter() - start
+        return total / max(runs, 1)
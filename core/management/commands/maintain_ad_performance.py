@@ -0,0 +1,53 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from core.services.performance_storage import AdPerformancePartitionManager, AdPerformanceCompactor
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates upcoming monthly AdPerformance partitions (Postgres) and compacts "
+        "hourly ticks older than N days into one daily row per placement."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int, default=3, help='Future monthly partitions to keep ready')
+        parser.add_argument('--compact-older-than', type=int, default=30, help='Compact hourly rows older than N days')
+        parser.add_argument('--batch-size', type=int, default=500, help='(placement, day) groups per compaction pass')
+        parser.add_argument('--skip-partitions', action='store_true', help='Do not create partitions')
+        parser.add_argument('--skip-compaction', action='store_true', help='Do not compact hourly rows')
+        parser.add_argument('--database', default='default', help='Database alias to maintain')
+        parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing')
+
+    def handle(self, *args, **options):
+        using = options['database']
+        dry_run = options['dry_run']
+
+        if not options['skip_partitions']:
+            manager = AdPerformancePartitionManager(using=using)
+            if manager.connection.vendor != 'postgresql':
+                self.stdout.write("⏭️  Partitioning is only available on Postgres, skipping.")
+            elif not manager.is_partitioned():
+                self.stdout.write(self.style.WARNING("⚠️  AdPerformance is not partitioned yet, run migrations first."))
+            else:
+                created = manager.ensure_partitions(months_ahead=options['months_ahead'], dry_run=dry_run)
+                prefix = "Would create" if dry_run else "Created"
+                for name in created:
+                    self.stdout.write(self.style.SUCCESS(f"✅ {prefix} partition {name}"))
+                if not created:
+                    self.stdout.write("✔️  All partitions already exist.")
+
+        if not options['skip_compaction']:
+            compactor = AdPerformanceCompactor(
+                older_than_days=options['compact_older_than'],
+                batch_size=options['batch_size'],
+                using=using
+            )
+            removed = compactor.run(dry_run=dry_run)
+            prefix = "Would remove" if dry_run else "Removed"
+            self.stdout.write(self.style.SUCCESS(
+                f"🧹 {prefix} {removed} hourly rows older than {compactor.cutoff()}"
+            ))
@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from core.services.repost_scheduler import RepostScheduler
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes and reposts running placements when they are due, following each "
+        "channel's repost_preference, timezone and the placement's max_reposts."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Repost what is due now and exit (for cron)')
+        parser.add_argument('--batch-size', type=int, default=20, help='Placements popped per batch')
+        parser.add_argument('--rate', type=float, default=1.0, help='Max reposts per second')
+        parser.add_argument('--horizon', type=int, default=10, help='Minutes of upcoming reposts kept in memory')
+        parser.add_argument('--poll-interval', type=int, default=60, help='Seconds between index reloads')
+
+    def handle(self, *args, **options):
+        scheduler = RepostScheduler(
+            batch_size=options['batch_size'],
+            rate_per_second=options['rate'],
+            horizon=timedelta(minutes=options['horizon']),
+        )
+
+        if options['once']:
+            stats = scheduler.run_once()
+            self.stdout.write(self.style.SUCCESS(
+                f"🔂 Reposted {stats['reposted']} placements "
+                f"({stats['failed']} failed, {stats['finished']} reached max reposts)"
+            ))
+            return
+
+        self.stdout.write("🔂 Repost scheduler running, press Ctrl+C to stop.")
+        try:
+            scheduler.run_forever(poll_interval=options['poll_interval'])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING(f"⏹️  Stopped | {scheduler.stats}"))
@@ -0,0 +1,46 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.services.daily_stats import DailyStatsService
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the admin analytics snapshot (DailyStat) for closed days from the source "
+        "tables and records today's platform totals. Run it nightly after midnight. The "
+        "first run backfills every day since the oldest signup, channel or visit; use "
+        "--days to rebuild a longer window later."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=1, help='Closed days to rebuild, ending yesterday')
+        parser.add_argument('--include-today', action='store_true', help="Also rebuild today's running counters")
+        parser.add_argument('--date', help='Rebuild a single local day (YYYY-MM-DD) instead')
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        if options['date']:
+            try:
+                start = end = date.fromisoformat(options['date'])
+            except ValueError:
+                raise CommandError(f"Invalid --date '{options['date']}', expected YYYY-MM-DD")
+        else:
+            if options['days'] < 1:
+                raise CommandError("--days must be at least 1")
+            end = today if options['include_today'] else today - timedelta(days=1)
+            start = today - timedelta(days=options['days'])
+
+            # Source rows older than the stored history (first run): build it all
+            first = DailyStatsService.first_day()
+            since = DailyStatsService.history_start()
+            if first and first < start and (since is None or first < since):
+                self.stdout.write(f"🗂️  Daily stats start on {since or 'no day yet'}, backfilling since {first}")
+                start = first
+
+        rows = DailyStatsService.snapshot_flows(start, end)
+        self.stdout.write(self.style.SUCCESS(f"✅ Rebuilt {rows} daily stats for {start} → {end}"))
+
+        gauges = DailyStatsService.snapshot_gauges(today)
+        self.stdout.write(self.style.SUCCESS(f"📊 Recorded {gauges} platform totals for {today}"))
@@ -0,0 +1,51 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.services.campaign_schedule import CampaignScheduleSweeper
+
+
+class Command(BaseCommand):
+    help = (
+        "Starts scheduled campaigns whose start_date has arrived and completes campaigns "
+        "past their end_date, posting/deleting their placements in batches, and retries "
+        "Telegram deliveries that were lost after a campaign action. Run it from cron, or "
+        "with --interval to keep sweeping."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100, help='Campaigns per transaction')
+        parser.add_argument('--interval', type=int, default=0, help='Keep running, sweeping every N seconds')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many campaigns are due')
+
+    def handle(self, *args, **options):
+        while True:
+            self.sweep(options)
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
+
+    def sweep(self, options):
+        results = CampaignScheduleSweeper(batch_size=options['batch_size']).run(dry_run=options['dry_run'])
+
+        for action, label in (('expire', 'Expired'), ('start', 'Started')):
+            totals = results[action]
+            if options['dry_run']:
+                self.stdout.write(f"🔎 {totals['campaigns']} campaigns due to {action}")
+                continue
+            self.stdout.write(self.style.SUCCESS(
+                f"✅ {label} {totals['updated']}/{totals['campaigns']} campaigns "
+                f"({totals['posts']} posts, {totals['deletions']} deletions)"
+            ))
+            if totals['failed']:
+                self.stdout.write(self.style.WARNING(f"⚠️  {totals['failed']} campaigns could not be updated"))
+
+        totals = results['redeliver']
+        if options['dry_run']:
+            self.stdout.write(f"🔎 {totals['posts']} posts and {totals['deletions']} deletions left undelivered")
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f"🔁 Redelivered {totals['posts']} posts and {totals['deletions']} deletions"
+        ))
+        if totals['failed']:
+            self.stdout.write(self.style.WARNING(f"⚠️  {totals['failed']} deliveries failed again"))
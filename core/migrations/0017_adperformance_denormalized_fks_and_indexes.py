@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:24
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_campaign_and_advertiser(apps, schema_editor):
+    AdPerformance = apps.get_model('core', 'AdPerformance')
+    AdPlacement = apps.get_model('core', 'AdPlacement')
+    placements = AdPlacement.objects.filter(pk=OuterRef('ad_placement_id'))
+    AdPerformance.objects.filter(campaign__isnull=True).update(
+        campaign_id=Subquery(placements.values('ad__campaign_id')[:1]),
+        advertiser_id=Subquery(placements.values('ad__campaign__advertiser_id')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_alter_adplacement_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='adperformance',
+            name='advertiser',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='ad_performances', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='adperformance',
+            name='campaign',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='performances', to='core.campaign'),
+        ),
+        migrations.RunPython(backfill_campaign_and_advertiser, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='adperformance',
+            index=models.Index(fields=['ad_placement', 'date'], name='adperf_placement_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adperformance',
+            index=models.Index(fields=['date', 'ad_placement'], include=('impressions', 'clicks', 'views', 'cost'), name='adperf_date_placement_cov_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adperformance',
+            index=models.Index(fields=['ad_placement', '-timestamp'], name='adperf_placement_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adperformance',
+            index=models.Index(fields=['advertiser', 'date'], name='adperf_advertiser_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adperformance',
+            index=models.Index(fields=['campaign', 'date'], name='adperf_campaign_date_idx'),
+        ),
+    ]
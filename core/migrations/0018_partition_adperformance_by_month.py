@@ -0,0 +1,104 @@
+# Manually Generated on 2026-10-19 15:10
+
+from datetime import date
+
+from django.db import migrations
+
+
+TABLE = 'core_adperformance'
+STAGING = 'core_adperformance_partitioned'
+
+
+def add_months(day, months):
+    month_index = day.month - 1 + months
+    return date(day.year + month_index // 12, month_index % 12 + 1, 1)
+
+
+def is_partitioned(cursor):
+    cursor.execute(
+        "SELECT 1 FROM pg_partitioned_table p "
+        "JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = %s",
+        [TABLE]
+    )
+    return cursor.fetchone() is not None
+
+
+def partition_adperformance(apps, schema_editor):
+    """
+    Rebuilds core_adperformance as a table partitioned by RANGE (date), one
+    partition per month plus a DEFAULT catch-all. Postgres only; other
+    backends keep the plain table.
+
+    Partition keys must be part of every unique constraint, so the primary
+    key becomes (id, date) and the (ad_placement, timestamp) uniqueness is
+    enforced as (ad_placement, timestamp, date) at the database level.
+    """
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+
+    with connection.cursor() as cursor:
+        if is_partitioned(cursor):
+            return
+
+        cursor.execute(f"SELECT MIN(date) FROM {TABLE}")
+        first_day = cursor.fetchone()[0] or date.today()
+
+        cursor.execute(
+            f"CREATE TABLE {STAGING} (LIKE {TABLE} INCLUDING DEFAULTS) PARTITION BY RANGE (date)"
+        )
+
+        month = first_day.replace(day=1)
+        last_month = add_months(date.today().replace(day=1), 3)
+        while month <= last_month:
+            cursor.execute(
+                f"CREATE TABLE {TABLE}_p{month:%Y_%m} PARTITION OF {STAGING} "
+                f"FOR VALUES FROM (%s) TO (%s)",
+                [month, add_months(month, 1)]
+            )
+            month = add_months(month, 1)
+        cursor.execute(f"CREATE TABLE {TABLE}_default PARTITION OF {STAGING} DEFAULT")
+
+        cursor.execute(f"INSERT INTO {STAGING} SELECT * FROM {TABLE}")
+        cursor.execute(f"DROP TABLE {TABLE}")
+        cursor.execute(f"ALTER TABLE {STAGING} RENAME TO {TABLE}")
+
+        cursor.execute(f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id, date)")
+        cursor.execute(
+            f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_ad_placement_id_timestamp_uniq "
+            f"UNIQUE (ad_placement_id, \"timestamp\", date)"
+        )
+        for column, target in (
+            ('ad_placement_id', 'core_adplacement'),
+            ('campaign_id', 'core_campaign'),
+            ('advertiser_id', 'users_user'),
+        ):
+            cursor.execute(
+                f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_{column}_fk "
+                f"FOREIGN KEY ({column}) REFERENCES {target} (id) DEFERRABLE INITIALLY DEFERRED"
+            )
+
+        for statement in (
+            f"CREATE INDEX {TABLE}_ad_placement_id_idx ON {TABLE} (ad_placement_id)",
+            f"CREATE INDEX {TABLE}_campaign_id_idx ON {TABLE} (campaign_id)",
+            f"CREATE INDEX {TABLE}_advertiser_id_idx ON {TABLE} (advertiser_id)",
+            f"CREATE INDEX adperf_placement_date_idx ON {TABLE} (ad_placement_id, date)",
+            f"CREATE INDEX adperf_date_placement_cov_idx ON {TABLE} (date, ad_placement_id) "
+            f"INCLUDE (impressions, clicks, views, cost)",
+            f"CREATE INDEX adperf_placement_ts_idx ON {TABLE} (ad_placement_id, \"timestamp\" DESC)",
+            f"CREATE INDEX adperf_advertiser_date_idx ON {TABLE} (advertiser_id, date)",
+            f"CREATE INDEX adperf_campaign_date_idx ON {TABLE} (campaign_id, date)",
+        ):
+            cursor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_adperformance_denormalized_fks_and_indexes'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_adperformance, migrations.RunPython.noop),
+    ]
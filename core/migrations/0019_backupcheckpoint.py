@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_partition_adperformance_by_month'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackupCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_label', models.CharField(max_length=150)),
+                ('target_db', models.CharField(default='supabase', max_length=50)),
+                ('watermark', models.DateTimeField(blank=True, null=True)),
+                ('last_run_at', models.DateTimeField(blank=True, null=True)),
+                ('rows_synced', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Backup Checkpoint',
+                'verbose_name_plural': 'Backup Checkpoints',
+                'unique_together': {('model_label', 'target_db')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_backupcheckpoint_resume_state'),
+        ('creators', '0009_creatorchannel_handle'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='adplacement',
+            index=models.Index(fields=['updated_at', 'id'], name='adplacement_updated_id_idx'),
+        ),
+    ]
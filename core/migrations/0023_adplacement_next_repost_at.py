@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_campaign_schedule_indexes'),
+        ('creators', '0011_creatorchannel_pricing_profile'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='adplacement',
+            name='next_repost_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='adplacement',
+            index=models.Index(fields=['status', 'next_repost_at'], name='adplacement_repost_due_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_notificationcounter'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'is_active', 'is_read', 'created_at'], name='notification_inbox_idx'),
+        ),
+    ]
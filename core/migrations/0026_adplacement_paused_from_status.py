@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0025_notification_inbox_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='adplacement',
+            name='paused_from_status',
+            field=models.CharField(blank=True, choices=[('draft', 'Draft'), ('pending', 'Pending'), ('approved', 'Approved'), ('running', 'Live'), ('rejected', 'Rejected'), ('paused', 'Paused'), ('stopped', 'Stopped'), ('completed', 'Completed'), ('expired', 'Expired')], editable=False, max_length=50, null=True),
+        ),
+    ]
@@ -3,3 +3,4 @@ from .campaign import *
 from .ad_placement import *
 from .ad_performance import *
 
+from .backup import *
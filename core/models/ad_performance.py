@@ -4,7 +4,7 @@ from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 import uuid
-from core.models import AdPlacement
+from core.models import AdPlacement, Campaign
 
 
 User = get_user_model()
@@ -20,6 +20,24 @@ class AdPerformance(models.Model):
         on_delete=models.CASCADE, 
         related_name='performance'
     )
+    # Denormalized from ad_placement -> ad -> campaign so reporting
+    # queries can filter without the 3-level join.
+    campaign = models.ForeignKey(
+        Campaign,
+        on_delete=models.CASCADE,
+        related_name='performances',
+        null=True,
+        blank=True,
+        editable=False
+    )
+    advertiser = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='ad_performances',
+        null=True,
+        blank=True,
+        editable=False
+    )
     date = models.DateField(auto_now_add=True)
     
     # System-side delivery metrics
@@ -49,9 +67,32 @@ class AdPerformance(models.Model):
     
     class Meta:
         unique_together = ['ad_placement', 'timestamp']
+        indexes = [
+            models.Index(fields=['ad_placement', 'date'], name='adperf_placement_date_idx'),
+            # Covering index for date-range dashboards (INCLUDE is Postgres-only,
+            # other backends create a plain composite index).
+            models.Index(
+                fields=['date', 'ad_placement'],
+                include=['impressions', 'clicks', 'views', 'cost'],
+                name='adperf_date_placement_cov_idx'
+            ),
+            models.Index(fields=['ad_placement', '-timestamp'], name='adperf_placement_ts_idx'),
+            models.Index(fields=['advertiser', 'date'], name='adperf_advertiser_date_idx'),
+            models.Index(fields=['campaign', 'date'], name='adperf_campaign_date_idx'),
+        ]
         
     def __str__(self):
         return f"Performance {self.ad_placement.ad.headline} on {self.date}"
+
+    def save(self, *args, **kwargs):
+        if self.ad_placement_id and (self.campaign_id is None or self.advertiser_id is None):
+            row = AdPlacement.objects.filter(pk=self.ad_placement_id).values(
+                'ad__campaign_id', 'ad__campaign__advertiser_id'
+            ).first()
+            if row:
+                self.campaign_id = row['ad__campaign_id']
+                self.advertiser_id = row['ad__campaign__advertiser_id']
+        super().save(*args, **kwargs)
     
     
     @property
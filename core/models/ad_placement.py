@@ -1,10 +1,15 @@
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 import uuid
 from creators.models import CreatorChannel
-from core.models import Campaign, Ad
+from core.models import Campaign, Ad, FieldTrackerMixin
 
 
 User = get_user_model()
@@ -20,7 +25,9 @@ class AdPlacementStatus(models.TextChoices):
     COMPLETED = 'completed', 'Completed'
     EXPIRED = 'expired', 'Expired'
 
-class AdPlacement(models.Model):
+class AdPlacement(FieldTrackerMixin, models.Model):
+
+    tracked_fields = ('status',)
 
     id = models.UUIDField(
         primary_key=True, 
@@ -58,6 +65,16 @@ class AdPlacement(models.Model):
     )
     repost_count = models.IntegerField(default=0)
     max_reposts = models.IntegerField(default=3)
+    # Status the placement had when its campaign was paused, restored on resume
+    paused_from_status = models.CharField(
+        max_length=50,
+        choices=AdPlacementStatus.choices,
+        null=True,
+        blank=True,
+        editable=False
+    )
+    # When the repost scheduler should next delete-and-repost this placement
+    next_repost_at = models.DateTimeField(null=True, blank=True, editable=False)
     preference_score = models.FloatField(default=1.0)
     
     content_platform_id = models.CharField(
@@ -79,15 +96,53 @@ class AdPlacement(models.Model):
         
     objects = CampaignManager() 
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._original_status = self.status  
-
     class Meta:
         unique_together = ['ad', 'channel']
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='adplacement_updated_id_idx'),
+            models.Index(fields=['status', 'next_repost_at'], name='adplacement_repost_due_idx'),
+        ]
         
     def __str__(self):
         return f"AdPlacement: {self.ad.headline} → {self.channel.title}"
+
+    def save(self, *args, **kwargs):
+        # Partial saves still bump updated_at; the scraper feed deltas key on it
+        update_fields = kwargs.get('update_fields')
+        if update_fields:
+            kwargs['update_fields'] = {*update_fields, 'updated_at'}
+        super().save(*args, **kwargs)
+
+    REPOST_PERIODS = {
+        'hour': timedelta(hours=1),
+        'day': timedelta(days=1),
+        'week': timedelta(weeks=1),
+    }
+    REPOST_RETRY_DELAY = timedelta(minutes=15)
+
+    def compute_next_repost_at(self, after=None):
+        """
+        Next repost time from the channel's repost_preference and
+        repost_preference_frequency (that many reposts per hour/day/week,
+        evenly spaced after the last post), shifted out of the channel's local
+        REPOST_QUIET_HOURS when configured. None once max_reposts is reached
+        or reposting is off.
+        """
+        channel = self.channel
+        period = self.REPOST_PERIODS.get(channel.repost_preference)
+        if period is None or self.status != AdPlacementStatus.RUNNING or self.repost_count >= self.max_reposts:
+            return None
+
+        interval = period / max(channel.repost_preference_frequency or 1, 1)
+        local_tz = ZoneInfo(channel.timezone or 'Africa/Addis_Ababa')
+        candidate = ((after or timezone.now()) + interval).astimezone(local_tz)
+        if not settings.REPOST_QUIET_HOURS:
+            return candidate
+        quiet_start, quiet_end = settings.REPOST_QUIET_HOURS
+        if candidate.hour >= quiet_start or candidate.hour < quiet_end:
+            day = candidate.date() if candidate.hour < quiet_end else candidate.date() + timedelta(days=1)
+            candidate = datetime.combine(day, time(quiet_end), tzinfo=local_tz)
+        return candidate
     
     
 # Placement Match Log
@@ -0,0 +1,36 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class BackupStatus(models.TextChoices):
+    PENDING = 'pending', 'Pending'
+    RUNNING = 'running', 'Running'
+    COMPLETED = 'completed', 'Completed'
+    FAILED = 'failed', 'Failed'
+
+
+class BackupCheckpoint(models.Model):
+    """
+    Per-model progress of the `backup_to_supabase` command. The watermark is
+    the start time of the last successful run; incremental runs only copy
+    rows changed since then. `last_pk` is saved after every batch so an
+    interrupted run can resume from it.
+    """
+    model_label = models.CharField(max_length=150)
+    target_db = models.CharField(max_length=50, default='supabase')
+    watermark = models.DateTimeField(null=True, blank=True)
+    last_run_at = models.DateTimeField(null=True, blank=True)
+    rows_synced = models.PositiveBigIntegerField(default=0)
+    status = models.CharField(max_length=20, choices=BackupStatus.choices, default=BackupStatus.PENDING)
+    last_pk = models.CharField(max_length=64, null=True, blank=True)
+    run_started_at = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True, default='')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['model_label', 'target_db']
+        verbose_name = _('Backup Checkpoint')
+        verbose_name_plural = _('Backup Checkpoints')
+
+    def __str__(self):
+        return f"{self.model_label} @ {self.watermark or 'never'}"
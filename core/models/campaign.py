@@ -7,7 +7,7 @@ from django.core.exceptions import ValidationError
 from django.db.models import TextChoices
 from django.contrib.auth import get_user_model
 
-from core.models import Category, Language, ActiveManager
+from core.models import Category, Language, ActiveManager, FieldTrackerMixin
 from core.utils.helper import is_valid_url
 
 
@@ -32,8 +32,9 @@ class AdObjective(models.TextChoices):
 
     
 
-class Campaign(models.Model):
+class Campaign(FieldTrackerMixin, models.Model):
     
+    tracked_fields = ('status', 'initial_budget', 'cpm', 'objective')
     
     id = models.UUIDField(
         primary_key=True, 
@@ -85,6 +86,11 @@ class Campaign(models.Model):
     class Meta:
         ordering = ('-updated_at',)
         unique_together = ['name', 'advertiser', 'status']
+        indexes = [
+            # Schedule sweeper: campaigns crossing their start/end date
+            models.Index(fields=['status', 'start_date'], name='campaign_status_start_idx'),
+            models.Index(fields=['status', 'end_date'], name='campaign_status_end_idx'),
+        ]
         
         permissions = [
             ('pause_campaign', 'Can pause campaigns'),
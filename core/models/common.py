@@ -10,6 +10,56 @@ class ActiveManager(models.Manager):
 	def get_queryset(self):
 		return super(ActiveManager, self).get_queryset() .filter(is_active=True)
 
+class FieldTrackerMixin:
+    """
+    Remembers the values of `tracked_fields` as they were loaded (or last
+    saved / refreshed), so callers and signals can ask what changed without
+    refetching the row. Deferred fields are not snapshotted and always
+    report as changed once loaded, to stay on the safe side.
+    """
+    tracked_fields = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tracked_initial = {}
+        self._snapshot_tracked_fields()
+
+    def _tracked_attname(self, field):
+        return self._meta.get_field(field).attname
+
+    def _snapshot_tracked_fields(self, fields=None):
+        for field in fields if fields is not None else self.tracked_fields:
+            if field not in self.tracked_fields:
+                continue
+            attname = self._tracked_attname(field)
+            if attname in self.__dict__:
+                self._tracked_initial[field] = self.__dict__[attname]
+            else:
+                self._tracked_initial.pop(field, None)
+
+    def has_changed(self, field):
+        if field not in self._tracked_initial:
+            return True
+        return self._tracked_initial[field] != getattr(self, self._tracked_attname(field))
+
+    def previous_value(self, field):
+        return self._tracked_initial.get(field)
+
+    @property
+    def changed_fields(self):
+        return [field for field in self.tracked_fields if self.has_changed(field)]
+
+    def refresh_from_db(self, *args, fields=None, **kwargs):
+        super().refresh_from_db(*args, fields=fields, **kwargs)
+        self._snapshot_tracked_fields(fields)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # post_save receivers have run by now and seen the changes
+        update_fields = kwargs.get('update_fields')
+        self._snapshot_tracked_fields(list(update_fields) if update_fields is not None else None)
+
+
 class Currency(models.Model):
     code = models.CharField(max_length=10, unique=True)  # 'ETB', 'USD'
     name = models.CharField(max_length=50)
@@ -44,7 +94,7 @@ class Language(models.Model):
         unique_together = ['name', 'code']
 
  
-class Notification(models.Model):
+class Notification(FieldTrackerMixin, models.Model):
     NOTIFICATION_TYPES = (
         ('ad_action', 'Adz'),
         ('earning', 'Earning'),
@@ -64,11 +114,40 @@ class Notification(models.Model):
     objects = models.Manager()
     active_objects = ActiveManager()
 
+    # is_active + is_read decide whether the row counts towards NotificationCounter
+    tracked_fields = ('is_read', 'is_active')
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = _('Notification')
         verbose_name_plural = _('Notifications')
+        indexes = [
+            # Inbox listing / keyset pagination and new-item polling
+            models.Index(fields=['user', 'is_active', 'is_read', 'created_at'], name='notification_inbox_idx'),
+        ]
 
     def __str__(self):
         return f"Notification for {self.user}: {self.title}"
+
+    @property
+    def counts_as_unread(self):
+        return self.is_active and not self.is_read
+
+
+class NotificationCounter(models.Model):
+    """
+    Denormalized number of active, unread notifications per user, so the
+    unread badge is a single-row read. Maintained by NotificationService and
+    the Notification save/delete signals.
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='notification_counter')
+    unread = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _('Notification Counter')
+        verbose_name_plural = _('Notification Counters')
+
+    def __str__(self):
+        return f"{self.user}: {self.unread} unread"
         
\ No newline at end of file
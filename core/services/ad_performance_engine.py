@@ -2,6 +2,7 @@ import uuid
 import logging
 from decimal import Decimal
 from django.db import transaction
+from django.db.models import Sum
 from django.utils import timezone
 from datetime import date
 
@@ -9,6 +10,7 @@ from core.models import AdPlacement, AdPerformance
 from payments.models import Escrow
 from payments.services import EarningService
 from core.services.content_delivery_engine import ContentDeliveryService
+from core.services.live_metrics import publish_performance_tick
 
 logger = logging.getLogger(__name__)
 
@@ -40,12 +42,12 @@ class PerformanceLoggingEngine:
         active_placements = AdPlacement.objects.filter(
             is_active=True,
             status__in=['approved', 'completed']
-        )
+        ).select_related('ad__campaign__advertiser', 'channel__owner')
 
         # Group by campaign
         campaigns = {}
         for placement in active_placements:
-            campaign_id = placement.ad.campaign.id
+            campaign_id = placement.ad.campaign_id
             campaigns.setdefault(campaign_id, []).append(placement)
 
         for campaign_id, placements in campaigns.items():
@@ -143,16 +145,11 @@ class PerformanceLoggingEngine:
             'forwards': 0,
         }
 
-        past_perfs = AdPerformance.objects.filter(ad_placement=placement)
-        for perf in past_perfs:
-            prev_performance['impressions'] += perf.impressions
-            prev_performance['clicks'] += perf.clicks
-            prev_performance['conversions'] += perf.conversions
-            prev_performance['reposts'] += perf.reposts
-            prev_performance['total_reactions'] += perf.total_reactions
-            prev_performance['total_replies'] += perf.total_replies
-            prev_performance['views'] += perf.views
-            prev_performance['forwards'] += perf.forwards
+        totals = AdPerformance.objects.filter(ad_placement=placement).aggregate(
+            **{field: Sum(field) for field in prev_performance}
+        )
+        for field, value in totals.items():
+            prev_performance[field] = value or 0
 
         return prev_performance
 
@@ -192,13 +189,17 @@ class PerformanceLoggingEngine:
         creator = placement.channel.owner
         campaign = placement.ad.campaign
 
-        past_perfs = AdPerformance.objects.filter(ad_placement=placement)
-        last_perf = past_perfs.order_by('-timestamp').first()
-        time_diff = timezone.now() - last_perf.timestamp if last_perf else None
+        # Served by the (ad_placement, -timestamp) index
+        last_timestamp = AdPerformance.objects.filter(
+            ad_placement=placement
+        ).order_by('-timestamp').values_list('timestamp', flat=True).first()
+        time_diff = timezone.now() - last_timestamp if last_timestamp else None
 
         with transaction.atomic():
             performance = AdPerformance.objects.create(
                 ad_placement=placement,
+                campaign=campaign,
+                advertiser=advertiser,
                 date=today,
                 impressions=delta['impressions'],
                 clicks=delta['clicks'],
@@ -239,6 +240,8 @@ class PerformanceLoggingEngine:
             campaign.total_spent = (campaign.total_spent or Decimal('0.00')) + delta['cost']
             campaign.save(update_fields=['total_spent'])
 
+            transaction.on_commit(lambda: publish_performance_tick(performance, campaign))
+
             logger.info(f": Logged AdPlacement {placement.id} | Δ Cost: {delta['cost']}")
 
     def _calculate_delta(self, prev_performance, current_snapshot, cpm):
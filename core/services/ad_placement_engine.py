@@ -3,12 +3,10 @@ from decimal import Decimal
 from django.db import transaction
 from django.utils import timezone
 from core.models import AdPlacement, PlacementMatchLog, Campaign
-from creators.models import CreatorReputation
 
 logger = logging.getLogger(__name__)
 
 class AdPlacementEngine:
-    FALLBACK_ENGAGEMENT = 0.15  # 15% engagement if no data
     MINIMUM_FUND = 100  # ETB
     OBJECTIVE_CONFIG = {
         'brand_awareness': {
@@ -52,20 +50,14 @@ class AdPlacementEngine:
         self.matched_channels = matched_channels_with_score
         self.config = self.OBJECTIVE_CONFIG.get(campaign.objective, self.OBJECTIVE_CONFIG['brand_awareness'])
 
-    def _estimate_cost(self, channel, engagement_rate: float) -> Decimal:
-        expected_views = max(channel.subscribers, 1) * engagement_rate
-        estimated_cost = Decimal((expected_views / 1000) * float(max(self.campaign.cpm, 0.01)))
-        return estimated_cost
+    def _estimate_cost(self, channel) -> Decimal:
+        return channel.cost_at_cpm(self.campaign.cpm)
 
     def _score_channel(self, channel, match_score: float) -> tuple[float, float]:
-        try:
-            reputation = channel.reputation
-        except CreatorReputation.DoesNotExist:
-            reputation = None
-
-        rating = reputation.rating if reputation else 5.0
-        fraud = reputation.fraud_score if reputation else 0.0
-        engagement_rate = getattr(reputation, 'avg_engagement_rate', self.FALLBACK_ENGAGEMENT)
+        # Reputation inputs come from the channel's cached pricing profile
+        rating = channel.reputation_rating if channel.reputation_rating is not None else 5.0
+        fraud = channel.reputation_fraud_score or 0.0
+        engagement_rate = channel.expected_engagement
         subscribers = channel.subscribers
 
         weights = self.config['weights']
@@ -112,8 +104,7 @@ class AdPlacementEngine:
                         assigned.append((channel.title, match_score))
 
                         if created:
-                            _, engagement_rate = self._score_channel(channel, match_score)
-                            estimated_cost = self._estimate_cost(channel, engagement_rate)
+                            estimated_cost = self._estimate_cost(channel)
 
                             PlacementMatchLog.objects.create(
                                 campaign=self.campaign,
@@ -141,7 +132,8 @@ class AdPlacementEngine:
             logger.error(f"No placements assigned for campaign {self.campaign.id}. Channels tried: {[c[0].title for c in self.matched_channels]}")
         return assigned
 
-    def activate_placements(self) -> list:
+    def activate_placements(self, channel_ids=None) -> list:
+        """Activates draft placements; `channel_ids` limits it to those channels (re-matching)."""
         activated = []
         skipped_due_to_budget = []
 
@@ -171,7 +163,11 @@ class AdPlacementEngine:
             logger.warning(f"Insufficient funds: {budget_remaining} ETB remaining in campaign {self.campaign.id}")
             return activated
 
-        draft_placements = AdPlacement.objects.filter(ad__campaign=self.campaign, status__in=['draft', 'completed'])
+        draft_placements = AdPlacement.objects.filter(
+            ad__campaign=self.campaign, status__in=['draft', 'completed']
+        ).select_related('channel')
+        if channel_ids is not None:
+            draft_placements = draft_placements.filter(channel_id__in=channel_ids)
         scored_channels = []
 
         for placement in draft_placements:
@@ -182,7 +178,7 @@ class AdPlacementEngine:
                 continue
 
             score, engagement = self._score_channel(channel, placement.preference_score)
-            cost = self._estimate_cost(channel, engagement)
+            cost = self._estimate_cost(channel)
             scored_channels.append((channel, score, engagement, cost))
 
         scored_channels.sort(key=lambda x: x[1], reverse=True)
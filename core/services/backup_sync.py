@@ -0,0 +1,362 @@
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, transaction
+from django.utils import timezone
+
+from core.models import BackupCheckpoint, BackupStatus
+
+logger = logging.getLogger(__name__)
+
+IGNORED_FIELDS = {'created_at', 'updated_at', 'last_login', 'date_joined', 'password'}
+WATERMARK_FIELDS = ('updated_at', 'last_seen', 'created_at', 'date_joined')
+
+
+class RowHashEncoder(DjangoJSONEncoder):
+    """DjangoJSONEncoder that falls back to str() for custom field values (e.g. PhoneNumber)."""
+
+    def default(self, o):
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+def get_row_hash(instance, ignore_fields=None):
+    """
+    Hash of an instance's concrete field values. Relations are read from
+    their `attname` (the raw FK id), so hashing never triggers a query.
+    """
+    if ignore_fields is None:
+        ignore_fields = IGNORED_FIELDS
+
+    data = {
+        field.attname: getattr(instance, field.attname)
+        for field in instance._meta.concrete_fields
+        if field.name not in ignore_fields
+    }
+    string = json.dumps(data, sort_keys=True, cls=RowHashEncoder)
+    return hashlib.md5(string.encode()).hexdigest()
+
+
+@contextmanager
+def preserve_auto_timestamps(model):
+    """
+    bulk_create runs `pre_save` on auto_now/auto_now_add fields, which would
+    stamp replica rows with the backup time. Switch them off while copying.
+    """
+    fields = [
+        field for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class ModelBackupSync:
+    """
+    Copies one model from `source` to `target` in PK-ordered keyset batches.
+    Each batch fetches the replica rows in one query, diffs row hashes in
+    memory and upserts the changed rows with a single
+    `bulk_create(update_conflicts=True)`.
+
+    In incremental mode only rows whose watermark field (`updated_at`,
+    falling back to `created_at` and friends) moved past the model's
+    BackupCheckpoint are read. M2M changes don't touch the owner's
+    watermark, so auto-created through tables are always diffed as
+    (owner, related) set differences over PK pages.
+    """
+
+    def __init__(self, model, source='default', target='supabase', batch_size=1000,
+                 incremental=False, dry_run=False, resume=False):
+        self.model = model
+        self.resume = resume
+        self.source = source
+        self.target = target
+        self.batch_size = batch_size
+        self.incremental = incremental
+        self.dry_run = dry_run
+        self.label = model._meta.label
+        self.stats = {'inserted': 0, 'updated': 0, 'skipped': 0, 'm2m_synced': 0}
+
+    @property
+    def watermark_field(self):
+        field_names = {field.name for field in self.model._meta.concrete_fields}
+        return next((name for name in WATERMARK_FIELDS if name in field_names), None)
+
+    def get_checkpoint(self):
+        lookup = {'model_label': self.label, 'target_db': self.target}
+        if self.dry_run:
+            return BackupCheckpoint.objects.using(self.source).filter(**lookup).first() \
+                or BackupCheckpoint(**lookup)
+        checkpoint, _ = BackupCheckpoint.objects.using(self.source).get_or_create(**lookup)
+        return checkpoint
+
+    def get_queryset(self, checkpoint):
+        qs = self.model._base_manager.using(self.source).order_by('pk')
+        if self.incremental and checkpoint.watermark and self.watermark_field:
+            qs = qs.filter(**{f"{self.watermark_field}__gte": checkpoint.watermark})
+        return qs
+
+    def iter_batches(self, qs, after_pk=None):
+        """Keyset pagination: WHERE pk > last_pk ORDER BY pk LIMIT batch_size."""
+        while True:
+            page = qs.filter(pk__gt=after_pk) if after_pk is not None else qs
+            batch = list(page[:self.batch_size])
+            if not batch:
+                return
+            yield batch
+            after_pk = batch[-1].pk
+
+    def run(self):
+        checkpoint = self.get_checkpoint()
+        after_pk = None
+        run_started = timezone.now()
+
+        if self.resume and checkpoint.status in (BackupStatus.RUNNING, BackupStatus.FAILED) \
+                and checkpoint.run_started_at:
+            # Pick up the interrupted run: same watermark, continue after its last PK
+            after_pk = checkpoint.last_pk
+            run_started = checkpoint.run_started_at
+            logger.info(f": Resuming {self.label} after pk={after_pk}")
+
+        qs = self.get_queryset(checkpoint)
+        self.save_checkpoint(checkpoint, status=BackupStatus.RUNNING, run_started_at=run_started,
+                             last_pk=after_pk, error='')
+
+        try:
+            for batch in self.iter_batches(qs, after_pk=after_pk):
+                self.sync_batch(batch)
+                self.save_checkpoint(checkpoint, last_pk=str(batch[-1].pk))
+
+            if self.m2m_fields():
+                self.sync_all_m2m()
+        except Exception as e:
+            self.save_checkpoint(checkpoint, status=BackupStatus.FAILED, error=str(e))
+            raise
+
+        self.save_checkpoint(
+            checkpoint,
+            status=BackupStatus.COMPLETED,
+            watermark=run_started,
+            last_run_at=timezone.now(),
+            last_pk=None,
+            rows_synced=self.stats['inserted'] + self.stats['updated'],
+        )
+        return self.stats
+
+    def save_checkpoint(self, checkpoint, **values):
+        if self.dry_run:
+            return
+        for field, value in values.items():
+            setattr(checkpoint, field, value)
+        checkpoint.save(using=self.source, update_fields=[*values, 'updated_at'])
+
+    def sync_batch(self, batch):
+        pks = [obj.pk for obj in batch]
+        replica = self.model._base_manager.using(self.target).in_bulk(pks)
+
+        changed = []
+        for obj in batch:
+            existing = replica.get(obj.pk)
+            if existing is None:
+                self.stats['inserted'] += 1
+                changed.append(obj)
+            elif get_row_hash(existing) != get_row_hash(obj):
+                self.stats['updated'] += 1
+                changed.append(obj)
+            else:
+                self.stats['skipped'] += 1
+
+        if changed and not self.dry_run:
+            with transaction.atomic(using=self.target):
+                self.upsert(changed)
+
+    def upsert(self, objs):
+        pk_field = self.model._meta.pk
+        update_fields = [
+            field.name for field in self.model._meta.concrete_fields if not field.primary_key
+        ]
+        with preserve_auto_timestamps(self.model):
+            if update_fields:
+                self.model._base_manager.using(self.target).bulk_create(
+                    objs,
+                    batch_size=self.batch_size,
+                    update_conflicts=True,
+                    unique_fields=[pk_field.name],
+                    update_fields=update_fields,
+                )
+            else:
+                self.model._base_manager.using(self.target).bulk_create(
+                    objs, batch_size=self.batch_size, ignore_conflicts=True
+                )
+
+    def m2m_fields(self):
+        return [
+            field for field in self.model._meta.many_to_many
+            if field.remote_field.through._meta.auto_created
+        ]
+
+    def sync_all_m2m(self):
+        pks = self.model._base_manager.using(self.source).order_by('pk').values_list('pk', flat=True)
+        after_pk = None
+        while True:
+            page = pks.filter(pk__gt=after_pk) if after_pk is not None else pks
+            batch = list(page[:self.batch_size])
+            if not batch:
+                return
+            with transaction.atomic(using=self.target):
+                self.stats['m2m_synced'] += self.sync_m2m(batch, write=not self.dry_run)
+            after_pk = batch[-1]
+
+    def sync_m2m(self, pks, write=True):
+        """Diff (source_id, target_id) pairs of each auto-created through table for these PKs."""
+        synced = 0
+        for field in self.m2m_fields():
+            through = field.remote_field.through
+            source_col = field.m2m_column_name()
+            target_col = field.m2m_reverse_name()
+            lookup = {f"{source_col}__in": pks}
+
+            wanted = set(through.objects.using(self.source).filter(**lookup).values_list(source_col, target_col))
+            current = set(through.objects.using(self.target).filter(**lookup).values_list(source_col, target_col))
+
+            missing = wanted - current
+            extra = current - wanted
+            if not missing and not extra:
+                continue
+            synced += len(missing) + len(extra)
+            if not write:
+                continue
+
+            if extra:
+                for owner_id in {owner_id for owner_id, _ in extra}:
+                    through.objects.using(self.target).filter(**{
+                        source_col: owner_id,
+                        f"{target_col}__in": [related for owner, related in extra if owner == owner_id],
+                    }).delete()
+            if missing:
+                through.objects.using(self.target).bulk_create(
+                    [through(**{source_col: owner_id, target_col: related_id}) for owner_id, related_id in missing],
+                    batch_size=self.batch_size,
+                    ignore_conflicts=True,
+                )
+        return synced
+
+
+def get_model_dependencies(model, candidates):
+    """Models (within `candidates`) whose rows must exist before `model` is copied."""
+    dependencies = set()
+    for field in model._meta.concrete_fields:
+        related = field.related_model if field.is_relation else None
+        if related and related is not model and related in candidates:
+            dependencies.add(related)
+    for field in model._meta.many_to_many:
+        if field.related_model is not model and field.related_model in candidates:
+            dependencies.add(field.related_model)
+    return dependencies
+
+
+def build_dependency_levels(models):
+    """
+    Topologically sorts models into levels from their FK/M2M relations.
+    Models in the same level don't reference each other and can be copied in
+    parallel. Models caught in a cycle are appended as a final level.
+    """
+    candidates = set(models)
+    pending = {model: get_model_dependencies(model, candidates) for model in models}
+    levels = []
+
+    while pending:
+        ready = [model for model, deps in pending.items() if not deps]
+        if not ready:
+            cyclic = sorted(pending, key=lambda m: m._meta.label)
+            logger.warning(f": Circular FK dependencies between {[m._meta.label for m in cyclic]}")
+            levels.append(cyclic)
+            break
+        ready.sort(key=lambda m: m._meta.label)
+        levels.append(ready)
+        for model in ready:
+            del pending[model]
+        for deps in pending.values():
+            deps.difference_update(ready)
+
+    return levels
+
+
+class ParallelBackupRunner:
+    """
+    Runs ModelBackupSync for many models, level by level in FK-dependency
+    order, with the models of each level spread over a thread pool. Django
+    connections are per thread, so every worker gets its own connection to
+    both databases and closes them when its model is done.
+    """
+
+    def __init__(self, models, workers=4, resume=False, on_result=None, **sync_options):
+        self.models = models
+        self.workers = max(workers, 1)
+        self.resume = resume
+        self.on_result = on_result
+        self.sync_options = sync_options
+
+    def pending_models(self):
+        if not self.resume:
+            return self.models
+        completed = set(BackupCheckpoint.objects.using(self.sync_options.get('source', 'default')).filter(
+            target_db=self.sync_options.get('target', 'supabase'),
+            status=BackupStatus.COMPLETED,
+        ).values_list('model_label', flat=True))
+        return [model for model in self.models if model._meta.label not in completed]
+
+    def reset_checkpoints(self):
+        """Mark every selected model pending, so `--resume` knows what this run still owes."""
+        if self.resume or self.sync_options.get('dry_run'):
+            return
+        source = self.sync_options.get('source', 'default')
+        target = self.sync_options.get('target', 'supabase')
+        labels = [model._meta.label for model in self.models]
+        existing = set(BackupCheckpoint.objects.using(source).filter(
+            target_db=target, model_label__in=labels
+        ).values_list('model_label', flat=True))
+        BackupCheckpoint.objects.using(source).bulk_create([
+            BackupCheckpoint(model_label=label, target_db=target)
+            for label in labels if label not in existing
+        ])
+        BackupCheckpoint.objects.using(source).filter(
+            target_db=target, model_label__in=labels
+        ).update(status=BackupStatus.PENDING, last_pk=None)
+
+    def sync_model(self, model):
+        try:
+            return ModelBackupSync(model, resume=self.resume, **self.sync_options).run()
+        finally:
+            connections.close_all()
+
+    def run(self):
+        self.reset_checkpoints()
+        results = {}
+
+        for level in build_dependency_levels(self.pending_models()):
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(level))) as executor:
+                futures = {executor.submit(self.sync_model, model): model for model in level}
+                for future in as_completed(futures):
+                    model = futures[future]
+                    try:
+                        stats, error = future.result(), None
+                    except Exception as e:
+                        stats, error = None, e
+                    results[model] = (stats, error)
+                    if self.on_result:
+                        self.on_result(model, stats, error)
+
+        return results
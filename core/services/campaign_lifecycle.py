@@ -0,0 +1,241 @@
+import logging
+
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Subquery
+from django.utils import timezone
+
+from core.models import Ad, AdPlacement, AdPlacementStatus, AdStatus, Campaign, Notification
+from core.services.ad_placement_engine import AdPlacementEngine
+from core.services.notification_service import NotificationService
+from core.services.placement_delivery import PlacementDeliveryBatch
+from core.utils.signals_utils import deferred_placement_posting
+from payments.services.payment_service import EscrowService
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignLifecycleService:
+    """
+    Applies one lifecycle action (approve, pause, resume, stop, or the
+    date-driven start / expire) to many campaigns in a single transaction.
+
+    Campaigns are validated up front, their statuses are written with one
+    UPDATE per target status (bypassing the per-save activation signal), and
+    placement activation runs with signal posting deferred. Telegram posting
+    and post deletion are collected into one PlacementDeliveryBatch that is
+    dispatched after commit.
+    """
+
+    TRANSITIONS = {
+        'approve': ([AdStatus.IN_REVIEW], AdStatus.ACTIVE),
+        'pause': ([AdStatus.ACTIVE], AdStatus.ON_HOLD),
+        'resume': ([AdStatus.ON_HOLD], AdStatus.ACTIVE),
+        'stop': ([AdStatus.ACTIVE, AdStatus.ON_HOLD], AdStatus.STOPPED),
+        # Date-driven transitions, used by the schedule sweeper
+        'start': ([AdStatus.SCHEDULED], AdStatus.ACTIVE),
+        'expire': ([AdStatus.ACTIVE, AdStatus.SCHEDULED, AdStatus.ON_HOLD], AdStatus.COMPLETED),
+    }
+    ACTIVATING_ACTIONS = ('approve', 'resume', 'start')
+    LIVE_STATUSES = [AdPlacementStatus.RUNNING, AdPlacementStatus.PAUSED]
+    # Live or in-flight placements a pause parks; finished or rejected ones are left alone
+    PAUSABLE_STATUSES = [
+        AdPlacementStatus.RUNNING,
+        AdPlacementStatus.APPROVED,
+        AdPlacementStatus.PENDING,
+        AdPlacementStatus.DRAFT,
+    ]
+    STOPPABLE_STATUSES = [
+        AdPlacementStatus.DRAFT,
+        AdPlacementStatus.PENDING,
+        AdPlacementStatus.APPROVED,
+        AdPlacementStatus.PAUSED,
+    ]
+
+    def __init__(self, action, campaign_ids, advertiser=None, background_delivery=True):
+        if action not in self.TRANSITIONS:
+            raise ValueError(f"Unknown campaign action '{action}'")
+        self.action = action
+        self.campaign_ids = list(dict.fromkeys(str(pk) for pk in campaign_ids))
+        self.advertiser = advertiser
+        self.background_delivery = background_delivery
+        self.updated = []
+        self.failed = []
+        self.delivery = None
+
+    def get_queryset(self):
+        qs = Campaign.objects.select_for_update().filter(pk__in=self.campaign_ids)
+        if self.advertiser is not None:
+            qs = qs.filter(advertiser=self.advertiser)
+        active_ads = Ad.objects.filter(campaign=OuterRef('pk'), is_active=True)
+        return qs.annotate(
+            has_active_ads=Exists(active_ads),
+            ad_headline=Subquery(active_ads.values('headline')[:1]),
+        )
+
+    def validate(self, campaigns):
+        allowed, _ = self.TRANSITIONS[self.action]
+        found = {str(campaign.pk) for campaign in campaigns}
+        self.failed += [{'id': pk, 'error': 'Campaign not found'} for pk in self.campaign_ids if pk not in found]
+
+        valid = []
+        for campaign in campaigns:
+            if campaign.status not in allowed:
+                self.failed.append({
+                    'id': str(campaign.pk),
+                    'error': f"Cannot {self.action} a campaign in status '{campaign.status}'",
+                })
+            elif self.action in self.ACTIVATING_ACTIONS and not campaign.has_active_ads:
+                self.failed.append({'id': str(campaign.pk), 'error': 'Campaign has no active ads'})
+            else:
+                valid.append(campaign)
+        return valid
+
+    def target_status(self, campaign):
+        _, status = self.TRANSITIONS[self.action]
+        if status != AdStatus.ACTIVE:
+            return status
+        # Same date window checks as process_campaign_activation
+        today = timezone.now().date()
+        if campaign.end_date and campaign.end_date < today:
+            return AdStatus.COMPLETED
+        if campaign.start_date and campaign.start_date > today:
+            return AdStatus.SCHEDULED
+        return status
+
+    def update_statuses(self, campaigns):
+        by_status = {}
+        for campaign in campaigns:
+            by_status.setdefault(self.target_status(campaign), []).append(campaign)
+
+        now = timezone.now()
+        for status, group in by_status.items():
+            Campaign.objects.filter(pk__in=[campaign.pk for campaign in group]).update(status=status, updated_at=now)
+            for campaign in group:
+                campaign.status = status
+                campaign._snapshot_tracked_fields(['status'])
+        return by_status.get(AdStatus.ACTIVE, [])
+
+    def activate(self, campaigns):
+        ids = [campaign.pk for campaign in campaigns]
+        if self.action == 'resume':
+            self.resume_placements(ids)
+
+        with deferred_placement_posting():
+            for campaign in campaigns:
+                activated = AdPlacementEngine(campaign, []).activate_placements()
+                logger.info(f": Activated {len(activated)} placements for campaign {campaign.id}")
+
+        return list(AdPlacement.objects.filter(
+            ad__campaign_id__in=ids, status=AdPlacementStatus.APPROVED
+        ).values_list('pk', flat=True))
+
+    def pause(self, campaigns):
+        self.pause_placements([campaign.pk for campaign in campaigns])
+
+    @classmethod
+    def pause_placements(cls, campaign_ids):
+        """Parks the campaigns' live and in-flight placements, remembering each one's status."""
+        placements = AdPlacement.objects.filter(ad__campaign_id__in=campaign_ids)
+        now = timezone.now()
+        for status in cls.PAUSABLE_STATUSES:
+            placements.filter(status=status).update(
+                status=AdPlacementStatus.PAUSED, paused_from_status=status, updated_at=now
+            )
+
+    @staticmethod
+    def resume_placements(campaign_ids):
+        """
+        Puts placements parked by `pause_placements` back in the status they
+        had. Paused rows without a recorded status are left for review.
+        """
+        AdPlacement.objects.filter(
+            ad__campaign_id__in=campaign_ids,
+            status=AdPlacementStatus.PAUSED,
+            paused_from_status__isnull=False,
+        ).update(status=F('paused_from_status'), paused_from_status=None, updated_at=timezone.now())
+
+    def cancel_escrows(self, campaigns):
+        """Refunds pending escrows; a campaign whose refund fails is left untouched."""
+        cancelled = []
+        for campaign in campaigns:
+            try:
+                with transaction.atomic():
+                    for escrow in campaign.escrows.filter(status='pending'):
+                        EscrowService.cancel(escrow.id)
+                cancelled.append(campaign)
+            except Exception as e:
+                logger.error(f": Failed to cancel escrows for campaign {campaign.id}: {str(e)}")
+                self.failed.append({'id': str(campaign.pk), 'error': f"Failed to cancel escrow: {str(e)}"})
+        return cancelled
+
+    def end_placements(self, campaigns, status):
+        """Moves not-yet-live placements to `status` and returns the live ones whose posts must be deleted."""
+        ids = [campaign.pk for campaign in campaigns]
+        placements = AdPlacement.objects.filter(ad__campaign_id__in=ids)
+        delete_ids = list(placements.filter(
+            status__in=self.LIVE_STATUSES, content_platform_id__isnull=False
+        ).values_list('pk', flat=True))
+        placements.filter(status__in=self.STOPPABLE_STATUSES).exclude(pk__in=delete_ids).update(
+            status=status, paused_from_status=None, updated_at=timezone.now()
+        )
+        return delete_ids
+
+    def notify_approved(self, campaigns):
+        NotificationService.bulk_create([
+            Notification(
+                user_id=campaign.advertiser_id,
+                title=f"Ad Placement {campaign.status.title()}",
+                message=(
+                    f"Your ad '{campaign.ad_headline}' in campaign '{campaign.name}' "
+                    f"has been Approved and is now Live"
+                ),
+                type='campaign_approved',
+            )
+            for campaign in campaigns
+        ])
+
+    def run(self):
+        post_ids, delete_ids = [], []
+
+        with transaction.atomic():
+            campaigns = self.validate(list(self.get_queryset()))
+            if self.action == 'stop':
+                campaigns = self.cancel_escrows(campaigns)
+            if not campaigns:
+                return self.result()
+
+            activated = self.update_statuses(campaigns)
+            if self.action in self.ACTIVATING_ACTIONS:
+                post_ids = self.activate(activated)
+            elif self.action == 'pause':
+                self.pause(campaigns)
+            elif self.action == 'stop':
+                delete_ids = self.end_placements(campaigns, AdPlacementStatus.STOPPED)
+            elif self.action == 'expire':
+                delete_ids = self.end_placements(campaigns, AdPlacementStatus.EXPIRED)
+
+            if self.action == 'approve':
+                self.notify_approved(activated)
+
+            self.updated = [{'id': str(campaign.pk), 'status': campaign.status} for campaign in campaigns]
+            self.delivery = PlacementDeliveryBatch(
+                post_ids=post_ids,
+                delete_ids=delete_ids,
+                deleted_status=AdPlacementStatus.EXPIRED if self.action == 'expire' else AdPlacementStatus.STOPPED,
+            )
+            transaction.on_commit(lambda: self.delivery.dispatch(background=self.background_delivery))
+
+        logger.info(
+            f": Bulk {self.action} | {len(self.updated)} campaigns updated, {len(self.failed)} failed, "
+            f"{len(post_ids)} posts and {len(delete_ids)} deletions queued"
+        )
+        return self.result()
+
+    def result(self):
+        return {
+            'action': self.action,
+            'updated': self.updated,
+            'failed': self.failed,
+            'queued_posts': len(self.delivery.post_ids) if self.delivery else 0,
+            'queued_deletions': len(self.delivery.delete_ids) if self.delivery else 0,
+        }
@@ -0,0 +1,87 @@
+import logging
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import AdPlacement, AdPlacementStatus, Campaign
+from core.services.matching_engine import CampaignChannelMatcher
+from core.services.ad_placement_engine import AdPlacementEngine
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignRematcher:
+    """
+    Diff-based re-matching for an active campaign whose budget, CPM,
+    objective or targeting changed. Instead of re-running the whole
+    activation it compares the channels eligible under the new settings
+    with the campaign's existing placements:
+
+      - entering: ranked channels with no placement yet (or only draft /
+        previously dropped ones) get draft placements, to be activated;
+      - leaving: channels that no longer pass the eligibility filter have
+        their not-yet-live placements (draft/pending/approved) stopped.
+
+    Placements that are live or finished are left alone.
+    """
+
+    TOP_N = 25
+    REUSABLE_STATUSES = {AdPlacementStatus.DRAFT, AdPlacementStatus.STOPPED}
+    DROPPABLE_STATUSES = [AdPlacementStatus.DRAFT, AdPlacementStatus.PENDING, AdPlacementStatus.APPROVED]
+
+    def __init__(self, campaign: Campaign):
+        self.campaign = campaign
+
+    def placement_statuses(self):
+        """{channel_id: set of placement statuses} across the campaign's ads."""
+        statuses = {}
+        for channel_id, placement_status in AdPlacement.objects.filter(
+            ad__campaign=self.campaign
+        ).values_list('channel_id', 'status'):
+            statuses.setdefault(channel_id, set()).add(placement_status)
+        return statuses
+
+    def diff(self):
+        matcher = CampaignChannelMatcher(self.campaign)
+        eligible_ids = set(matcher.get_eligible_channels().values_list('id', flat=True))
+        ranked = matcher.get_ranked_channels(top_n=self.TOP_N)
+        statuses = self.placement_statuses()
+
+        entering = [
+            (channel, score, cost) for channel, score, cost in ranked
+            if statuses.get(channel.id, set()) <= self.REUSABLE_STATUSES
+        ]
+        leaving = [
+            channel_id for channel_id, channel_statuses in statuses.items()
+            if channel_id not in eligible_ids and channel_statuses & set(self.DROPPABLE_STATUSES)
+        ]
+        return entering, leaving
+
+    def run(self):
+        """Applies the diff and returns the ids of the channels that entered."""
+        entering, leaving = self.diff()
+        entering_ids = [channel.id for channel, _, _ in entering]
+
+        with transaction.atomic():
+            if leaving:
+                dropped = AdPlacement.objects.filter(
+                    ad__campaign=self.campaign,
+                    channel_id__in=leaving,
+                    status__in=self.DROPPABLE_STATUSES,
+                ).update(status=AdPlacementStatus.STOPPED, updated_at=timezone.now())
+                logger.info(f": Re-match dropped {dropped} placements for campaign {self.campaign.id}")
+
+            if entering:
+                # Channels dropped by an earlier re-match become assignable again
+                AdPlacement.objects.filter(
+                    ad__campaign=self.campaign,
+                    channel_id__in=entering_ids,
+                    status=AdPlacementStatus.STOPPED,
+                ).update(status=AdPlacementStatus.DRAFT, updated_at=timezone.now())
+                AdPlacementEngine(self.campaign, entering).assign_placements()
+
+        logger.info(
+            f": Re-match for campaign {self.campaign.id} | "
+            f"{len(entering_ids)} entering, {len(leaving)} leaving"
+        )
+        return entering_ids
@@ -0,0 +1,117 @@
+import logging
+from datetime import timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+
+from core.models import AdPlacement, AdPlacementStatus, AdStatus, Campaign
+from core.services.campaign_lifecycle import CampaignLifecycleService
+from core.services.placement_delivery import PlacementDeliveryBatch
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignScheduleSweeper:
+    """
+    Moves campaigns across their date boundaries without waiting for user
+    activity: campaigns past `end_date` are completed (live posts deleted)
+    and scheduled campaigns whose `start_date` arrived are activated and
+    posted. Candidates come from the (status, start_date) / (status, end_date)
+    indexes and are transitioned `batch_size` at a time through
+    CampaignLifecycleService.
+
+    It also finishes Telegram deliveries that never ran: the API and admin
+    dispatch them on a background thread after commit, which a worker
+    restart can drop. Approved placements of active campaigns still without
+    a post, and live posts of stopped/completed campaigns, are delivered
+    once they are older than DELIVERY_GRACE (and younger than
+    DELIVERY_WINDOW, so old data is never touched).
+    """
+
+    DELIVERY_GRACE = timedelta(minutes=10)
+    DELIVERY_WINDOW = timedelta(days=2)
+
+    def __init__(self, batch_size=100, today=None):
+        self.batch_size = batch_size
+        self.today = today or timezone.now().date()
+
+    def expiring(self):
+        allowed, _ = CampaignLifecycleService.TRANSITIONS['expire']
+        return Campaign.objects.filter(status__in=allowed, end_date__lt=self.today)
+
+    def starting(self):
+        return Campaign.objects.filter(
+            Q(end_date__isnull=True) | Q(end_date__gte=self.today),
+            status=AdStatus.SCHEDULED,
+            start_date__lte=self.today,
+        )
+
+    def undelivered_posts(self, now):
+        return AdPlacement.objects.filter(
+            status=AdPlacementStatus.APPROVED,
+            content_platform_id__isnull=True,
+            ad__campaign__status=AdStatus.ACTIVE,
+            updated_at__range=(now - self.DELIVERY_WINDOW, now - self.DELIVERY_GRACE),
+        )
+
+    def undeleted_posts(self, now, campaign_status):
+        # The campaign's updated_at is when the stop/expire that queued the deletion ran
+        return AdPlacement.objects.filter(
+            status__in=CampaignLifecycleService.LIVE_STATUSES,
+            content_platform_id__isnull=False,
+            ad__campaign__status=campaign_status,
+            ad__campaign__updated_at__range=(now - self.DELIVERY_WINDOW, now - self.DELIVERY_GRACE),
+        )
+
+    def redeliver(self, dry_run=False):
+        """Runs deliveries lost after their lifecycle change committed."""
+        now = timezone.now()
+        post_ids = list(self.undelivered_posts(now).values_list('pk', flat=True))
+        deletions = {
+            status: list(self.undeleted_posts(now, campaign_status).values_list('pk', flat=True))
+            for campaign_status, status in (
+                (AdStatus.STOPPED, AdPlacementStatus.STOPPED),
+                (AdStatus.COMPLETED, AdPlacementStatus.EXPIRED),
+            )
+        }
+        totals = {'posts': len(post_ids), 'deletions': sum(len(ids) for ids in deletions.values()), 'failed': 0}
+        if dry_run or not (totals['posts'] or totals['deletions']):
+            return totals
+
+        batches = [PlacementDeliveryBatch(post_ids=post_ids)]
+        batches += [PlacementDeliveryBatch(delete_ids=ids, deleted_status=status) for status, ids in deletions.items()]
+        for batch in batches:
+            if batch:
+                stats = batch.run()
+                totals['failed'] += stats['post_failed'] + stats['delete_failed']
+
+        logger.info(f": Schedule sweep redelivery | {totals}")
+        return totals
+
+    def sweep(self, action, queryset, dry_run=False):
+        ids = list(queryset.order_by('pk').values_list('pk', flat=True))
+        totals = {'campaigns': len(ids), 'updated': 0, 'failed': 0, 'posts': 0, 'deletions': 0}
+        if dry_run:
+            return totals
+
+        for start in range(0, len(ids), self.batch_size):
+            result = CampaignLifecycleService(
+                action, ids[start:start + self.batch_size], background_delivery=False
+            ).run()
+            totals['updated'] += len(result['updated'])
+            totals['failed'] += len(result['failed'])
+            totals['posts'] += result['queued_posts']
+            totals['deletions'] += result['queued_deletions']
+            for failure in result['failed']:
+                logger.warning(f": Schedule sweep could not {action} campaign {failure['id']}: {failure['error']}")
+
+        logger.info(f": Schedule sweep {action} | {totals}")
+        return totals
+
+    def run(self, dry_run=False):
+        # Expire first so a campaign whose whole window passed is never started
+        return {
+            'expire': self.sweep('expire', self.expiring(), dry_run=dry_run),
+            'start': self.sweep('start', self.starting(), dry_run=dry_run),
+            'redeliver': self.redeliver(dry_run=dry_run),
+        }
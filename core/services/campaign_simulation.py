@@ -0,0 +1,119 @@
+import hashlib
+import json
+import logging
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+from core.models import Campaign, Category, Language
+from core.services.matching_engine import CampaignChannelMatcher
+from core.services.ad_placement_engine import AdPlacementEngine
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignSimulationService:
+    """
+    Read-only dry run of matching + activation for a set of targeting
+    parameters. An unsaved Campaign is ranked by CampaignChannelMatcher and
+    re-scored with AdPlacementEngine's objective weights, then the same
+    max_channels / budget cut as `activate_placements` is applied. Nothing is
+    written and no Telegram delivery is triggered.
+
+    Results are cached by a hash of the normalized targeting parameters, so
+    repeated previews while an advertiser iterates are served from cache.
+    """
+
+    CACHE_PREFIX = 'campaign_simulation'
+    CACHE_TTL = 300  # seconds
+    TOP_N = 25  # same pool size as campaign submission
+
+    def __init__(self, objective, initial_budget, cpm, targeting_categories=(),
+                 targeting_languages=(), targeting_regions=None):
+        # Typed ids for the matcher, which compares them with category.id / language.id
+        self.category_ids = {Category._meta.pk.to_python(pk) for pk in targeting_categories}
+        self.language_ids = {Language._meta.pk.to_python(pk) for pk in targeting_languages}
+        # Normalized for the cache key only
+        self.params = {
+            'objective': objective,
+            'initial_budget': Decimal(initial_budget),
+            'cpm': Decimal(cpm),
+            'targeting_categories': sorted(str(pk) for pk in self.category_ids),
+            'targeting_languages': sorted(str(pk) for pk in self.language_ids),
+            'targeting_regions': {
+                'countries': sorted((targeting_regions or {}).get('countries', [])),
+            },
+        }
+
+    def cache_key(self):
+        raw = json.dumps(self.params, sort_keys=True, cls=DjangoJSONEncoder)
+        return f"{self.CACHE_PREFIX}:{hashlib.md5(raw.encode()).hexdigest()}"
+
+    def build_campaign(self):
+        return Campaign(
+            objective=self.params['objective'],
+            initial_budget=self.params['initial_budget'],
+            cpm=self.params['cpm'],
+            targeting_regions=self.params['targeting_regions'],
+        )
+
+    def simulate(self):
+        campaign = self.build_campaign()
+        matcher = CampaignChannelMatcher(
+            campaign,
+            categories=self.category_ids,
+            languages=self.language_ids,
+        )
+        ranked = matcher.get_ranked_channels(top_n=self.TOP_N)
+        engine = AdPlacementEngine(campaign, ranked)
+
+        scored = []
+        for channel, match_score, _ in ranked:
+            score, engagement = engine._score_channel(channel, match_score)
+            scored.append((channel, match_score, score, engagement, engine._estimate_cost(channel)))
+        scored.sort(key=lambda x: x[2], reverse=True)
+
+        budget_remaining = campaign.initial_budget
+        channels, skipped_due_to_budget = [], 0
+        for channel, match_score, score, engagement, cost in scored:
+            if len(channels) >= engine.config['max_channels']:
+                break
+            if cost > budget_remaining:
+                skipped_due_to_budget += 1
+                continue
+            budget_remaining -= cost
+            channels.append({
+                'id': str(channel.id),
+                'title': channel.title,
+                'pp_url': channel.pp_url,
+                'subscribers': channel.subscribers,
+                'match_score': match_score,
+                'score': score,
+                'engagement_rate': engagement,
+                'estimated_views': channel.expected_views,
+                'estimated_cost': round(cost, 2),
+            })
+
+        estimated_cost = campaign.initial_budget - budget_remaining
+        return {
+            'channels': channels,
+            'total_channels': len(channels),
+            'eligible_channels': len(ranked),
+            'skipped_due_to_budget': skipped_due_to_budget,
+            'estimated_views': sum(item['estimated_views'] for item in channels),
+            'estimated_cost': round(estimated_cost, 2),
+            'remaining_budget': round(budget_remaining, 2),
+        }
+
+    def run(self):
+        """Returns (result, cached)."""
+        key = self.cache_key()
+        result = cache.get(key)
+        if result is not None:
+            return result, True
+
+        result = self.simulate()
+        cache.set(key, result, self.CACHE_TTL)
+        logger.info(f": Campaign simulation cached | {result['total_channels']} channels, key={key}")
+        return result, False
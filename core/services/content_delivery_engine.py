@@ -25,7 +25,8 @@ class ContentDeliveryService:
             if result["success"]:
                 placement.content_platform_id = result["link"]
                 placement.status = AdPlacementStatus.RUNNING
-                placement.save(update_fields=["content_platform_id", "status"])
+                placement.next_repost_at = placement.compute_next_repost_at()
+                placement.save(update_fields=["content_platform_id", "status", "next_repost_at"])
                 logger.info(f"Posted to Telegram for placement {placement.id}, channel {placement.channel.title}")
                 return result
             else:
@@ -55,7 +56,8 @@ class ContentDeliveryService:
             result = self.bot_util.delete_message_from_channel(channel_id, message_id)
             if result["success"]:
                 placement.status = AdPlacementStatus.STOPPED
-                placement.save(update_fields=["status"])
+                placement.next_repost_at = None
+                placement.save(update_fields=["status", "next_repost_at"])
                 logger.info(f"Deleted Telegram post for placement {placement.id}, channel {placement.channel.title}")
             else:
                 logger.error(f"Failed to delete Telegram post for placement {placement.id}: {result['error']}")
@@ -68,6 +70,7 @@ class ContentDeliveryService:
 
     def remove_and_repost(self, placement, new_content=None):
         """Remove an existing post and repost with new or original content, updating the model."""
+        delete_result = {"success": False}
         try:
             # Delete the existing post
             delete_result = self.delete_from_channel(placement)
@@ -98,7 +101,8 @@ class ContentDeliveryService:
                 placement.content_platform_id = result["link"]
                 placement.status = AdPlacementStatus.RUNNING
                 placement.repost_count += 1
-                placement.save(update_fields=["content_platform_id", "status", "repost_count"])
+                placement.next_repost_at = placement.compute_next_repost_at()
+                placement.save(update_fields=["content_platform_id", "status", "repost_count", "next_repost_at"])
                 logger.info(f"Reposted to Telegram for placement {placement.id}, channel {placement.channel.title}, new link: {result['link']}")
                 return {
                     "success": True,
@@ -109,6 +113,12 @@ class ContentDeliveryService:
         except Exception as e:
             logger.error(f"Failed to remove and repost for placement {placement.id}: {str(e)}")
             self.bot_util.notify_admin_failure(placement, str(e))
+            if delete_result["success"]:
+                # The old post is gone: keep the placement running, without its dead link, and retry the repost
+                placement.status = AdPlacementStatus.RUNNING
+                placement.content_platform_id = None
+                placement.next_repost_at = timezone.now() + AdPlacement.REPOST_RETRY_DELAY
+                placement.save(update_fields=["content_platform_id", "status", "next_repost_at"])
             return {"success": False, "error": str(e)}
 
     def bulk_post_to_channels(self, data_dict):
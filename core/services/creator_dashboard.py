@@ -0,0 +1,70 @@
+import logging
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+class CreatorDashboardCache:
+    """
+    Per-creator cache for the dashboard, split into independently invalidated
+    fragments:
+
+      - earnings: monthly / weekly earnings chart (AdPerformance)
+      - balance: balance summary and payment methods (Balance, Transaction,
+        WithdrawalRequest, UserPaymentMethod)
+      - placements: top channels and active placements (CreatorChannel,
+        AdPlacement, AdPerformance)
+      - notifications: unread notifications and the unread count
+      - activity: recent admin LogEntry rows
+
+    Every fragment carries a version number per user; invalidating a fragment
+    bumps its version, which orphans all cached variants of it (API payload,
+    Mini App context, ...) at once. Writes that bypass signals (queryset
+    .update(), bulk_create) either invalidate explicitly or are bounded by
+    CACHE_TTL.
+    """
+
+    CACHE_PREFIX = 'creator_dashboard'
+    CACHE_TTL = 300  # seconds
+    FRAGMENTS = ('earnings', 'balance', 'placements', 'notifications', 'activity')
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self._versions = None
+
+    @classmethod
+    def version_key(cls, user_id, fragment):
+        return f"{cls.CACHE_PREFIX}:{user_id}:{fragment}:version"
+
+    def versions(self):
+        if self._versions is None:
+            keys = {fragment: self.version_key(self.user_id, fragment) for fragment in self.FRAGMENTS}
+            stored = cache.get_many(keys.values())
+            self._versions = {fragment: stored.get(key, 0) for fragment, key in keys.items()}
+        return self._versions
+
+    def key(self, fragment, variant):
+        return f"{self.CACHE_PREFIX}:{self.user_id}:{fragment}:v{self.versions()[fragment]}:{variant}"
+
+    def get(self, fragment, variant, build):
+        """Returns the cached fragment, calling `build()` and caching its result on a miss."""
+        key = self.key(fragment, variant)
+        value = cache.get(key)
+        if value is None:
+            value = build()
+            cache.set(key, value, self.CACHE_TTL)
+        return value
+
+    @classmethod
+    def invalidate(cls, user_id, *fragments):
+        if not user_id:
+            return
+        for fragment in fragments or cls.FRAGMENTS:
+            key = cls.version_key(user_id, fragment)
+            try:
+                cache.incr(key)
+            except ValueError:
+                # No version stored yet: anything cached so far was written under v0
+                cache.set(key, 1, None)
+        logger.debug(f": Invalidated dashboard fragments {fragments or cls.FRAGMENTS} for user {user_id}")
@@ -0,0 +1,246 @@
+import logging
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Min, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from creators.models import CreatorChannel
+from miniapp.models import DailyStat, TelegramVisitorLog
+from payments.models import UserPaymentMethod
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+class DailyStatsService:
+    """
+    Pre-aggregated admin analytics in DailyStat.
+
+    Flow metrics count what happened on a local day (signups, logins, new
+    channels, visits). Closed days are recomputed from the source tables by
+    the nightly `snapshot_daily_stats` command; the current day is kept up
+    to date by `record()` calls from signals and the visitor log flusher.
+
+    Gauge metrics are the state of the platform (users by type, channels by
+    category, ...) and are stored once per day; readers use the latest and
+    re-take today's snapshot once it is older than GAUGE_TTL.
+
+    When the source tables go back further than the stored flow rows (the
+    first run), the command backfills every day since the oldest source row.
+    """
+
+    FLOW_METRICS = (
+        'new_users',
+        'active_users',
+        'new_channels',
+        'new_reach',
+        'new_channels_by_language',
+        'visitors',
+        'visitors_by_device',
+        'visitors_by_os',
+        'visitors_premium',
+    )
+    GAUGE_METRICS = ('users_by_type', 'channels_by_category', 'payment_methods', 'total_reach')
+
+    ACTIVE_CACHE_PREFIX = 'daily_stats:active'
+    GAUGE_TTL = 300  # seconds
+    GAUGE_LOCK_KEY = 'daily_stats:gauge_refresh'
+
+    @staticmethod
+    def day_start(day):
+        return timezone.make_aware(datetime.combine(day, time.min))
+
+    # ─── Same-day counters ───
+
+    @staticmethod
+    def increment(counts, day=None):
+        """Adds {(metric, key): amount} to the counters of `day` (today by default)."""
+        day = day or timezone.localdate()
+        for (metric, key), amount in counts.items():
+            if not amount:
+                continue
+            rows = DailyStat.objects.filter(date=day, metric=metric, key=key)
+            if rows.update(value=F('value') + amount):
+                continue
+            try:
+                with transaction.atomic():
+                    DailyStat.objects.create(date=day, metric=metric, key=key, value=amount)
+            except IntegrityError:
+                # Created concurrently
+                rows.update(value=F('value') + amount)
+
+    @classmethod
+    def record(cls, counts, day=None):
+        """Increments once the current transaction commits; failures never reach the caller."""
+        def run():
+            try:
+                cls.increment(counts, day)
+            except Exception as e:
+                logger.error(f": Failed to record daily stats {dict(counts)}: {str(e)}")
+
+        transaction.on_commit(run)
+
+    @classmethod
+    def record_login(cls, user):
+        """Counts a user towards today's active users once per day."""
+        day = timezone.localdate()
+        if cache.add(f"{cls.ACTIVE_CACHE_PREFIX}:{day}:{user.pk}", 1, 2 * 86400):
+            cls.record({('active_users', ''): 1}, day)
+
+    @classmethod
+    def record_visits(cls, rows):
+        """Counts flushed TelegramVisitorLog rows, grouped by their local day."""
+        by_day = defaultdict(lambda: defaultdict(int))
+        for row in rows:
+            counts = by_day[timezone.localdate(row.timestamp)]
+            counts[('visitors', '')] += 1
+            counts[('visitors_by_device', row.device_type or '')] += 1
+            counts[('visitors_by_os', row.os or '')] += 1
+            counts[('visitors_premium', 'premium' if row.is_premium else 'non_premium')] += 1
+        for day, counts in by_day.items():
+            cls.record(counts, day)
+
+    # ─── Snapshots ───
+
+    @classmethod
+    def compute_flows(cls, start, end):
+        """{(day, metric, key): value} from the source tables for the local days start..end."""
+        window = {'gte': cls.day_start(start), 'lt': cls.day_start(end + timedelta(days=1))}
+
+        def per_day(queryset, field, *keys, **aggregates):
+            return queryset.filter(**{f"{field}__{op}": value for op, value in window.items()}).annotate(
+                day=TruncDate(field)
+            ).order_by().values('day', *keys).annotate(**aggregates)
+
+        values = defaultdict(int)
+        for row in per_day(User.objects, 'date_joined', total=Count('id')):
+            values[(row['day'], 'new_users', '')] = row['total']
+        for row in per_day(User.objects, 'last_login', total=Count('id')):
+            values[(row['day'], 'active_users', '')] = row['total']
+        for row in per_day(CreatorChannel.objects, 'created_at', total=Count('id'), reach=Sum('subscribers')):
+            values[(row['day'], 'new_channels', '')] = row['total']
+            values[(row['day'], 'new_reach', '')] = row['reach'] or 0
+        for row in per_day(CreatorChannel.objects.filter(language__isnull=False), 'created_at', 'language', total=Count('id')):
+            values[(row['day'], 'new_channels_by_language', str(row['language']))] = row['total']
+        visits = per_day(TelegramVisitorLog.objects, 'timestamp', 'device_type', 'os', 'is_premium', total=Count('id'))
+        for row in visits:
+            day, total = row['day'], row['total']
+            values[(day, 'visitors', '')] += total
+            values[(day, 'visitors_by_device', row['device_type'] or '')] += total
+            values[(day, 'visitors_by_os', row['os'] or '')] += total
+            values[(day, 'visitors_premium', 'premium' if row['is_premium'] else 'non_premium')] += total
+        return values
+
+    @staticmethod
+    def compute_gauges():
+        """{(metric, key): value} describing the platform right now."""
+        values = {}
+        for row in User.objects.order_by().values('user_type').annotate(total=Count('id')):
+            values[('users_by_type', row['user_type'] or '')] = row['total']
+        channels = CreatorChannel.objects.filter(category__isnull=False).order_by().values('category')
+        for row in channels.annotate(total=Count('id')):
+            values[('channels_by_category', str(row['category']))] = row['total']
+        methods = UserPaymentMethod.objects.order_by().values('payment_method_type__name')
+        for row in methods.annotate(total=Count('id')):
+            values[('payment_methods', row['payment_method_type__name'] or '')] = row['total']
+        values[('total_reach', '')] = CreatorChannel.objects.aggregate(total=Sum('subscribers'))['total'] or 0
+        return values
+
+    @classmethod
+    def snapshot_flows(cls, start, end):
+        """Replaces the flow metrics of the local days start..end; returns the number of rows written."""
+        flows = cls.compute_flows(start, end)
+        with transaction.atomic():
+            # `last_login` only remembers a user's latest day, so a live count can be higher
+            counted = DailyStat.objects.filter(metric='active_users', key='', date__range=(start, end))
+            for day, value in counted.values_list('date', 'value'):
+                flows[(day, 'active_users', '')] = max(flows.get((day, 'active_users', ''), 0), value)
+
+            DailyStat.objects.filter(metric__in=cls.FLOW_METRICS, date__range=(start, end)).delete()
+            created = DailyStat.objects.bulk_create(
+                [DailyStat(date=day, metric=metric, key=key, value=value)
+                 for (day, metric, key), value in flows.items() if value],
+                batch_size=500,
+            )
+        return len(created)
+
+    @staticmethod
+    def first_day():
+        """Local date of the oldest row the flow metrics are built from, or None."""
+        firsts = [
+            User.objects.aggregate(first=Min('date_joined'))['first'],
+            CreatorChannel.objects.aggregate(first=Min('created_at'))['first'],
+            TelegramVisitorLog.objects.aggregate(first=Min('timestamp'))['first'],
+        ]
+        firsts = [first for first in firsts if first]
+        return timezone.localdate(min(firsts)) if firsts else None
+
+    @classmethod
+    def history_start(cls):
+        """Oldest day with flow metrics, or None before the first snapshot."""
+        return DailyStat.objects.filter(metric__in=cls.FLOW_METRICS).aggregate(first=Min('date'))['first']
+
+    @classmethod
+    def snapshot_gauges(cls, day=None):
+        day = day or timezone.localdate()
+        gauges = cls.compute_gauges()
+        with transaction.atomic():
+            DailyStat.objects.filter(metric__in=cls.GAUGE_METRICS, date=day).delete()
+            DailyStat.objects.bulk_create(
+                [DailyStat(date=day, metric=metric, key=key, value=value) for (metric, key), value in gauges.items()]
+            )
+        return len(gauges)
+
+    # ─── Reading ───
+
+    @staticmethod
+    def daily(start, metrics):
+        """{metric: {key: [(date, value), ...]}} for the days since `start`, oldest first."""
+        series = defaultdict(lambda: defaultdict(list))
+        rows = DailyStat.objects.filter(metric__in=metrics, date__gte=start, value__gt=0).order_by('date')
+        for day, metric, key, value in rows.values_list('date', 'metric', 'key', 'value'):
+            series[metric][key].append((day, value))
+        return series
+
+    @staticmethod
+    def totals(metrics, start=None):
+        """{metric: [(key, total), ...]} summed over the days since `start` (all time if None), largest first."""
+        rows = DailyStat.objects.filter(metric__in=metrics)
+        if start is not None:
+            rows = rows.filter(date__gte=start)
+        totals = defaultdict(list)
+        grouped = rows.order_by().values('metric', 'key').annotate(total=Sum('value')).filter(total__gt=0)
+        for row in grouped.order_by('-total'):
+            totals[row['metric']].append((row['key'], row['total']))
+        return totals
+
+    @classmethod
+    def gauges(cls):
+        """
+        {metric: [(key, value), ...]} from the latest snapshot, largest first.
+        Today's snapshot is re-taken when missing or older than GAUGE_TTL.
+        """
+        today = timezone.localdate()
+        stored = DailyStat.objects.filter(metric__in=cls.GAUGE_METRICS).aggregate(
+            date=Max('date'), updated_at=Max('updated_at')
+        )
+        latest = stored['date']
+        stale = latest != today or stored['updated_at'] < timezone.now() - timedelta(seconds=cls.GAUGE_TTL)
+        # One refresh at a time; concurrent readers use the previous snapshot
+        if stale and cache.add(cls.GAUGE_LOCK_KEY, 1, cls.GAUGE_TTL):
+            try:
+                cls.snapshot_gauges(today)
+                latest = today
+            finally:
+                cache.delete(cls.GAUGE_LOCK_KEY)
+        gauges = defaultdict(list)
+        rows = DailyStat.objects.filter(metric__in=cls.GAUGE_METRICS, date=latest).order_by('-value')
+        for metric, key, value in rows.values_list('metric', 'key', 'value'):
+            gauges[metric].append((key, value))
+        return gauges
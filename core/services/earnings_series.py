@@ -0,0 +1,149 @@
+import logging
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db.models import DateTimeField, Sum
+from django.db.models.functions import Trunc
+
+from core.models import AdPerformance
+from creators.models import CreatorChannel
+from payments.utils import get_creator_share
+
+logger = logging.getLogger(__name__)
+
+
+def add_months(day, months):
+    month_index = day.month - 1 + months
+    return day.replace(year=day.year + month_index // 12, month=month_index % 12 + 1, day=1)
+
+
+class EarningsSeriesService:
+    """
+    Creator earnings bucketed by day, week or month in SQL.
+
+    Rows are truncated with `Trunc` in each channel's own timezone (one
+    grouped query per distinct timezone among the creator's channels, usually
+    one), so the cost of a chart depends on the number of buckets, not on the
+    number of hourly ticks. The creator share is taken from the summed cost
+    with the configured PLATFORM_FEE.
+
+    Subclasses can point `model` / `channel_field` / `time_field` at a
+    pre-aggregated rollup table with the same `cost` and `impressions` columns;
+    a DateField `time_field` is truncated without timezone conversion since
+    the rollup is already bucketed by local day.
+    """
+
+    PERIODS = ('day', 'week', 'month')
+
+    model = AdPerformance
+    channel_field = 'ad_placement__channel'
+    time_field = 'timestamp'
+
+    def __init__(self, user, period='day'):
+        if period not in self.PERIODS:
+            raise ValueError(f"Unknown earnings period '{period}'")
+        self.user = user
+        self.period = period
+
+    def timezones(self):
+        zones = CreatorChannel.objects.filter(owner=self.user).values_list('timezone', flat=True).distinct()
+        # Channels without a timezone are bucketed in the server's
+        return sorted({zone or settings.TIME_ZONE for zone in zones}) or [settings.TIME_ZONE]
+
+    def is_datetime(self):
+        return isinstance(self.model._meta.get_field(self.time_field), DateTimeField)
+
+    def bucket_start(self, day):
+        if self.period == 'week':
+            return day - timedelta(days=day.weekday())
+        if self.period == 'month':
+            return day.replace(day=1)
+        return day
+
+    def buckets(self, start, end):
+        """Every bucket start between the local dates `start` and `end`, inclusive."""
+        buckets, current = [], self.bucket_start(start)
+        while current <= end:
+            buckets.append(current)
+            if self.period == 'month':
+                current = add_months(current, 1)
+            else:
+                current += timedelta(days=7 if self.period == 'week' else 1)
+        return buckets
+
+    def queryset(self, zone_name, start, end):
+        channel_timezone = f"{self.channel_field}__timezone"
+        rows = self.model.objects.filter(**{f"{self.channel_field}__owner": self.user})
+        if zone_name == settings.TIME_ZONE:
+            rows = rows.filter(**{f"{channel_timezone}__in": [zone_name, '']}) | rows.filter(**{f"{channel_timezone}__isnull": True})
+        else:
+            rows = rows.filter(**{channel_timezone: zone_name})
+
+        if not self.is_datetime():
+            return rows.filter(**{f"{self.time_field}__range": (start, end)}).annotate(
+                bucket=Trunc(self.time_field, self.period)
+            )
+
+        zone = ZoneInfo(zone_name)
+        return rows.filter(**{
+            f"{self.time_field}__gte": datetime.combine(start, time.min, tzinfo=zone),
+            f"{self.time_field}__lt": datetime.combine(end + timedelta(days=1), time.min, tzinfo=zone),
+        }).annotate(
+            bucket=Trunc(self.time_field, self.period, output_field=DateTimeField(), tzinfo=zone)
+        )
+
+    def totals(self, start, end):
+        """{bucket start date: {'cost', 'impressions'}} for the local date range."""
+        totals = defaultdict(lambda: {'cost': Decimal('0'), 'impressions': 0})
+        for zone_name in self.timezones():
+            grouped = self.queryset(zone_name, start, end).order_by().values('bucket').annotate(
+                cost=Sum('cost'), impressions=Sum('impressions')
+            )
+            for row in grouped:
+                bucket = row['bucket']
+                if isinstance(bucket, datetime):
+                    bucket = bucket.astimezone(ZoneInfo(zone_name)).date()
+                totals[bucket]['cost'] += row['cost'] or 0
+                totals[bucket]['impressions'] += row['impressions'] or 0
+        return totals
+
+    def series(self, start, end):
+        """Dense series over the local date range, zero-filled for empty buckets."""
+        totals = self.totals(start, end)
+        return [
+            {
+                'period': bucket,
+                'earnings': round(get_creator_share(totals[bucket]['cost']), 2) if bucket in totals else Decimal('0.00'),
+                'impressions': totals[bucket]['impressions'] if bucket in totals else 0,
+            }
+            for bucket in self.buckets(start, end)
+        ]
+
+    @classmethod
+    def month_weeks_chart(cls, user, today):
+        """
+        The dashboard chart: the current month split into W1–W4 by day of
+        month (days 1–7, 8–14, ...), built from the daily series.
+        """
+        first_day = today.replace(day=1)
+        last_day = add_months(first_day, 1) - timedelta(days=1)
+        weekly_totals = defaultdict(Decimal)
+        for point in cls(user, period='day').series(first_day, last_day):
+            weekly_totals[((point['period'].day - 1) // 7) + 1] += point['earnings']
+
+        chart_data, week_labels, week_ranges = [], [], []
+        for week_num in range(1, 5):
+            chart_data.append(round(float(weekly_totals.get(week_num, 0)), 2))
+            week_labels.append(f"W{week_num}")
+            start_day = (week_num - 1) * 7 + 1
+            end_day = min(start_day + 6, last_day.day)
+            week_ranges.append(f"{start_day}–{end_day}")
+
+        return {
+            'chart_data': chart_data,
+            'week_labels': week_labels,
+            'week_ranges': week_ranges,
+        }
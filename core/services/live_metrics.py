@@ -0,0 +1,168 @@
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """
+    One listener's mailbox: an asyncio.Queue bound to the listener's event
+    loop. `put()` is safe to call from any thread; when the listener falls
+    behind, the oldest event is dropped.
+    """
+
+    QUEUE_SIZE = 100
+
+    def __init__(self, topic):
+        self.topic = topic
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+
+    def put(self, event):
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event):
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout):
+        """Next event, or None if nothing arrived within `timeout` seconds."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class InProcessBroker:
+    """
+    Topic pub/sub inside one server process. Enough for a single ASGI worker
+    that also runs the performance logger; with several processes use
+    PostgresNotifyBroker (set LIVE_METRICS_BROKER).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(set)
+
+    def publish(self, topic, event):
+        self.deliver(topic, event)
+
+    def deliver(self, topic, event):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(topic, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.put(event)
+            except RuntimeError:
+                # The subscriber's event loop has closed; it unsubscribes on its way out
+                pass
+
+    def subscribe(self, topic):
+        """Must be called from the subscriber's event loop."""
+        subscription = Subscription(topic)
+        with self._lock:
+            self._subscriptions[topic].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            listeners = self._subscriptions.get(subscription.topic)
+            if listeners is not None:
+                listeners.discard(subscription)
+                if not listeners:
+                    del self._subscriptions[subscription.topic]
+
+
+class PostgresNotifyBroker(InProcessBroker):
+    """
+    Cross-process variant: `publish()` sends a NOTIFY on CHANNEL (delivered
+    when the publishing transaction commits) and every process that has
+    subscribers runs one LISTEN thread that feeds its local subscriptions.
+    """
+
+    CHANNEL = 'live_metrics'
+    RECONNECT_DELAY = 5
+
+    def __init__(self, using='default'):
+        super().__init__()
+        self.using = using
+        self._listener = None
+
+    def publish(self, topic, event):
+        payload = json.dumps({'topic': topic, 'event': event}, cls=DjangoJSONEncoder)
+        with connections[self.using].cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [self.CHANNEL, payload])
+
+    def subscribe(self, topic):
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self.listen, name='live-metrics-listener', daemon=True)
+                self._listener.start()
+        return super().subscribe(topic)
+
+    def listen(self):
+        import psycopg2
+        import psycopg2.extensions
+
+        while True:
+            try:
+                params = connections[self.using].get_connection_params()
+                params.pop('cursor_factory', None)
+                connection = psycopg2.connect(**params)
+                connection.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                with connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {self.CHANNEL}")
+                while True:
+                    if select.select([connection], [], [], self.RECONNECT_DELAY) == ([], [], []):
+                        continue
+                    connection.poll()
+                    while connection.notifies:
+                        notify = connection.notifies.pop(0)
+                        message = json.loads(notify.payload)
+                        self.deliver(message['topic'], message['event'])
+            except Exception as e:
+                logger.error(f": Live metrics listener failed, reconnecting: {str(e)}")
+                time.sleep(self.RECONNECT_DELAY)
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    return import_string(settings.LIVE_METRICS_BROKER)()
+
+
+def campaign_topic(campaign_id):
+    return f"campaign:{campaign_id}"
+
+
+def publish_performance_tick(performance, campaign):
+    """Publishes one logged AdPerformance row as a per-campaign metric delta."""
+    event = {
+        'campaign_id': str(campaign.id),
+        'placement_id': str(performance.ad_placement_id),
+        'timestamp': performance.timestamp,
+        'impressions': performance.impressions,
+        'clicks': performance.clicks,
+        'conversions': performance.conversions,
+        'views': performance.views,
+        'forwards': performance.forwards,
+        'total_reactions': performance.total_reactions,
+        'total_replies': performance.total_replies,
+        'cost': performance.cost,
+        'total_spent': campaign.total_spent,
+    }
+    try:
+        get_broker().publish(campaign_topic(campaign.id), json.loads(json.dumps(event, cls=DjangoJSONEncoder)))
+    except Exception as e:
+        logger.error(f": Failed to publish performance tick for campaign {campaign.id}: {str(e)}")
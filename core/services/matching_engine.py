@@ -2,14 +2,19 @@ from django.db.models import Q
 from math import log10
 
 from core.models import Campaign
-from creators.models import CreatorChannel, CreatorReputation
+from creators.models import CreatorChannel
 
 class CampaignChannelMatcher:
 
-    def __init__(self, campaign: Campaign):
+    def __init__(self, campaign: Campaign, categories=None, languages=None):
+        # Explicit targeting ids let an unsaved campaign be matched (simulation)
         self.campaign = campaign
-        self.categories = set(campaign.targeting_categories.values_list('id', flat=True))
-        self.languages = set(campaign.targeting_languages.values_list('id', flat=True))
+        if categories is None:
+            categories = campaign.targeting_categories.values_list('id', flat=True)
+        if languages is None:
+            languages = campaign.targeting_languages.values_list('id', flat=True)
+        self.categories = set(categories)
+        self.languages = set(languages)
         self.regions = set(campaign.targeting_regions.get('countries', []))
         self.campaign_cpm = float(campaign.cpm)
         self.budget = float(campaign.initial_budget)
@@ -22,32 +27,23 @@ class CampaignChannelMatcher:
             # region__in=self.regions,
             language__in=self.languages,
             category__in=self.categories
-        ).distinct()
+        ).distinct().prefetch_related('category', 'language')
 
     def estimate_channel_cost(self, channel: CreatorChannel) -> float:
-        try:
-            rep = channel.reputation
-            engagement_rate = rep.avg_engagement_rate or 0.15  # Default 15% if missing
-        except CreatorReputation.DoesNotExist:
-            engagement_rate = 0.15
-
-        subscribers = channel.subscribers or 0
-        estimated_views = subscribers * engagement_rate
-        estimated_cost = (estimated_views / 1000) * float(channel.min_cpm)
-
-        return round(estimated_cost, 2)
+        # Precomputed pricing profile (see CreatorChannel.refresh_pricing_profile)
+        return float(channel.cost_per_post)
 
     def score_channel(self, channel: CreatorChannel) -> float:
         score = 0.0
 
         # Category match
-        channel_categories = set(channel.category.values_list('id', flat=True))
+        channel_categories = {category.id for category in channel.category.all()}
         category_overlap = len(channel_categories & self.categories)
         category_score = (category_overlap / len(self.categories)) * 25 if self.categories else 0
         score += category_score
 
         # Language match
-        channel_langs = set(channel.language.values_list('id', flat=True))
+        channel_langs = {language.id for language in channel.language.all()}
         lang_overlap = len(channel_langs & self.languages)
         lang_score = (lang_overlap / len(self.languages)) * 10 if self.languages else 0
         score += lang_score
@@ -66,10 +62,9 @@ class CampaignChannelMatcher:
         score += budget_score
 
         # Reputation score
-        try:
-            rep = channel.reputation
-            rep_score = max(0, (rep.rating - rep.fraud_score)) / 5 * 20
-        except CreatorReputation.DoesNotExist:
+        if channel.reputation_rating is not None:
+            rep_score = max(0, (channel.reputation_rating - (channel.reputation_fraud_score or 0))) / 5 * 20
+        else:
             rep_score = 10.0  # default
         score += rep_score
 
@@ -86,8 +81,7 @@ class CampaignChannelMatcher:
 
         for channel in channels:
             score = self.score_channel(channel)
-            estimated_cost = self.estimate_channel_cost(channel)
-            ranked.append((channel, score, estimated_cost))
+            ranked.append((channel, score, self.estimate_channel_cost(channel)))
 
         # Sort by score descending
         ranked.sort(key=lambda x: x[1], reverse=True)
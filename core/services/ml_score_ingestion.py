@@ -0,0 +1,238 @@
+import logging
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+from django.core.exceptions import ValidationError
+from django.core.validators import URLValidator
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import Notification
+from core.services.notification_service import NotificationService
+from core.utils.helper import normalize_channel_handle
+from creators.models import CreatorChannel, CreatorReputation
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelScoreIngestionService:
+    """
+    Applies a scraper ML-scoring run to many channels at once.
+
+    All usernames are resolved through the unique `handle` index per chunk,
+    reputation cost estimates are computed for the whole payload in a single
+    vectorized pass, and channels (with their pricing profile), reputations and
+    owner notifications are written with bulk_update / bulk_create. Per-item
+    results are kept so the API response stays the same as the old one-by-one loop.
+    """
+
+    CHUNK_SIZE = 1000
+    SIGNIFICANT_SCORE_CHANGE = 0.2
+    MAX_SUBSCRIBERS = 2 ** 63 - 1  # PositiveBigIntegerField
+    PP_URL_MAX_LENGTH = CreatorChannel._meta.get_field('pp_url').max_length
+
+    CHANNEL_FIELDS = [
+        'ml_score', 'last_score_updated', 'pp_url', 'subscribers', 'updated_at',
+        *CreatorChannel.PRICING_FIELDS,
+    ]
+    REPUTATION_FIELDS = [
+        'avg_engagement_rate',
+        'estimated_views_avg',
+        'estimated_views_max',
+        'estimated_cost_min',
+        'estimated_cost_max',
+        'last_reviewed',
+        'updated_at',
+    ]
+
+    def __init__(self, items):
+        self.items = items
+        self.updated = []
+        self.failed = []
+
+    @staticmethod
+    def channel_link_for(username):
+        return f"https://t.me/{username}"
+
+    @classmethod
+    def clean_item(cls, item):
+        """
+        Returns a copy of `item` with `subscribers` coerced to int, or raises
+        ValueError with the reason, so a bad entry fails on its own instead of
+        aborting the bulk write for the whole batch.
+        """
+        try:
+            float(item["ml_score"])
+        except (TypeError, ValueError):
+            raise ValueError("Invalid ml_score")
+
+        item = dict(item)
+        if item.get("subscribers") is not None:
+            try:
+                item["subscribers"] = int(item["subscribers"])
+            except (TypeError, ValueError):
+                raise ValueError("Invalid subscribers")
+            if not 0 <= item["subscribers"] <= cls.MAX_SUBSCRIBERS:
+                raise ValueError("Invalid subscribers")
+
+        pp_url = item.get("pp_url")
+        if pp_url:
+            if not isinstance(pp_url, str) or len(pp_url) > cls.PP_URL_MAX_LENGTH:
+                raise ValueError("Invalid pp_url")
+            try:
+                URLValidator()(pp_url)
+            except ValidationError:
+                raise ValueError("Invalid pp_url")
+        return item
+
+    def validate(self):
+        """Drops malformed entries; later entries for the same channel win."""
+        entries = {}
+        for item in self.items:
+            username = item.get("username") if isinstance(item, dict) else None
+            if not username or item.get("ml_score") is None:
+                self.failed.append({"entry": item, "error": "Missing username or ml_score"})
+                continue
+            try:
+                entries[normalize_channel_handle(username)] = self.clean_item(item)
+            except ValueError as e:
+                self.failed.append({"entry": item, "error": str(e)})
+        return entries
+
+    def resolve_channels(self, keys):
+        channels = {}
+        for start in range(0, len(keys), self.CHUNK_SIZE):
+            chunk = keys[start:start + self.CHUNK_SIZE]
+            qs = CreatorChannel.objects.filter(handle__in=chunk).select_related('owner', 'reputation')
+            channels.update({channel.handle: channel for channel in qs})
+        return channels
+
+    @staticmethod
+    def estimate_costs(frame):
+        """
+        Cost = (views / 1000) * min_cpm for every row at once. Works in integer
+        cents so the result matches Decimal arithmetic rounded to 0.01.
+        """
+        for column in ('avg_views_per_post', 'top_views_post', 'engagement_rate'):
+            frame[column] = pd.to_numeric(frame[column], errors='coerce').fillna(0)
+
+        cpm_cents = np.rint(frame['min_cpm'].astype(float) * 100).clip(lower=0)
+        frame['views_avg'] = frame['avg_views_per_post'].astype('int64')
+        frame['views_max'] = frame['top_views_post'].astype('int64')
+        frame['cost_min_cents'] = np.rint(frame['views_avg'] * cpm_cents / 1000).astype('int64')
+        frame['cost_max_cents'] = np.rint(frame['views_max'] * cpm_cents / 1000).astype('int64')
+        frame['engagement'] = frame['engagement_rate'].astype(float).round(2)
+        return frame
+
+    def build_notification(self, channel, previous_score, ml_score, reputation):
+        diff = round(ml_score - previous_score, 2)
+        is_active_notification = True
+
+        if previous_score is None or previous_score == 0:
+            trend = "for the first time"
+            tone = "Your channel just received its first performance score."
+        elif diff > self.SIGNIFICANT_SCORE_CHANGE:
+            trend = "increased ↗"
+            tone = "Great! Your channel's performance is improving."
+        elif diff < -self.SIGNIFICANT_SCORE_CHANGE:
+            trend = "decreased ↘"
+            tone = "Heads up! Your channel's performance has dropped."
+        else:
+            trend = "remained the same"
+            tone = "Your performance score hasn't changed."
+            is_active_notification = False
+
+        message = (
+            f"Your channel \"{channel.title}\" has a new performance analysis, resulting in a score update.\n"
+            f"Score {trend} from {previous_score:.2f} to {ml_score:.2f}. {tone}\n\n"
+            f"💰 Estimated Value Per Single Ad: ETB{reputation.estimated_cost_min:.2f} - ETB{reputation.estimated_cost_max:.2f}\n"
+            f"This is the estimated value for just one ad post per uv. **The more high-quality ads you run with us, the higher your total revenue potential!** Keep delivering great content to maximize your earnings on our platform."
+        )
+        return Notification(
+            user=channel.owner,
+            title="Channel Performance Updated",
+            message=message,
+            type='Analytics Update',
+            is_active=is_active_notification
+        )
+
+    def run(self):
+        entries = self.validate()
+        channels = self.resolve_channels(list(entries))
+
+        for key, item in entries.items():
+            if key not in channels:
+                self.failed.append({"channel_link": self.channel_link_for(item["username"]), "error": "Not found"})
+
+        matched = [(channels[key], entries[key]) for key in entries if key in channels]
+        if not matched:
+            return self.updated, self.failed
+
+        frame = self.estimate_costs(pd.DataFrame([
+            {
+                'avg_views_per_post': item.get("avg_views_per_post"),
+                'top_views_post': item.get("top_views_post"),
+                'engagement_rate': item.get("engagement_rate"),
+                'min_cpm': channel.min_cpm or 0,
+            }
+            for channel, item in matched
+        ]))
+
+        now = timezone.now()
+        channel_updates, new_reputations, reputation_updates, notifications = [], [], [], []
+
+        for (channel, item), row in zip(matched, frame.itertuples(index=False)):
+            ml_score = float(item["ml_score"])
+            previous_score = channel.ml_score or 0
+
+            channel.ml_score = ml_score
+            channel.last_score_updated = now
+            channel.updated_at = now
+            if item.get("pp_url"):
+                channel.pp_url = item["pp_url"]
+            if item.get("subscribers") is not None:
+                channel.subscribers = item["subscribers"]
+            channel_updates.append(channel)
+
+            try:
+                reputation = channel.reputation
+                reputation_updates.append(reputation)
+            except CreatorReputation.DoesNotExist:
+                reputation = CreatorReputation(creator_channel=channel)
+                new_reputations.append(reputation)
+
+            if item.get("engagement_rate") is not None:
+                reputation.avg_engagement_rate = row.engagement
+            reputation.estimated_views_avg = row.views_avg
+            reputation.estimated_views_max = row.views_max
+            reputation.estimated_cost_min = Decimal(row.cost_min_cents) / 100
+            reputation.estimated_cost_max = Decimal(row.cost_max_cents) / 100
+            reputation.last_reviewed = now
+            reputation.updated_at = now
+
+            # bulk writes skip save(), so refresh the channel's pricing profile here
+            channel.apply_reputation(reputation)
+            channel.refresh_pricing_profile()
+
+            if channel.owner_id:
+                notifications.append(self.build_notification(channel, previous_score, ml_score, reputation))
+
+            self.updated.append({
+                "channel_link": self.channel_link_for(item["username"]),
+                "ml_score": item["ml_score"],
+                "pp_url": item.get("pp_url"),
+                "subscribers": item.get("subscribers"),
+            })
+
+        with transaction.atomic():
+            CreatorChannel.objects.bulk_update(channel_updates, self.CHANNEL_FIELDS, batch_size=self.CHUNK_SIZE)
+            CreatorReputation.objects.bulk_create(new_reputations, batch_size=self.CHUNK_SIZE)
+            CreatorReputation.objects.bulk_update(reputation_updates, self.REPUTATION_FIELDS, batch_size=self.CHUNK_SIZE)
+            NotificationService.bulk_create(notifications)
+
+        logger.info(
+            f": ML scores ingested | {len(channel_updates)} channels, "
+            f"{len(new_reputations)} new reputations, {len(notifications)} notifications"
+        )
+        return self.updated, self.failed
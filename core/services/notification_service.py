@@ -0,0 +1,146 @@
+import logging
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+
+from core.models import Notification, NotificationCounter
+from core.services.creator_dashboard import CreatorDashboardCache
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationService:
+    """
+    Creates notifications in bulk and keeps NotificationCounter in step.
+
+    Single-row `save()` / `delete()` calls are counted by the Notification
+    signals; everything here goes through `bulk_create` or queryset
+    `update()`, which skip signals, so the counters are adjusted explicitly
+    with one UPDATE per distinct delta.
+    """
+
+    CHUNK_SIZE = 500
+
+    # ─── Counters ───
+
+    @staticmethod
+    def ensure_counters(user_ids):
+        """Creates missing counter rows, seeded from the current unread count."""
+        user_ids = set(user_ids)
+        missing = user_ids - set(
+            NotificationCounter.objects.filter(user_id__in=user_ids).values_list('user_id', flat=True)
+        )
+        if not missing:
+            return
+        unread = dict(
+            Notification.objects.filter(user_id__in=missing, is_active=True, is_read=False)
+            .order_by().values('user_id').annotate(total=Count('id')).values_list('user_id', 'total')
+        )
+        NotificationCounter.objects.bulk_create(
+            [NotificationCounter(user_id=user_id, unread=unread.get(user_id, 0)) for user_id in missing],
+            ignore_conflicts=True,
+        )
+
+    @classmethod
+    def adjust(cls, deltas, seed_missing=True):
+        """
+        Applies {user_id: delta} to the unread counters atomically. Called after
+        the notification rows were written, so users without a counter yet are
+        seeded from the table, which already includes the change.
+        """
+        deltas = {user_id: delta for user_id, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        with transaction.atomic():
+            existing = set(
+                NotificationCounter.objects.filter(user_id__in=deltas).values_list('user_id', flat=True)
+            )
+            by_delta = {}
+            for user_id in existing:
+                by_delta.setdefault(deltas[user_id], []).append(user_id)
+            for delta, user_ids in by_delta.items():
+                NotificationCounter.objects.filter(user_id__in=user_ids).update(
+                    unread=Greatest(F('unread') + delta, 0)
+                )
+            if seed_missing:
+                cls.ensure_counters(set(deltas) - existing)
+
+        for user_id in deltas:
+            transaction.on_commit(lambda user_id=user_id: CreatorDashboardCache.invalidate(user_id, 'notifications'))
+
+    @classmethod
+    def unread_count(cls, user):
+        counter = NotificationCounter.objects.filter(user=user).values_list('unread', flat=True).first()
+        if counter is None:
+            cls.ensure_counters([user.pk])
+            counter = NotificationCounter.objects.filter(user=user).values_list('unread', flat=True).first()
+        return counter or 0
+
+    @staticmethod
+    def recount(user_ids=None):
+        """Rebuilds counters from the notifications table (all users when `user_ids` is None)."""
+        rows = Notification.objects.filter(is_active=True, is_read=False)
+        counters = NotificationCounter.objects.all()
+        if user_ids is not None:
+            rows = rows.filter(user_id__in=user_ids)
+            counters = counters.filter(user_id__in=user_ids)
+        unread = dict(rows.order_by().values('user_id').annotate(total=Count('id')).values_list('user_id', 'total'))
+
+        with transaction.atomic():
+            counters.exclude(user_id__in=unread).update(unread=0)
+            existing = {counter.user_id: counter for counter in counters.filter(user_id__in=unread)}
+            for user_id, total in unread.items():
+                existing.setdefault(user_id, NotificationCounter(user_id=user_id)).unread = total
+            NotificationCounter.objects.bulk_create(
+                [c for c in existing.values() if c._state.adding], batch_size=NotificationService.CHUNK_SIZE
+            )
+            NotificationCounter.objects.bulk_update(
+                [c for c in existing.values() if not c._state.adding], ['unread'], batch_size=NotificationService.CHUNK_SIZE
+            )
+        return len(unread)
+
+    # ─── Creation ───
+
+    @classmethod
+    def bulk_create(cls, notifications):
+        """Inserts prepared Notification instances in chunks and bumps their users' counters."""
+        notifications = list(notifications)
+        if not notifications:
+            return []
+        with transaction.atomic():
+            created = Notification.objects.bulk_create(notifications, batch_size=cls.CHUNK_SIZE)
+            cls.adjust(Counter(n.user_id for n in created if n.counts_as_unread))
+        return created
+
+    @classmethod
+    def fan_out(cls, user_ids, title, message, type='New', is_active=True):
+        """Sends the same notification to many users."""
+        user_ids = list(dict.fromkeys(user_ids))
+        created = cls.bulk_create(
+            Notification(user_id=user_id, title=title, message=message, type=type, is_active=is_active)
+            for user_id in user_ids
+        )
+        logger.info(f": Fanned out '{title}' to {len(created)} users")
+        return created
+
+    # ─── Read state ───
+
+    @classmethod
+    def mark_all_read(cls, user):
+        with transaction.atomic():
+            updated = Notification.objects.filter(user=user, is_active=True, is_read=False).update(is_read=True)
+            cls.ensure_counters([user.pk])
+            NotificationCounter.objects.filter(user=user).update(unread=0)
+        transaction.on_commit(lambda: CreatorDashboardCache.invalidate(user.pk, 'notifications'))
+        return updated
+
+    @staticmethod
+    def set_read(notification, is_read=True):
+        """Single notification; the counter follows through the post_save signal."""
+        if notification.is_read != is_read:
+            notification.is_read = is_read
+            notification.save(update_fields=['is_read'])
+        return notification
@@ -0,0 +1,198 @@
+import logging
+from datetime import date, timedelta
+
+from django.db import connections, transaction
+from django.db.models import Count, Max, Q, Sum
+from django.utils import timezone
+
+from core.models import AdPerformance
+
+logger = logging.getLogger(__name__)
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def add_months(day, months):
+    month_index = day.month - 1 + months
+    return date(day.year + month_index // 12, month_index % 12 + 1, 1)
+
+
+class AdPerformancePartitionManager:
+    """
+    Maintains the monthly range partitions of the AdPerformance table on
+    Postgres (see core migration 0018). Rows outside any monthly partition
+    land in the DEFAULT partition and are moved out when their month is created.
+    """
+
+    table = AdPerformance._meta.db_table
+    default_partition = f"{AdPerformance._meta.db_table}_default"
+
+    def __init__(self, using='default'):
+        self.using = using
+        self.connection = connections[using]
+
+    @property
+    def is_supported(self):
+        return self.connection.vendor == 'postgresql' and self.is_partitioned()
+
+    def is_partitioned(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_partitioned_table p "
+                "JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = %s",
+                [self.table]
+            )
+            return cursor.fetchone() is not None
+
+    def partition_name(self, month):
+        return f"{self.table}_p{month:%Y_%m}"
+
+    def existing_partitions(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent WHERE p.relname = %s",
+                [self.table]
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    def ensure_partitions(self, months_ahead=3, dry_run=False):
+        """Create the current month's partition and the next `months_ahead` ones."""
+        existing = self.existing_partitions()
+        current = month_start(timezone.now().date())
+        created = []
+
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            name = self.partition_name(month)
+            if name in existing:
+                continue
+            if not dry_run:
+                self.create_partition(month)
+            created.append(name)
+
+        return created
+
+    def create_partition(self, month):
+        name = self.partition_name(month)
+        start, end = month, add_months(month, 1)
+        qn = self.connection.ops.quote_name
+
+        with transaction.atomic(using=self.using), self.connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT EXISTS (SELECT 1 FROM {qn(self.default_partition)} "
+                f"WHERE date >= %s AND date < %s)",
+                [start, end]
+            )
+            has_default_rows = cursor.fetchone()[0]
+
+            if has_default_rows:
+                # Postgres refuses to create a partition whose range has rows in
+                # DEFAULT, so detach it, move the rows across and reattach.
+                cursor.execute(f"ALTER TABLE {qn(self.table)} DETACH PARTITION {qn(self.default_partition)}")
+
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {qn(name)} PARTITION OF {qn(self.table)} "
+                f"FOR VALUES FROM (%s) TO (%s)",
+                [start, end]
+            )
+
+            if has_default_rows:
+                cursor.execute(
+                    f"INSERT INTO {qn(name)} SELECT * FROM {qn(self.default_partition)} "
+                    f"WHERE date >= %s AND date < %s",
+                    [start, end]
+                )
+                cursor.execute(
+                    f"DELETE FROM {qn(self.default_partition)} WHERE date >= %s AND date < %s",
+                    [start, end]
+                )
+                cursor.execute(
+                    f"ALTER TABLE {qn(self.table)} ATTACH PARTITION {qn(self.default_partition)} DEFAULT"
+                )
+
+        logger.info(f": Created AdPerformance partition {name} [{start} - {end})")
+        return name
+
+
+class AdPerformanceCompactor:
+    """
+    Collapses hourly AdPerformance ticks older than `older_than_days` into a
+    single daily row per placement. The latest tick of each day is kept and
+    receives the day's sums, so totals, `_get_previous_metrics` and the
+    latest-timestamp lookups in PerformanceLoggingEngine are unaffected.
+
+    Groups are paged with a keyset cursor on (date, ad_placement), which the
+    (date, ad_placement) index serves in order, so each row is grouped once
+    per run however large the backlog.
+    """
+
+    SUM_FIELDS = [
+        'impressions', 'clicks', 'conversions', 'reposts', 'cost',
+        'total_reactions', 'total_replies', 'views', 'forwards', 'time_delta',
+    ]
+
+    def __init__(self, older_than_days=30, batch_size=500, using='default'):
+        self.older_than_days = older_than_days
+        self.batch_size = batch_size
+        self.using = using
+
+    def cutoff(self):
+        return timezone.now().date() - timedelta(days=self.older_than_days)
+
+    def pending_groups(self, cutoff, after=None):
+        """
+        (ad_placement, date) groups with more than one tick, all already
+        deducted, that come after the `after` (date, ad_placement_id) group.
+        """
+        rows = AdPerformance.objects.using(self.using).filter(date__lt=cutoff)
+        if after is not None:
+            day, placement_id = after
+            rows = rows.filter(Q(date__gt=day) | Q(date=day, ad_placement_id__gt=placement_id))
+        return rows.values('date', 'ad_placement_id').annotate(
+            ticks=Count('id'),
+            undeducted=Count('id', filter=Q(is_deducted=False)),
+        ).filter(ticks__gt=1, undeducted=0).order_by('date', 'ad_placement_id')
+
+    def run(self, dry_run=False):
+        cutoff = self.cutoff()
+        compacted_rows = 0
+        after = None
+
+        while True:
+            groups = list(self.pending_groups(cutoff, after)[:self.batch_size])
+            if not groups:
+                break
+            for group in groups:
+                removed = self.compact_group(group['ad_placement_id'], group['date'], dry_run=dry_run)
+                compacted_rows += removed
+            after = (groups[-1]['date'], groups[-1]['ad_placement_id'])
+
+        logger.info(f": Compacted {compacted_rows} hourly AdPerformance rows older than {cutoff}")
+        return compacted_rows
+
+    def compact_group(self, placement_id, day, dry_run=False):
+        rows = AdPerformance.objects.using(self.using).filter(ad_placement_id=placement_id, date=day)
+
+        with transaction.atomic(using=self.using):
+            totals = rows.aggregate(latest=Max('timestamp'), **{f: Sum(f) for f in self.SUM_FIELDS})
+            keeper = rows.select_for_update().filter(timestamp=totals.pop('latest')).first()
+            if keeper is None:
+                return 0
+
+            stale = rows.exclude(pk=keeper.pk)
+            removed = stale.count()
+            if dry_run:
+                return removed
+
+            stale.delete()
+            # queryset.update() leaves auto_now `timestamp` untouched
+            rows.filter(pk=keeper.pk).update(
+                **{field: value if value is not None else getattr(keeper, field)
+                   for field, value in totals.items()}
+            )
+
+        return removed
@@ -0,0 +1,121 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from core.models import AdPlacement, AdPlacementStatus, Campaign
+from core.services.content_delivery_engine import ContentDeliveryService
+
+logger = logging.getLogger(__name__)
+
+
+class PlacementDeliveryBatch:
+    """
+    Posts and deletes Telegram content for many placements at once, after the
+    lifecycle change that produced them has committed. Placements are loaded
+    in chunks of BATCH_SIZE and sent over a small thread pool, pausing
+    BATCH_INTERVAL seconds between chunks to stay under the bot API's
+    global rate limit (~30 messages/second).
+
+    Background dispatches are not durable; CampaignScheduleSweeper re-runs
+    posts and deletions that never happened.
+    """
+
+    BATCH_SIZE = 20
+    WORKERS = 4
+    BATCH_INTERVAL = 1.0
+
+    def __init__(self, post_ids=(), delete_ids=(), deleted_status=AdPlacementStatus.STOPPED, bot_token=None):
+        self.post_ids = list(post_ids)
+        self.delete_ids = list(delete_ids)
+        self.deleted_status = deleted_status
+        self.bot_token = bot_token or settings.BOT_SECRET_TOKEN
+        self.stats = {'posted': 0, 'post_failed': 0, 'deleted': 0, 'delete_failed': 0}
+
+    def __bool__(self):
+        return bool(self.post_ids or self.delete_ids)
+
+    def dispatch(self, background=True):
+        """Runs the batch, by default on a daemon thread so the caller's request returns immediately."""
+        if not self:
+            return
+        if not background:
+            self.run()
+            return
+        threading.Thread(target=self.run_in_thread, name='placement-delivery', daemon=True).start()
+
+    def run_in_thread(self):
+        try:
+            self.run()
+        except Exception as e:
+            logger.error(f": Placement delivery batch failed: {str(e)}")
+        finally:
+            connections.close_all()
+
+    def chunks(self, ids):
+        for start in range(0, len(ids), self.BATCH_SIZE):
+            yield list(
+                AdPlacement.objects.filter(pk__in=ids[start:start + self.BATCH_SIZE])
+                .select_related('ad', 'channel')
+            )
+
+    def run(self):
+        service = ContentDeliveryService(self.bot_token)
+        posted_campaigns, deleted_ids = set(), []
+
+        with ThreadPoolExecutor(max_workers=self.WORKERS) as executor:
+            for index, placements in enumerate(self.chunks(self.delete_ids)):
+                if index:
+                    time.sleep(self.BATCH_INTERVAL)
+                for placement, deleted in zip(placements, executor.map(self.delete, [service] * len(placements), placements)):
+                    self.stats['deleted' if deleted else 'delete_failed'] += 1
+                    if deleted:
+                        deleted_ids.append(placement.pk)
+
+            for index, placements in enumerate(self.chunks(self.post_ids)):
+                if index or self.delete_ids:
+                    time.sleep(self.BATCH_INTERVAL)
+                # Skip placements that were paused/stopped between scheduling and delivery
+                placements = [p for p in placements if p.status == AdPlacementStatus.APPROVED]
+                for placement, posted in zip(placements, executor.map(self.post, [service] * len(placements), placements)):
+                    if posted:
+                        self.stats['posted'] += 1
+                        posted_campaigns.add(placement.ad.campaign_id)
+                    else:
+                        self.stats['post_failed'] += 1
+
+        if deleted_ids and self.deleted_status != AdPlacementStatus.STOPPED:
+            # delete_from_channel always marks the placement stopped
+            AdPlacement.objects.filter(pk__in=deleted_ids).update(status=self.deleted_status, updated_at=timezone.now())
+        if posted_campaigns:
+            Campaign.objects.filter(pk__in=posted_campaigns).update(start_date=timezone.now().date())
+
+        logger.info(f": Placement delivery batch done | {self.stats}")
+        return self.stats
+
+    # Both run on pool threads, which hold their own DB connections
+
+    @staticmethod
+    def post(service, placement):
+        try:
+            result = service.post_to_channel(placement)
+            if not result['success']:
+                placement.status = AdPlacementStatus.PENDING
+                placement.save(update_fields=['status'])
+            return result['success']
+        except Exception as e:
+            logger.error(f": Failed to post placement {placement.id}: {str(e)}")
+            return False
+        finally:
+            connections.close_all()
+
+    @staticmethod
+    def delete(service, placement):
+        try:
+            return service.delete_from_channel(placement)['success']
+        finally:
+            connections.close_all()
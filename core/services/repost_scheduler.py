@@ -0,0 +1,155 @@
+import heapq
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from core.models import AdPlacement, AdPlacementStatus
+from core.services.content_delivery_engine import ContentDeliveryService
+
+logger = logging.getLogger(__name__)
+
+
+class RepostScheduler:
+    """
+    Delete-and-repost loop for running placements.
+
+    Each placement's next repost time is stored in `next_repost_at` (set by
+    ContentDeliveryService whenever it posts), so the (status, next_repost_at)
+    index acts as a persistent priority queue. The loop keeps only the
+    placements due within `horizon` in an in-memory heap, sleeps until the
+    head is due, pops due placements in batches and reposts them at no more
+    than `rate_per_second`. Reposted placements are pushed back with their
+    new time, so scheduling costs O(log n) per placement instead of a table
+    scan every tick.
+    """
+
+    RETRY_DELAY = AdPlacement.REPOST_RETRY_DELAY
+
+    def __init__(self, batch_size=20, rate_per_second=1.0, horizon=timedelta(minutes=10), bot_token=None):
+        self.batch_size = batch_size
+        self.min_interval = 1.0 / rate_per_second if rate_per_second > 0 else 0
+        self.horizon = horizon
+        self.service = ContentDeliveryService(bot_token or settings.BOT_SECRET_TOKEN)
+        self.heap = []
+        self.queued = set()
+        self.last_call = 0.0
+        self.stats = {'reposted': 0, 'failed': 0, 'finished': 0}
+
+    def running(self):
+        return AdPlacement.objects.filter(status=AdPlacementStatus.RUNNING)
+
+    def backfill(self):
+        """Schedules running placements that predate `next_repost_at` (or were posted outside the service)."""
+        scheduled = 0
+        while True:
+            batch = list(
+                self.running().filter(next_repost_at__isnull=True, repost_count__lt=F('max_reposts'))
+                .exclude(channel__repost_preference='none')
+                .select_related('channel').order_by('pk')[:500]
+            )
+            now = timezone.now()
+            for placement in batch:
+                placement.next_repost_at = placement.compute_next_repost_at(after=now)
+            batch = [placement for placement in batch if placement.next_repost_at]
+            if not batch:
+                break
+            AdPlacement.objects.bulk_update(batch, ['next_repost_at'])
+            scheduled += len(batch)
+        if scheduled:
+            logger.info(f": Repost scheduler backfilled {scheduled} placements")
+        return scheduled
+
+    # ─── Heap ───
+
+    def push(self, due_at, pk):
+        pk = str(pk)
+        if pk in self.queued:
+            return
+        heapq.heappush(self.heap, (due_at, pk))
+        self.queued.add(pk)
+
+    def load(self, now):
+        """Pulls everything due before now + horizon from the index into the heap."""
+        upcoming = self.running().filter(
+            next_repost_at__lte=now + self.horizon
+        ).order_by('next_repost_at').values_list('next_repost_at', 'pk')
+        for due_at, pk in upcoming:
+            self.push(due_at, pk)
+
+    def pop_due(self, now):
+        due = []
+        while self.heap and self.heap[0][0] <= now and len(due) < self.batch_size:
+            _, pk = heapq.heappop(self.heap)
+            self.queued.discard(pk)
+            due.append(pk)
+        return due
+
+    # ─── Reposting ───
+
+    def throttle(self):
+        wait = self.min_interval - (time.monotonic() - self.last_call)
+        if wait > 0:
+            time.sleep(wait)
+        self.last_call = time.monotonic()
+
+    def repost_batch(self, pks, now):
+        # Re-check against the database: the placement may have been stopped or rescheduled meanwhile
+        placements = self.running().filter(pk__in=pks, next_repost_at__lte=now).select_related('ad', 'channel')
+        for placement in placements:
+            if placement.compute_next_repost_at(after=now) is None:
+                # max_reposts reached or the channel turned reposting off
+                placement.next_repost_at = None
+                placement.save(update_fields=['next_repost_at'])
+                self.stats['finished'] += 1
+                continue
+
+            self.throttle()
+            result = self.service.remove_and_repost(placement)
+            if result.get('success'):
+                self.stats['reposted'] += 1
+            else:
+                self.stats['failed'] += 1
+                placement.refresh_from_db(fields=['status'])
+                if placement.status == AdPlacementStatus.RUNNING:
+                    placement.next_repost_at = timezone.now() + self.RETRY_DELAY
+                    placement.save(update_fields=['next_repost_at'])
+
+            if placement.next_repost_at and placement.next_repost_at <= timezone.now() + self.horizon:
+                self.push(placement.next_repost_at, placement.pk)
+
+    def run_once(self):
+        """Reposts everything currently due, batch by batch, and returns the stats."""
+        self.backfill()
+        now = timezone.now()
+        self.load(now)
+        while True:
+            due = self.pop_due(now)
+            if not due:
+                break
+            self.repost_batch(due, now)
+        logger.info(f": Repost pass done | {self.stats}")
+        return self.stats
+
+    def run_forever(self, poll_interval=60):
+        """Sleeps until the next due placement, reloading the horizon at most every `poll_interval` seconds."""
+        self.backfill()
+        next_load = 0.0
+        while True:
+            now = timezone.now()
+            if time.monotonic() >= next_load:
+                self.load(now)
+                next_load = time.monotonic() + poll_interval
+
+            due = self.pop_due(now)
+            if due:
+                self.repost_batch(due, now)
+                continue
+
+            wait = poll_interval
+            if self.heap:
+                wait = min(wait, max((self.heap[0][0] - now).total_seconds(), 0))
+            time.sleep(max(wait, 1))
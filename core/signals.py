@@ -1,9 +1,17 @@
 from django.utils import timezone
-from django.db.models.signals import post_save, pre_save
+from django.db import transaction
+from django.contrib.admin.models import LogEntry
+from django.contrib.auth import get_user_model
+from django.contrib.auth.signals import user_logged_in
+from django.db.models.signals import post_save, post_delete, m2m_changed
 from django.dispatch import receiver
-from core.models import Campaign, AdPlacement, Notification
-from payments.models import Transaction, WithdrawalRequest
-from core.utils.signals_utils import process_campaign_activation, process_placement_approval
+from core.models import Campaign, AdPlacement, AdPerformance, Notification
+from creators.models import CreatorChannel
+from payments.models import Balance, Transaction, UserPaymentMethod, WithdrawalRequest
+from core.services.creator_dashboard import CreatorDashboardCache
+from core.services.daily_stats import DailyStatsService
+from core.services.notification_service import NotificationService
+from core.utils.signals_utils import process_campaign_activation, process_campaign_rematch, process_placement_approval
 from core.utils.notification import send_telegram_notification
 
 import logging
@@ -16,14 +24,21 @@ logger = logging.getLogger(__name__)
 
 
 
+def saved_field_changed(instance, field, update_fields=None):
+    """True when `field` was written by this save and differs from the loaded value."""
+    if update_fields is not None and field not in update_fields:
+        return False
+    return instance.has_changed(field)
+
+
 @receiver(post_save, sender=Campaign)
-def handle_campaign_status_change(sender, instance, created, **kwargs):
-    if not created and instance.status == 'active':
+def handle_campaign_status_change(sender, instance, created, update_fields=None, **kwargs):
+    if not created and instance.status == 'active' and saved_field_changed(instance, 'status', update_fields):
         process_campaign_activation(instance)
 
 @receiver(post_save, sender=AdPlacement)
-def handle_placement_status_change(sender, instance, created, **kwargs):
-    if not created and instance.status == 'approved':
+def handle_placement_status_change(sender, instance, created, update_fields=None, **kwargs):
+    if not created and instance.status == 'approved' and saved_field_changed(instance, 'status', update_fields):
         process_placement_approval(instance)
 
 
@@ -33,63 +48,76 @@ TRACKED_FIELDS = [
     "cpm",
     "objective",
 ]
-   
-@receiver(pre_save, sender=Campaign)
-def cache_previous_campaign_state(sender, instance, **kwargs):
-    if not instance.pk:
-        instance._previous_state = None
-        return
-    try:
-        instance._previous_state = sender.objects.get(pk=instance.pk)
-    except sender.DoesNotExist:
-        instance._previous_state = None
-        
-@receiver(post_save, sender=Campaign)
-def handle_campaign_tracked_field_changes(sender, instance, created, **kwargs):
-    if created or instance.status not in ['active', 'completed']:
-        return
-
-    previous = getattr(instance, '_previous_state', None)
-    if not previous:
+TRACKED_M2M_FIELDS = [
+    "targeting_languages",
+    "targeting_categories",
+]
+REMATCH_STATUSES = ['active', 'completed']
+
+def schedule_campaign_rematch(campaign, changed_fields):
+    """
+    Queues one re-match per campaign instance for when the current transaction
+    commits, so a save followed by `.set()` on both targeting M2Ms re-matches once.
+    """
+    pending = getattr(campaign, '_pending_rematch_fields', None)
+    if pending is not None:
+        pending.update(changed_fields)
         return
+    campaign._pending_rematch_fields = set(changed_fields)
 
-    changed_fields = []
-
-    # Basic fields
-    for field in TRACKED_FIELDS:
-        if getattr(previous, field) != getattr(instance, field):
-            changed_fields.append(field)
-
-    # M2M fields
-    previous_languages = set(previous.targeting_languages.values_list('pk', flat=True))
-    current_languages = set(instance.targeting_languages.values_list('pk', flat=True))
+    def run():
+        fields = campaign.__dict__.pop('_pending_rematch_fields', set())
+        logger.info(f": Re-matching campaign {campaign.id}, changed: {sorted(fields)}")
+        if campaign.status == 'completed':
+            # Budget/targeting added to a finished campaign restarts it in full
+            Campaign.objects.filter(pk=campaign.pk).update(status='active')
+            campaign.status = 'active'
+            campaign._snapshot_tracked_fields(['status'])
+            process_campaign_activation(campaign)
+        else:
+            process_campaign_rematch(campaign)
 
-    if previous_languages != current_languages:
-        changed_fields.append("targeting_languages")
+    transaction.on_commit(run)
 
-    previous_categories = set(previous.targeting_categories.values_list('pk', flat=True))
-    current_categories = set(instance.targeting_categories.values_list('pk', flat=True))
 
-    if previous_categories != current_categories:
-        changed_fields.append("targeting_categories")
+@receiver(post_save, sender=Campaign)
+def handle_campaign_tracked_field_changes(sender, instance, created, update_fields=None, **kwargs):
+    if created or instance.status not in REMATCH_STATUSES:
+        return
+    # A status flip into 'active' is already a full activation
+    if saved_field_changed(instance, 'status', update_fields):
+        return
 
+    changed_fields = [field for field in TRACKED_FIELDS if saved_field_changed(instance, field, update_fields)]
     if changed_fields:
+        schedule_campaign_rematch(instance, changed_fields)
 
-        # Temporarily disable signal triggering inside this save
-        from django.db.models.signals import post_save
-        post_save.disconnect(handle_campaign_tracked_field_changes, sender=Campaign)
 
-        instance.status = 'active'
-        instance.save(update_fields=['status'])
+def handle_campaign_targeting_changes(sender, instance, action, reverse, pk_set, **kwargs):
+    """`.set()` only fires add/remove for ids that actually changed."""
+    if reverse or action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if action != 'post_clear' and not pk_set:
+        return
+    if instance.status not in REMATCH_STATUSES:
+        return
+    field = next(name for name in TRACKED_M2M_FIELDS if getattr(Campaign, name).through is sender)
+    schedule_campaign_rematch(instance, [field])
 
-        post_save.connect(handle_campaign_tracked_field_changes, sender=Campaign)
 
-        process_campaign_activation(instance)
+for _field in TRACKED_M2M_FIELDS:
+    m2m_changed.connect(
+        handle_campaign_targeting_changes,
+        sender=getattr(Campaign, _field).through,
+        dispatch_uid=f"campaign_{_field}_rematch",
+    )
         
         
 @receiver(post_save, sender=AdPlacement)
-def notify_ad_action(sender, instance, created, **kwargs):
-    if not created and instance.status in ['approved', 'running', 'rejected', 'paused', 'completed']:
+def notify_ad_action(sender, instance, created, update_fields=None, **kwargs):
+    if created or not saved_field_changed(instance, 'status', update_fields):
+        return
+    if instance.status in ['approved', 'running', 'rejected', 'paused', 'completed']:
         title = f"Ad Placement {instance.status.title()}"
         message = f"The ad '{instance.ad.headline}' on your channel '{instance.channel.title}' has been {instance.status}."
 
@@ -219,4 +247,106 @@ def notify_withdrawal(sender, instance, created, **kwargs):
         except Exception as e:
             logger.error(f"Failed to send Telegram withdrawal message for ref {reference}: {e}")
             
-    
\ No newline at end of file
+    
+
+
+# ─── Notification unread counters ───
+
+@receiver(post_save, sender=Notification)
+def count_notification_save(sender, instance, created, **kwargs):
+    if created:
+        delta = int(instance.counts_as_unread)
+    elif any(field not in instance._tracked_initial for field in Notification.tracked_fields):
+        # Loaded with deferred fields: the previous state is unknown
+        NotificationService.recount([instance.user_id])
+        return
+    else:
+        was_unread = instance.previous_value('is_active') and not instance.previous_value('is_read')
+        delta = int(instance.counts_as_unread) - int(was_unread)
+    NotificationService.adjust({instance.user_id: delta})
+
+
+@receiver(post_delete, sender=Notification)
+def count_notification_delete(sender, instance, **kwargs):
+    if instance.counts_as_unread:
+        # No seeding: the user (and their counter) may be the one being deleted
+        NotificationService.adjust({instance.user_id: -1}, seed_missing=False)
+
+
+# ─── Creator dashboard cache invalidation ───
+
+def invalidate_dashboard_on_commit(user_id, *fragments):
+    if user_id:
+        transaction.on_commit(lambda: CreatorDashboardCache.invalidate(user_id, *fragments))
+
+
+@receiver([post_save, post_delete], sender=AdPerformance)
+def invalidate_dashboard_performance(sender, instance, **kwargs):
+    owner_id = AdPlacement.objects.filter(pk=instance.ad_placement_id).values_list('channel__owner_id', flat=True).first()
+    invalidate_dashboard_on_commit(owner_id, 'earnings', 'placements')
+
+
+@receiver([post_save, post_delete], sender=AdPlacement)
+def invalidate_dashboard_placements(sender, instance, **kwargs):
+    owner_id = CreatorChannel.objects.filter(pk=instance.channel_id).values_list('owner_id', flat=True).first()
+    invalidate_dashboard_on_commit(owner_id, 'placements')
+
+
+@receiver([post_save, post_delete], sender=CreatorChannel)
+def invalidate_dashboard_channels(sender, instance, **kwargs):
+    invalidate_dashboard_on_commit(instance.owner_id, 'placements')
+
+
+@receiver([post_save, post_delete], sender=Balance)
+@receiver([post_save, post_delete], sender=Transaction)
+@receiver([post_save, post_delete], sender=UserPaymentMethod)
+def invalidate_dashboard_balance(sender, instance, **kwargs):
+    invalidate_dashboard_on_commit(instance.user_id, 'balance')
+
+
+@receiver([post_save, post_delete], sender=WithdrawalRequest)
+def invalidate_dashboard_withdrawals(sender, instance, **kwargs):
+    if instance.user_payment_method_id:
+        user_id = UserPaymentMethod.objects.filter(pk=instance.user_payment_method_id).values_list('user_id', flat=True).first()
+        invalidate_dashboard_on_commit(user_id, 'balance')
+
+
+@receiver([post_save, post_delete], sender=Notification)
+def invalidate_dashboard_notifications(sender, instance, **kwargs):
+    invalidate_dashboard_on_commit(instance.user_id, 'notifications')
+
+
+@receiver(post_save, sender=LogEntry)
+def invalidate_dashboard_activity(sender, instance, created, **kwargs):
+    if created:
+        invalidate_dashboard_on_commit(instance.user_id, 'activity')
+
+
+# ─── Same-day admin analytics counters (closed days are rebuilt nightly) ───
+
+@receiver(post_save, sender=get_user_model())
+def count_daily_signup(sender, instance, created, **kwargs):
+    if created:
+        DailyStatsService.record({('new_users', ''): 1})
+
+
+@receiver(user_logged_in)
+def count_daily_active_user(sender, request, user, **kwargs):
+    DailyStatsService.record_login(user)
+
+
+@receiver(post_save, sender=CreatorChannel)
+def count_daily_channel(sender, instance, created, **kwargs):
+    if created:
+        DailyStatsService.record({('new_channels', ''): 1, ('new_reach', ''): instance.subscribers or 0})
+
+
+@receiver(m2m_changed, sender=CreatorChannel.language.through)
+def count_daily_channel_languages(sender, instance, action, reverse, pk_set, **kwargs):
+    """Languages are set after the channel is created; only today's channels count towards today."""
+    if reverse or action not in ('post_add', 'post_remove') or not pk_set:
+        return
+    if not instance.created_at or timezone.localdate(instance.created_at) != timezone.localdate():
+        return
+    step = 1 if action == 'post_add' else -1
+    DailyStatsService.record({('new_channels_by_language', str(pk)): step for pk in pk_set})
@@ -11,6 +11,24 @@ def is_valid_url(url):
     except ValueError:
         return False
     
+
+TELEGRAM_LINK_PREFIXES = ('https://t.me/', 'http://t.me/', 't.me/', 'https://telegram.me/')
+
+
+def normalize_channel_handle(value):
+    """
+    Canonical, lowercase Telegram username for a channel link, `@username`
+    or bare username: "https://t.me/MyChannel/" -> "mychannel".
+    """
+    if not value:
+        return None
+    handle = value.strip()
+    for prefix in TELEGRAM_LINK_PREFIXES:
+        if handle.lower().startswith(prefix):
+            handle = handle[len(prefix):]
+            break
+    return handle.strip('/').lstrip('@').lower() or None
+
     
 def get_unique_public_id(headline):
     """
@@ -1,15 +1,27 @@
 from django.utils import timezone
 from core.services.ad_placement_engine import AdPlacementEngine
+from core.services.campaign_rematch import CampaignRematcher
 from core.models import AdPlacement, AdPlacementStatus
 from core.services.content_delivery_engine import ContentDeliveryService
 from threading import local
+from contextlib import contextmanager
 from django.conf import settings
 import logging
 
 logger = logging.getLogger(__name__)
 _thread_locals = local()
 
-def process_campaign_activation(campaign):
+@contextmanager
+def deferred_placement_posting():
+    """Placements approved inside this block are not posted by the signal; the caller delivers them."""
+    previous = getattr(_thread_locals, 'campaign_approval', False)
+    setattr(_thread_locals, 'campaign_approval', True)
+    try:
+        yield
+    finally:
+        setattr(_thread_locals, 'campaign_approval', previous)
+
+def process_campaign_activation(campaign, channel_ids=None):
     if not campaign.ads.filter(is_active=True).exists():
         logger.warning(f"Campaign '{campaign.name}' has no active ads, skipping activation.")
         return
@@ -29,7 +41,7 @@ def process_campaign_activation(campaign):
     setattr(_thread_locals, 'campaign_approval', True)
     try:
         engine = AdPlacementEngine(campaign, [])
-        activated = engine.activate_placements()
+        activated = engine.activate_placements(channel_ids=channel_ids)
         logger.info(f"Activated placements for campaign {campaign.id}: {activated}")
         delivery_service = ContentDeliveryService(settings.BOT_SECRET_TOKEN)
 
@@ -57,6 +69,12 @@ def process_campaign_activation(campaign):
     finally:
         setattr(_thread_locals, 'campaign_approval', False)
 
+def process_campaign_rematch(campaign):
+    """Re-matches only the channels whose eligibility changed, then activates the new ones."""
+    entering = CampaignRematcher(campaign).run()
+    if entering:
+        process_campaign_activation(campaign, channel_ids=entering)
+
 def process_placement_approval(placement):
     if getattr(_thread_locals, 'campaign_approval', False):
         logger.info(f"Skipping Telegram post for placement {placement.id} as it was handled by campaign approval")
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:30
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_backupcheckpoint_resume_state'),
+        ('creators', '0007_remove_creatorreputation_creator'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='creatorchannel',
+            index=models.Index(django.db.models.functions.text.Lower('channel_link'), name='channel_link_lower_idx'),
+        ),
+    ]
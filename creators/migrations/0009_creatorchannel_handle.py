@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:31
+
+from django.db import migrations, models
+
+
+def normalize_handle(link):
+    handle = (link or '').strip()
+    for prefix in ('https://t.me/', 'http://t.me/', 't.me/', 'https://telegram.me/'):
+        if handle.lower().startswith(prefix):
+            handle = handle[len(prefix):]
+            break
+    return handle.strip('/').lstrip('@').lower() or None
+
+
+def populate_handles(apps, schema_editor):
+    CreatorChannel = apps.get_model('creators', 'CreatorChannel')
+    seen = set()
+    channels = []
+    # Oldest channel keeps the handle if two links only differ by case
+    for channel in CreatorChannel.objects.order_by('created_at').only('id', 'channel_link'):
+        handle = normalize_handle(channel.channel_link)
+        if handle in seen:
+            continue
+        seen.add(handle)
+        channel.handle = handle
+        channels.append(channel)
+    CreatorChannel.objects.bulk_update(channels, ['handle'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('creators', '0008_creatorchannel_channel_link_lower_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='creatorchannel',
+            name='channel_link_lower_idx',
+        ),
+        migrations.AddField(
+            model_name='creatorchannel',
+            name='handle',
+            field=models.CharField(blank=True, editable=False, max_length=200, null=True, unique=True),
+        ),
+        migrations.RunPython(populate_handles, migrations.RunPython.noop),
+    ]
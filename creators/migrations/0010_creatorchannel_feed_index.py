@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_adplacement_feed_index'),
+        ('creators', '0009_creatorchannel_handle'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='creatorchannel',
+            index=models.Index(fields=['status', 'updated_at', 'id'], name='channel_status_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,87 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:35
+
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db import migrations, models
+from django.utils import timezone
+
+FALLBACK_ENGAGEMENT = 0.15
+PRICING_FIELDS = [
+    'expected_engagement',
+    'expected_views',
+    'cost_per_post',
+    'reputation_rating',
+    'reputation_fraud_score',
+    'pricing_updated_at',
+]
+
+
+def populate_pricing_profile(apps, schema_editor):
+    CreatorChannel = apps.get_model('creators', 'CreatorChannel')
+    CreatorReputation = apps.get_model('creators', 'CreatorReputation')
+
+    reputations = {
+        channel_id: (rating, fraud_score, engagement)
+        for channel_id, rating, fraud_score, engagement in CreatorReputation.objects.values_list(
+            'creator_channel_id', 'rating', 'fraud_score', 'avg_engagement_rate'
+        )
+    }
+    now = timezone.now()
+    batch = []
+    for channel in CreatorChannel.objects.only('id', 'subscribers', 'min_cpm').iterator(chunk_size=1000):
+        rating, fraud_score, engagement = reputations.get(channel.id, (None, None, None))
+        channel.reputation_rating = rating
+        channel.reputation_fraud_score = fraud_score
+        channel.expected_engagement = engagement or FALLBACK_ENGAGEMENT
+        channel.expected_views = int(max(channel.subscribers or 0, 1) * channel.expected_engagement)
+        channel.cost_per_post = (
+            Decimal(channel.expected_views) / 1000 * Decimal(channel.min_cpm or 0)
+        ).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        channel.pricing_updated_at = now
+        batch.append(channel)
+        if len(batch) >= 1000:
+            CreatorChannel.objects.bulk_update(batch, PRICING_FIELDS)
+            batch = []
+    if batch:
+        CreatorChannel.objects.bulk_update(batch, PRICING_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('creators', '0010_creatorchannel_feed_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='creatorchannel',
+            name='cost_per_post',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name='creatorchannel',
+            name='expected_engagement',
+            field=models.FloatField(default=0.15, editable=False),
+        ),
+        migrations.AddField(
+            model_name='creatorchannel',
+            name='expected_views',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='creatorchannel',
+            name='pricing_updated_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='creatorchannel',
+            name='reputation_fraud_score',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='creatorchannel',
+            name='reputation_rating',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(populate_pricing_profile, migrations.RunPython.noop),
+    ]
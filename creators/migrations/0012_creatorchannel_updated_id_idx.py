@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0025_notification_inbox_idx'),
+        ('creators', '0011_creatorchannel_pricing_profile'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='creatorchannel',
+            index=models.Index(fields=['updated_at', 'id'], name='channel_updated_id_idx'),
+        ),
+    ]
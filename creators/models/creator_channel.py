@@ -1,6 +1,7 @@
 import uuid
 import pytz
 from datetime import timedelta
+from decimal import Decimal, ROUND_HALF_UP
 
 from django.db import models
 from django.utils import timezone
@@ -10,6 +11,7 @@ from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import get_user_model
 
 from core.models import Language, Category
+from core.utils.helper import normalize_channel_handle
 
 
 ALLOWED_TIMEZONES = [
@@ -34,6 +36,17 @@ class CreatorChannel(models.Model):
     
     TIMEZONE_CHOICES = [(tz, tz) for tz in ALLOWED_TIMEZONES]
 
+    FALLBACK_ENGAGEMENT = 0.15  # 15% engagement if no reputation data
+    PRICING_INPUT_FIELDS = {'subscribers', 'min_cpm'}
+    PRICING_FIELDS = [
+        'expected_engagement',
+        'expected_views',
+        'cost_per_post',
+        'reputation_rating',
+        'reputation_fraud_score',
+        'pricing_updated_at',
+    ]
+
 
     class Country(models.TextChoices):
         ET = 'ET', 'Ethiopia'
@@ -85,6 +98,15 @@ class CreatorChannel(models.Model):
         help_text=_('A channel with this link already exists.')
     )
 
+    # Lowercase Telegram username derived from channel_link, kept in sync on save
+    handle = models.CharField(
+        max_length=200,
+        unique=True,
+        null=True,
+        blank=True,
+        editable=False
+    )
+
     title = models.CharField(
         max_length=255,
         default='N/A'
@@ -145,6 +167,15 @@ class CreatorChannel(models.Model):
 
     ml_score = models.FloatField(default=0)
     last_score_updated = models.DateTimeField(null=True, blank=True)
+
+    # Pricing profile, precomputed from subscribers, min_cpm and the channel's
+    # CreatorReputation so matching/activation never join reputation at run time
+    expected_engagement = models.FloatField(default=0.15, editable=False)
+    expected_views = models.PositiveBigIntegerField(default=0, editable=False)
+    cost_per_post = models.DecimalField(max_digits=12, decimal_places=2, default=0, editable=False)
+    reputation_rating = models.FloatField(null=True, blank=True, editable=False)
+    reputation_fraud_score = models.FloatField(null=True, blank=True, editable=False)
+    pricing_updated_at = models.DateTimeField(null=True, blank=True, editable=False)
     
     status = models.CharField(
         max_length=50,
@@ -163,9 +194,56 @@ class CreatorChannel(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'updated_at', 'id'], name='channel_status_updated_idx'),
+            models.Index(fields=['updated_at', 'id'], name='channel_updated_id_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        handle = normalize_channel_handle(self.channel_link)
+        if handle != self.handle:
+            # Links differing only by case from an existing channel keep no handle
+            owned = CreatorChannel.objects.filter(handle=handle).exclude(pk=self.pk).exists() if handle else False
+            self.handle = None if owned else handle
+        self.refresh_pricing_profile()
+        update_fields = kwargs.get('update_fields')
+        if update_fields:
+            # Partial saves still bump updated_at; the scraper feed deltas key on it
+            update_fields = {*update_fields, 'updated_at'}
+            if 'channel_link' in update_fields:
+                update_fields.add('handle')
+            if update_fields & self.PRICING_INPUT_FIELDS:
+                update_fields.update(self.PRICING_FIELDS)
+            kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
+
+    def apply_reputation(self, reputation):
+        """Copies the reputation inputs of the pricing profile; pass None when there is none."""
+        if reputation is None:
+            self.expected_engagement = self.FALLBACK_ENGAGEMENT
+            self.reputation_rating = None
+            self.reputation_fraud_score = None
+        else:
+            self.expected_engagement = reputation.avg_engagement_rate or self.FALLBACK_ENGAGEMENT
+            self.reputation_rating = reputation.rating
+            self.reputation_fraud_score = reputation.fraud_score
+
+    def refresh_pricing_profile(self):
+        """Expected views and cost of one post at the channel's own min_cpm."""
+        engagement = self.expected_engagement or self.FALLBACK_ENGAGEMENT
+        self.expected_views = int(max(self.subscribers or 0, 1) * engagement)
+        cost = Decimal(self.expected_views) / 1000 * Decimal(self.min_cpm or 0)
+        self.cost_per_post = cost.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        self.pricing_updated_at = timezone.now()
+
+    def cost_at_cpm(self, cpm):
+        """Cost of one post priced at a campaign's CPM instead of min_cpm."""
+        return Decimal(self.expected_views) / 1000 * Decimal(max(cpm, Decimal('0.01')))
+
     
     def clean(self):
         super().clean()
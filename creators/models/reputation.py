@@ -57,6 +57,23 @@ class CreatorReputation(models.Model):
 
     def __str__(self):
         return f"{self.creator_channel.owner} - {self.rating:.2f}"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.sync_channel_pricing()
+
+    def delete(self, *args, **kwargs):
+        channel = self.creator_channel
+        result = super().delete(*args, **kwargs)
+        channel.apply_reputation(None)
+        channel.save(update_fields=CreatorChannel.PRICING_FIELDS)
+        return result
+
+    def sync_channel_pricing(self):
+        """Refreshes the pricing profile cached on the channel."""
+        channel = self.creator_channel
+        channel.apply_reputation(self)
+        channel.save(update_fields=CreatorChannel.PRICING_FIELDS)
     
     
     class Meta:
@@ -11,7 +11,6 @@ from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
 from allauth.account.models import EmailAddress, EmailConfirmation
 
 from django.db.models import Sum, F, Q, Count, Avg, DecimalField,  ExpressionWrapper, FloatField
-from django.db.models.functions import TruncDate
 
 from django.utils import timezone
 from django.utils.timezone import now, timedelta
@@ -27,6 +26,9 @@ from django.http import HttpResponse, HttpResponseRedirect
 
 from core.services.matching_engine import CampaignChannelMatcher
 from core.services.ad_placement_engine import AdPlacementEngine
+from core.services.campaign_lifecycle import CampaignLifecycleService
+from core.services.notification_service import NotificationService
+from core.services.daily_stats import DailyStatsService
 from payments.services import WithdrawalService, EarningService
 
 from creators.models import (
@@ -123,24 +125,10 @@ class AnalyticsAdminSite(admin.AdminSite):
             return response
 
         else:
-            # Default export (users & channels as before)
-            user_growth = (
-                User.objects
-                .filter(date_joined__gte=start_date)
-                .annotate(date=TruncDate('date_joined'))
-                .values('date')
-                .annotate(count=Count('id'))
-                .order_by('date')
-            )
-
-            channel_trends = (
-                CreatorChannel.objects
-                .filter(created_at__gte=start_date)
-                .annotate(date=TruncDate('created_at'))
-                .values('date')
-                .annotate(count=Count('id'))
-                .order_by('date')
-            )
+            # Default export (users & channels as before), from the daily snapshot
+            daily = DailyStatsService.daily(timezone.localdate(start_date), ['new_users', 'new_channels'])
+            users_by_date = dict(daily['new_users'][''])
+            channels_by_date = dict(daily['new_channels'][''])
 
             response = HttpResponse(content_type='text/csv')
             response['Content-Disposition'] = 'attachment; filename="analytics_export.csv"'
@@ -148,15 +136,7 @@ class AnalyticsAdminSite(admin.AdminSite):
             writer = csv.writer(response)
             writer.writerow(['Date', 'New Users', 'New Channels'])
 
-            all_dates = sorted(set(
-                [entry['date'] for entry in user_growth] +
-                [entry['date'] for entry in channel_trends]
-            ))
-
-            users_by_date = {entry['date']: entry['count'] for entry in user_growth}
-            channels_by_date = {entry['date']: entry['count'] for entry in channel_trends}
-
-            for date in all_dates:
+            for date in sorted(set(users_by_date) | set(channels_by_date)):
                 writer.writerow([
                     date,
                     users_by_date.get(date, 0),
@@ -166,146 +146,94 @@ class AnalyticsAdminSite(admin.AdminSite):
             return response
     
     def analytics_dashboard(self, request):
+        """
+        Reads only the DailyStat snapshot (see DailyStatsService), so the page
+        costs the same whatever the selected range.
+        """
         range_days = int(request.GET.get('range', 30))  # default to 30 days
         selected_language = request.GET.get('language')
         selected_range = str(range_days)
-        start_date = now() - timedelta(days=range_days)
-        
+        start_date = timezone.localdate() - timedelta(days=range_days)
+
+        daily = DailyStatsService.daily(start_date, [
+            'new_users', 'active_users', 'new_channels', 'new_reach', 'new_channels_by_language', 'visitors',
+        ])
+        in_range = DailyStatsService.totals(['new_channels_by_language'], start=start_date)
+        all_time = DailyStatsService.totals(['visitors_by_device', 'visitors_by_os', 'visitors_premium'])
+        gauges = DailyStatsService.gauges()
+
+        def labels(points):
+            return [str(day) for day, _ in points]
+
+        def values(points):
+            return [value for _, value in points]
+
         # User data for bar chart
-        user_types = (
-            User.objects
-            .values('user_type')
-            .annotate(count=Count('id'))
-            .order_by('-count')
-        )
-        user_labels = [item['user_type'] for item in user_types]
-        user_data = [item['count'] for item in user_types]
+        user_types = gauges['users_by_type']
+        user_labels = [user_type for user_type, _ in user_types]
+        user_data = values(user_types)
 
         # Category data for pie chart
-        categories = (
-            Category.objects
-            .annotate(channel_count=Count('channels'))
-            .order_by('-channel_count')
-        )
-        category_labels = [cat.name for cat in categories]
-        category_data = [cat.channel_count for cat in categories]
+        categories = gauges['channels_by_category']
+        # Keys are stored as strings; Category ids are UUIDs
+        category_names = {str(obj.pk): obj.name for obj in Category.objects.in_bulk([pk for pk, _ in categories]).values()}
+        category_labels = [category_names[pk] for pk, _ in categories if pk in category_names]
+        category_data = [count for pk, count in categories if pk in category_names]
 
         # User growth (line chart)
-        user_growth = (
-            User.objects
-            .filter(date_joined__gte=start_date)
-            .annotate(date=TruncDate('date_joined'))
-            .values('date')
-            .annotate(count=Count('id'))
-            .order_by('date')
-        )
-        user_growth_labels = [str(entry['date']) for entry in user_growth]
-        user_growth_data = [entry['count'] for entry in user_growth]
+        user_growth = daily['new_users']['']
+        user_growth_labels = labels(user_growth)
+        user_growth_data = values(user_growth)
 
         # Daily active users (bar chart)
-        active_users = (
-            User.objects
-            .filter(last_login__gte=start_date)
-            .annotate(date=TruncDate('last_login'))
-            .values('date')
-            .annotate(count=Count('id'))
-            .order_by('date')
-        )
-        daily_active_labels = [str(entry['date']) for entry in active_users]
-        daily_active_data = [entry['count'] for entry in active_users]
+        active_users = daily['active_users']['']
+        daily_active_labels = labels(active_users)
+        daily_active_data = values(active_users)
 
         # Channels over time (line/area chart)
-        channel_trends = (
-            CreatorChannel.objects
-            .filter(created_at__gte=start_date)
-            .annotate(date=TruncDate('created_at'))
-            .values('date')
-            .annotate(count=Count('id'))
-            .order_by('date')
-        )
         if selected_language:
-            channel_trends = channel_trends.filter(language__in=[selected_language])
-        channel_labels = [str(entry['date']) for entry in channel_trends]
-        channel_data = [entry['count'] for entry in channel_trends]
+            channel_trends = daily['new_channels_by_language'][selected_language]
+        else:
+            channel_trends = daily['new_channels']['']
+        channel_labels = labels(channel_trends)
+        channel_data = values(channel_trends)
         
         # Channel distribution by language
-        language_data = (
-            Language.objects
-            .annotate(channel_count=Count('channels', filter=Q(channels__created_at__gte=start_date)))
-            .filter(channel_count__gt=0)
-            .order_by('-channel_count')
-        )
-        language_labels = [lang.name for lang in language_data]
-        language_counts = [lang.channel_count for lang in language_data]
+        language_totals = in_range['new_channels_by_language']
         all_languages = Language.objects.filter(is_active=True)
+        language_names = {str(obj.pk): obj.name for obj in Language.objects.in_bulk([pk for pk, _ in language_totals]).values()}
+        language_labels = [language_names[pk] for pk, _ in language_totals if pk in language_names]
+        language_counts = [count for pk, count in language_totals if pk in language_names]
         
         # Payment Methods (Group by PaymentMethodType.name)
-        payment_methods = (
-            UserPaymentMethod.objects
-            .values('payment_method_type__name')
-            .annotate(count=Count('id'))
-            .order_by('-count')
-        )
-        payment_method_labels = [item['payment_method_type__name'] for item in payment_methods]
-        payment_method_counts = [item['count'] for item in payment_methods]
+        payment_methods = gauges['payment_methods']
+        payment_method_labels = [name for name, _ in payment_methods]
+        payment_method_counts = values(payment_methods)
         
         
-        visitor_trends = (
-        TelegramVisitorLog.objects
-            .filter(timestamp__gte=start_date)
-            .annotate(date=TruncDate('timestamp'))
-            .values('date')
-            .annotate(count=Count('id'))
-            .order_by('date')
-        )
-        visitor_labels = [str(entry['date']) for entry in visitor_trends]
-        visitor_data = [entry['count'] for entry in visitor_trends]
+        visitor_trends = daily['visitors']['']
+        visitor_labels = labels(visitor_trends)
+        visitor_data = values(visitor_trends)
 
         # Device type distribution
-        device_distribution = (
-            TelegramVisitorLog.objects
-            .values('device_type')
-            .annotate(count=Count('id'))
-            .order_by('-count')
-        )
-        device_labels = [d['device_type'] for d in device_distribution]
-        device_counts = [d['count'] for d in device_distribution]
+        device_distribution = all_time['visitors_by_device']
+        device_labels = [device_type for device_type, _ in device_distribution]
+        device_counts = values(device_distribution)
 
         # OS distribution
-        os_distribution = (
-            TelegramVisitorLog.objects
-            .values('os')
-            .annotate(count=Count('id'))
-            .order_by('-count')
-        )
-        os_labels = [o['os'] for o in os_distribution]
-        os_counts = [o['count'] for o in os_distribution]
+        os_distribution = all_time['visitors_by_os']
+        os_labels = [os_name for os_name, _ in os_distribution]
+        os_counts = values(os_distribution)
 
         # Premium vs Non-premium users
-        premium_stats = TelegramVisitorLog.objects.aggregate(
-            premium=Count('id', filter=Q(is_premium=True)),
-            non_premium=Count('id', filter=Q(is_premium=False)),
-        )
+        premium_stats = dict(all_time['visitors_premium'])
         
         # --- Add total audience (reach) over time ---
-        range_days = int(request.GET.get('range', 30))
-        start_date = now() - timedelta(days=range_days)
-
-        audience_over_time = (
-            CreatorChannel.objects
-            .filter(created_at__gte=start_date)
-            .annotate(date=TruncDate('created_at'))
-            .values('date')
-            .annotate(total_reach=Sum('subscribers'))
-            .order_by('date')
-        )
-        
-        total_current_reach = CreatorChannel.objects.aggregate(
-            total=Sum('subscribers')
-        )['total'] or 0
+        audience_over_time = daily['new_reach']['']
+        total_current_reach = dict(gauges['total_reach']).get('', 0)
 
-        reach_labels = [str(entry['date']) for entry in audience_over_time]
-        reach_data = [entry['total_reach'] or 0 for entry in audience_over_time]
+        reach_labels = labels(audience_over_time)
+        reach_data = values(audience_over_time)
         
         # Add to context
         context = {
@@ -313,6 +241,8 @@ class AnalyticsAdminSite(admin.AdminSite):
             'selected_range': selected_range,
             'selected_language': selected_language,
             'title': 'Analytics Dashboard',
+            'stats_since': DailyStatsService.history_start(),
+            'gauge_refresh_minutes': DailyStatsService.GAUGE_TTL // 60,
             'user_labels': json.dumps(user_labels),      
             'user_data': json.dumps(user_data),
             'user_growth_labels': json.dumps(user_growth_labels),
@@ -336,8 +266,8 @@ class AnalyticsAdminSite(admin.AdminSite):
             'device_counts': json.dumps(device_counts),
             'os_labels': json.dumps(os_labels),
             'os_counts': json.dumps(os_counts),
-            'premium_count': premium_stats['premium'],
-            'non_premium_count': premium_stats['non_premium'],
+            'premium_count': premium_stats.get('premium', 0),
+            'non_premium_count': premium_stats.get('non_premium', 0),
             
             'reach_labels': json.dumps(reach_labels),
             'reach_data': json.dumps(reach_data),
@@ -521,7 +451,14 @@ class CreatorChannelAdmin(admin.ModelAdmin):
     list_filter = ('status', 'is_active', 'region', 'created_at')
     search_fields = ('title', 'owner__username', 'channel_link', 'cpm')
     filter_horizontal = ('language', 'category')
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = (
+        'created_at',
+        'updated_at',
+        'expected_engagement',
+        'expected_views',
+        'cost_per_post',
+        'pricing_updated_at',
+    )
     list_select_related = ('owner',)
     inlines = [CreatorReputationInline]
     
@@ -631,31 +568,25 @@ class CreatorChannelAdmin(admin.ModelAdmin):
         Sends a notification and Telegram message to creators who don't have a verified payment method.
         Only applies to verified channels.
         """
-        notified = 0
-        skipped = 0
-
-        for channel in queryset:
-            if channel.status != 'verified':
-                skipped += 1
-                continue
-
-            owner = channel.owner
-            has_verified_payment = UserPaymentMethod.objects.filter(
-                user=owner,
-                status=UserPaymentMethod.Status.VERIFIED
-            ).exists()
-
-            if has_verified_payment:
-                continue
-
-            # Send notification
-            Notification.objects.create(
-                user=owner,
-                title="⚠️ Add a Verified Payment Method",
-                message="You're verified but still missing a verified payment method. Please add one to start earning.",
-                type="Payment"
-            )
+        verified = queryset.filter(status='verified').select_related('owner__telegram_profile')
+        skipped = queryset.count() - verified.count()
+        paid_owner_ids = set(UserPaymentMethod.objects.filter(
+            user_id__in=verified.values('owner_id'),
+            status=UserPaymentMethod.Status.VERIFIED
+        ).values_list('user_id', flat=True))
+        owners = list({
+            channel.owner_id: channel.owner for channel in verified if channel.owner_id not in paid_owner_ids
+        }.values())
+
+        # Send notification
+        NotificationService.fan_out(
+            [owner.pk for owner in owners],
+            title="⚠️ Add a Verified Payment Method",
+            message="You're verified but still missing a verified payment method. Please add one to start earning.",
+            type="Payment"
+        )
 
+        for owner in owners:
             # Send Telegram message if applicable
             if hasattr(owner, 'telegram_profile') and owner.telegram_profile.chat_id:
                 send_telegram_notification(
@@ -667,7 +598,7 @@ class CreatorChannelAdmin(admin.ModelAdmin):
                     )
                 )
 
-            notified += 1
+        notified = len(owners)
 
         self.message_user(
             request,
@@ -756,40 +687,33 @@ class CreatorChannelAdmin(admin.ModelAdmin):
                 )
                 return HttpResponseRedirect(request.get_full_path())
             
-            # Send messages to selected channels
-            for channel in queryset:
-                try:
-                    owner = channel.owner
-                                        
-                    # Create notification
-                    notification = Notification.objects.create(
-                        user=owner,
-                        title=title,
-                        message=message,
-                        type="Admin Message"
-                    )
-                    
-                    # Send Telegram message if available
-                    telegram_sent = False
-                    if hasattr(owner, 'telegram_profile') and owner.telegram_profile.tg_id:
-                        try:
-                            send_telegram_notification(
-                                chat_id=owner.telegram_profile.tg_id,
-                                text=telegram_message
-                            )
-                            telegram_sent = True
-                        except Exception as e:
-                            error_msg = f"Telegram failed for {owner}: {str(e)}"
-                            errors.append(error_msg)
-                    else:
-                        print(f"DEBUG: No Telegram profile or tg_id for {owner}")
-                    
-                    notified += 1
-                    
-                except Exception as e:
-                    error_msg = f"Failed for {channel.title}: {str(e)}"
-                    errors.append(error_msg)
-                    skipped += 1
+            # One notification per owner, inserted in bulk
+            owners = list({
+                channel.owner_id: channel.owner for channel in queryset.select_related('owner__telegram_profile')
+            }.values())
+            try:
+                NotificationService.fan_out(
+                    [owner.pk for owner in owners],
+                    title=title,
+                    message=message,
+                    type="Admin Message"
+                )
+            except Exception as e:
+                self.message_user(request, f"Failed to create notifications: {str(e)}", messages.ERROR)
+                return HttpResponseRedirect(request.get_full_path())
+
+            # Send Telegram messages if available
+            for owner in owners:
+                if hasattr(owner, 'telegram_profile') and owner.telegram_profile.tg_id:
+                    try:
+                        send_telegram_notification(
+                            chat_id=owner.telegram_profile.tg_id,
+                            text=telegram_message
+                        )
+                    except Exception as e:
+                        error_msg = f"Telegram failed for {owner}: {str(e)}"
+                        errors.append(error_msg)
+                notified += 1
 
             
             # Show results
@@ -837,7 +761,7 @@ class CampaignAdmin(admin.ModelAdmin):
     list_select_related = ('advertiser',)
     list_per_page = 25
     inlines = [AdInline]
-    actions = ['approve_campaigns', 'pause_campaigns', 'resubmit_campaigns']
+    actions = ['approve_campaigns', 'pause_campaigns', 'resume_campaigns', 'stop_campaigns', 'resubmit_campaigns']
     readonly_fields = ('total_spent', 'created_at', 'updated_at')
     fieldsets = (
         (_('Basic Information'), {
@@ -884,49 +808,33 @@ class CampaignAdmin(admin.ModelAdmin):
     advertiser_link.short_description = 'Advertiser'
     advertiser_link.admin_order_field = 'advertiser__username'
 
-    @admin.action(description='Approve selected campaigns')
-    def approve_campaigns(self, request, queryset):
-        updated = 0
-        for campaign in queryset.filter(status='in_review'):
-            if not campaign.ads.filter(is_active=True).exists():
-                self.message_user(
-                    request,
-                    f"Campaign '{campaign.name}' has no active ads.",
-                    messages.WARNING
-                )
-                continue
-            campaign.status = 'active'  # Signal will handle activation and posting
-            campaign.save()
-            advertiser = campaign.advertiser        
-            advertiser_title = f"Ad Placement {campaign.status.title()}"
-            advertiser_message = (
-                f"Your ad '{campaign.ads.first()}' in campaign '{campaign.name}' "
-                f"has been Approved and is now Live"
-            )
-            Notification.objects.create(
-                user=advertiser,
-                title=advertiser_title,
-                message=advertiser_message,
-                type='campaign_approved'
-            )
-            updated += 1
+    def run_lifecycle_action(self, request, queryset, action, verb):
+        """Bulk lifecycle change in one transaction; posting/deletion is delivered in the background."""
+        result = CampaignLifecycleService(action, queryset.values_list('pk', flat=True)).run()
+        for failure in result['failed']:
+            self.message_user(request, f"Campaign {failure['id']}: {failure['error']}", messages.WARNING)
         self.message_user(
             request,
-            f'Successfully approved {updated} campaigns.',
+            f"Successfully {verb} {len(result['updated'])} campaigns "
+            f"({result['queued_posts']} posts, {result['queued_deletions']} deletions queued).",
             messages.SUCCESS
         )
-        
+
+    @admin.action(description='Approve selected campaigns')
+    def approve_campaigns(self, request, queryset):
+        self.run_lifecycle_action(request, queryset, 'approve', 'approved')
 
     @admin.action(description='Pause selected campaigns')
     def pause_campaigns(self, request, queryset):
-        updated = queryset.filter(status='active').update(status='on_hold')
-        for campaign in queryset.filter(status='active'):
-            AdPlacement.objects.filter(ad__campaign=campaign).update(status='paused')
-        self.message_user(
-            request,
-            f'Successfully paused {updated} campaigns.',
-            messages.SUCCESS
-        )
+        self.run_lifecycle_action(request, queryset, 'pause', 'paused')
+
+    @admin.action(description='Resume selected campaigns')
+    def resume_campaigns(self, request, queryset):
+        self.run_lifecycle_action(request, queryset, 'resume', 'resumed')
+
+    @admin.action(description='Stop selected campaigns')
+    def stop_campaigns(self, request, queryset):
+        self.run_lifecycle_action(request, queryset, 'stop', 'stopped')
 
     @admin.action(description='Resubmit selected campaigns')
     def resubmit_campaigns(self, request, queryset):
@@ -978,11 +886,12 @@ class CampaignAdmin(admin.ModelAdmin):
     def pause(self, request, obj):
         obj.status = 'on_hold'
         obj.save()
-        AdPlacement.objects.filter(ad__campaign=obj).update(status='paused')
+        CampaignLifecycleService.pause_placements([obj.pk])
         self.message_user(request, 'Campaign paused.', messages.INFO)
         return HttpResponseRedirect(request.path)
 
     def resume(self, request, obj):
+        CampaignLifecycleService.resume_placements([obj.pk])
         obj.status = 'active'  # Signal will handle activation and posting
         obj.save()
         self.message_user(request, 'Campaign resumed.', messages.SUCCESS)
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:56
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('miniapp', '0002_alter_telegramvisitorlog_telegram_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='telegramvisitorlog',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
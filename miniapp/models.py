@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 class TelegramVisitorLog(models.Model):
     telegram_id = models.BigIntegerField(null=True, blank=True)
@@ -15,4 +16,23 @@ class TelegramVisitorLog(models.Model):
     browser = models.CharField(max_length=50, null=True, blank=True)
     device_name = models.CharField(max_length=100, null=True, blank=True)
     
-    timestamp = models.DateTimeField(auto_now_add=True)
\ No newline at end of file
+    # Set at the hit, not at insert: rows are written in batches (see VisitorLogBuffer)
+    timestamp = models.DateTimeField(default=timezone.now)
+
+class DailyStat(models.Model):
+    """
+    One pre-aggregated analytics value for a local day: `metric`, optionally
+    split by `key` (a language id, device type, ...). Filled by
+    DailyStatsService; the admin analytics pages read only this table.
+    """
+    date = models.DateField()
+    metric = models.CharField(max_length=50)
+    key = models.CharField(max_length=100, blank=True, default='')
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['metric', 'date', 'key']
+
+    def __str__(self):
+        return f"{self.date} {self.metric}{f'[{self.key}]' if self.key else ''} = {self.value}"
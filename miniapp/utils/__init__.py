@@ -1,4 +1,5 @@
 from .auth import *
 from .bot import *
 from .otp import *
-from .helper import *
\ No newline at end of file
+from .helper import *
+from .visitor_log import *
\ No newline at end of file
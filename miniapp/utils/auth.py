@@ -6,12 +6,15 @@ import hashlib
 import time
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction, IntegrityError
 from django.utils import timezone
-from django.contrib.auth import login, update_session_auth_hash
+from django.contrib.auth import login
 from django.http import JsonResponse
+from core.services.daily_stats import DailyStatsService
 from users.models import TelegramProfile, UserType
 from django.contrib.auth import get_user_model
 
@@ -22,6 +25,27 @@ User = get_user_model()
 logger = logging.getLogger(__name__)
 
 class TelegramAuthHelper:
+    INIT_DATA_MAX_AGE = 86400  # seconds (24 hours)
+    VALIDATED_CACHE_PREFIX = 'tg_init_data'
+    SESSION_TG_ID = 'tg_id'
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def secret_key(bot_token: str) -> bytes:
+        """HMAC key derived from the bot token; computed once per process."""
+        return hmac.new(
+            b"WebAppData",
+            msg=bot_token.encode(),
+            digestmod=hashlib.sha256
+        ).digest()
+
+    @staticmethod
+    def validated_cache_key(init_data: str, bot_token: str) -> str:
+        # Keyed on the whole string, so a cached hash can't vouch for altered fields,
+        # and on the token, so data signed for one bot isn't accepted for another
+        digest = hashlib.sha256(f"{hashlib.sha256(bot_token.encode()).hexdigest()}:{init_data}".encode()).hexdigest()
+        return f"{TelegramAuthHelper.VALIDATED_CACHE_PREFIX}:{digest}"
+
     @staticmethod
     def parse_init_data(init_data: str) -> Dict[str, str]:
         """Parse Telegram initData into a dictionary."""
@@ -38,6 +62,10 @@ class TelegramAuthHelper:
             logger.warning("Empty init_data or bot_token provided")
             return False
 
+        cache_key = TelegramAuthHelper.validated_cache_key(init_data, bot_token)
+        if cache.get(cache_key):
+            return True
+
         try:
             parsed = TelegramAuthHelper.parse_init_data(init_data)
             if not parsed:
@@ -50,7 +78,7 @@ class TelegramAuthHelper:
                 return False
 
             auth_date = int(parsed.get("auth_date", "0"))
-            if abs(time.time() - auth_date) > 86400:  # 24 hours
+            if abs(time.time() - auth_date) > TelegramAuthHelper.INIT_DATA_MAX_AGE:
                 logger.warning("Expired Telegram login")
                 return False
             
@@ -59,22 +87,22 @@ class TelegramAuthHelper:
                 f"{k}={v}" for k, v in sorted(parsed.items())
             )
 
-            # Compute secret key
-            secret_key = hmac.new(
-                b"WebAppData",
-                msg=bot_token.encode(),
-                digestmod=hashlib.sha256
-            ).digest()
-
             # Compute expected hash
             expected_hash = hmac.new(
-                secret_key,
+                TelegramAuthHelper.secret_key(bot_token),
                 msg=data_check_string.encode(),
                 digestmod=hashlib.sha256
             ).hexdigest()
 
             # Compare hashes securely
-            return hmac.compare_digest(expected_hash, received_hash)
+            if not hmac.compare_digest(expected_hash, received_hash):
+                return False
+
+            # Remember the result until the initData itself expires
+            remaining = int(auth_date + TelegramAuthHelper.INIT_DATA_MAX_AGE - time.time())
+            if remaining > 0:
+                cache.set(cache_key, True, remaining)
+            return True
 
         except Exception as e:
             logger.error(f"Error validating init_data: {str(e)}", exc_info=True)
@@ -108,6 +136,37 @@ class TelegramAuthHelper:
             logger.error(f"Failed to parse Telegram user data: {e}")
             return None
 
+    @staticmethod
+    def has_telegram_session(request, tg_id) -> bool:
+        """The request already carries a live Telegram login for this tg_id."""
+        user = request.user
+        return (
+            user.is_authenticated
+            and user.is_active
+            and request.session.get('auth_source') == 'telegram'
+            and request.session.get(TelegramAuthHelper.SESSION_TG_ID) == tg_id
+        )
+
+    @staticmethod
+    def login_response(user) -> JsonResponse:
+        return JsonResponse({
+            "success": True,
+            "user": {
+                "id": user.id,
+                "username": user.username,
+                "user_type": user.user_type,
+                "is_authenticated": True
+            },
+            "redirect_url": "/main/" 
+        })
+
+    @staticmethod
+    def start_telegram_session(request, user, tg_id):
+        # login() already stores the session auth hash
+        login(request, user)
+        request.session['auth_source'] = 'telegram'
+        request.session[TelegramAuthHelper.SESSION_TG_ID] = tg_id
+
     @staticmethod
     def process_telegram_auth(request, data: str) -> JsonResponse:
         """Handle the complete Telegram authentication flow."""
@@ -121,6 +180,13 @@ class TelegramAuthHelper:
 
         try:
             tg_id = user_data['id']
+
+            # Fast path: reuse the existing session, no lookups or session writes
+            if TelegramAuthHelper.has_telegram_session(request, tg_id):
+                # login() is skipped, so count the visit towards daily active users here
+                DailyStatsService.record_login(request.user)
+                return TelegramAuthHelper.login_response(request.user)
+
             telegram_profile = TelegramProfile.objects.select_related("user").filter(tg_id=tg_id).first()
 
             if telegram_profile:
@@ -129,20 +195,8 @@ class TelegramAuthHelper:
                 # telegram_profile.update_field(photo_url=user_data['photo_url'])
                 # telegram_profile.photo_url = user_data.get('photo_url')
                 # telegram_profile.save(update_fields=['photo_url'])
-                login(request, user)
-                request.session['auth_source'] = 'telegram'
-                update_session_auth_hash(request, user)
-
-                return JsonResponse({
-                    "success": True,
-                    "user": {
-                        "id": user.id,
-                        "username": user.username,
-                        "user_type": user.user_type,
-                        "is_authenticated": True
-                    },
-                    "redirect_url": "/main/" 
-                })
+                TelegramAuthHelper.start_telegram_session(request, user, tg_id)
+                return TelegramAuthHelper.login_response(user)
 
             # New user flow
             with transaction.atomic():
@@ -170,20 +224,8 @@ class TelegramAuthHelper:
                     auth_date=datetime.fromtimestamp(int(user_data["auth_date"])) if user_data.get("auth_date") else timezone.now(),
                 )
 
-                login(request, user)
-                request.session['auth_source'] = 'telegram'
-                update_session_auth_hash(request, user)
-
-                return JsonResponse({
-                    "success": True,
-                    "user": {
-                        "id": user.id,
-                        "username": user.username,
-                        "user_type": user.user_type,
-                        "is_authenticated": True
-                    },
-                    "redirect_url": "/main/" 
-                })
+                TelegramAuthHelper.start_telegram_session(request, user, tg_id)
+                return TelegramAuthHelper.login_response(user)
 
         except IntegrityError as e:
             logger.error(f"Database error during Telegram auth: {str(e)}")
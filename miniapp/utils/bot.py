@@ -2,6 +2,8 @@ from django.conf import settings
 import cloudinary.uploader
 import requests
 
+from core.utils.helper import normalize_channel_handle
+
 
 class TelegramVerificationUtil:
     BASE_URL = "https://api.telegram.org"
@@ -31,8 +33,7 @@ class TelegramVerificationUtil:
         return self._request("getMe")["id"]
 
     def fetch_channel_data_if_bot_admin(self, channel_username):
-        if not channel_username.startswith('@'):
-            channel_username = '@' + channel_username
+        channel_username = '@' + (normalize_channel_handle(channel_username) or '')
 
         try:
             chat_info = self._request("getChat", {"chat_id": channel_username})
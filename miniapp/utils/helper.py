@@ -1,3 +1,4 @@
+from functools import lru_cache
 from user_agents import parse as parse_ua
 
 def get_client_ip(request):
@@ -9,12 +10,11 @@ def get_client_ip(request):
 def get_user_agent(request):
     return request.META.get('HTTP_USER_AGENT', '')
 
-def get_device_info(request):
-    user_agent_str = get_user_agent(request)
+@lru_cache(maxsize=1024)
+def parse_user_agent(user_agent_str):
+    """Parsed device fields for a user agent string; repeat agents skip the regex parse."""
     user_agent = parse_ua(user_agent_str)
-
     return {
-        "user_agent_str": user_agent_str,
         "is_mobile": user_agent.is_mobile,
         "is_tablet": user_agent.is_tablet,
         "is_pc": user_agent.is_pc,
@@ -22,4 +22,15 @@ def get_device_info(request):
         "os": user_agent.os.family,
         "browser": user_agent.browser.family,
         "device": user_agent.device.family,
-    }
\ No newline at end of file
+        "device_type": (
+            "mobile" if user_agent.is_mobile
+            else "tablet" if user_agent.is_tablet
+            else "pc" if user_agent.is_pc
+            else "bot" if user_agent.is_bot
+            else "unknown"
+        ),
+    }
+
+def get_device_info(request):
+    user_agent_str = get_user_agent(request)
+    return {"user_agent_str": user_agent_str, **parse_user_agent(user_agent_str)}
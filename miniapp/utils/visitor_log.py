@@ -0,0 +1,110 @@
+import atexit
+import logging
+import os
+import threading
+from collections import deque
+
+from django.db import connections
+from django.utils import timezone
+
+from core.services.daily_stats import DailyStatsService
+from miniapp.models import TelegramVisitorLog
+from .helper import get_client_ip, get_device_info
+
+logger = logging.getLogger(__name__)
+
+
+class VisitorLogBuffer:
+    """
+    In-process buffer for TelegramVisitorLog rows.
+
+    Requests only append an unsaved row (timestamped at the hit); a daemon
+    thread writes the buffer with one `bulk_create` every FLUSH_INTERVAL
+    seconds, or as soon as FLUSH_SIZE rows are waiting, and adds them to the
+    day's visitor counters in DailyStat. Rows still buffered at interpreter
+    exit are flushed by an atexit hook. If the database is unavailable the
+    buffer keeps at most MAX_BUFFERED rows, dropping the oldest.
+    """
+
+    FLUSH_SIZE = 200
+    FLUSH_INTERVAL = 5  # seconds
+    MAX_BUFFERED = 10000
+
+    _instance = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls):
+        with cls._lock:
+            # A forked worker needs its own flusher thread
+            if cls._instance is None or cls._instance.pid != os.getpid():
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.rows = deque(maxlen=self.MAX_BUFFERED)
+        self.rows_lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.wake = threading.Event()
+        threading.Thread(target=self.run, name='visitor-log-flusher', daemon=True).start()
+        atexit.register(self.flush)
+
+    def add(self, row):
+        with self.rows_lock:
+            self.rows.append(row)
+            pending = len(self.rows)
+        if pending >= self.FLUSH_SIZE:
+            self.wake.set()
+
+    def drain(self):
+        with self.rows_lock:
+            rows = list(self.rows)
+            self.rows.clear()
+        return rows
+
+    def flush(self):
+        """Writes everything buffered so far; returns the number of rows saved."""
+        with self.flush_lock:
+            rows = self.drain()
+            if not rows:
+                return 0
+            try:
+                TelegramVisitorLog.objects.bulk_create(rows, batch_size=self.FLUSH_SIZE)
+            except Exception as e:
+                logger.error(f": Failed to flush {len(rows)} visitor log rows: {str(e)}")
+                with self.rows_lock:
+                    # Put them back in front of anything logged meanwhile, keeping the newest
+                    self.rows = deque(rows + list(self.rows), maxlen=self.MAX_BUFFERED)
+                return 0
+            else:
+                DailyStatsService.record_visits(rows)
+            finally:
+                connections.close_all()
+            return len(rows)
+
+    def run(self):
+        while True:
+            self.wake.wait(self.FLUSH_INTERVAL)
+            self.wake.clear()
+            self.flush()
+
+
+def log_visit(request, user_data=None):
+    """Queues a TelegramVisitorLog row for this request; no database write on the request path."""
+    user_data = user_data or {}
+    device_info = get_device_info(request)
+    VisitorLogBuffer.get().add(TelegramVisitorLog(
+        telegram_id=user_data.get("id"),
+        username=user_data.get("username"),
+        first_name=user_data.get("first_name"),
+        last_name=user_data.get("last_name"),
+        is_premium=user_data.get("is_premium", False),
+        ip_address=get_client_ip(request),
+        user_agent=device_info["user_agent_str"],
+        device_type=device_info["device_type"],
+        os=device_info["os"],
+        browser=device_info["browser"],
+        device_name=device_info["device"],
+        timestamp=timezone.now(),
+    ))
@@ -19,12 +19,11 @@ from miniapp.utils import (
     store_otp_in_session,
     is_otp_valid,
     clear_otp_session_data,
-    get_client_ip,
     get_user_agent,
-    get_device_info,
+    log_visit,
 )
 from users.models import TelegramProfile, UserType
-from miniapp.models import TelegramVisitorLog
+from core.services.daily_stats import DailyStatsService
 # from django_ratelimit.decorators import ratelimit
 
 
@@ -52,29 +51,14 @@ def process_telegram_auth_view(request):
 
         tg_id = user_data["id"]
         
-        ip = get_client_ip(request)
-        device_info = get_device_info(request)
-
-        TelegramVisitorLog.objects.create(
-            telegram_id=tg_id,
-            username=user_data.get("username"),
-            first_name=user_data.get("first_name"),
-            last_name=user_data.get("last_name"),
-            is_premium=user_data.get("is_premium", False),
-            ip_address=ip,
-            user_agent=device_info["user_agent_str"],
-            device_type=(
-                "mobile" if device_info["is_mobile"]
-                else "tablet" if device_info["is_tablet"]
-                else "pc" if device_info["is_pc"]
-                else "bot" if device_info["is_bot"]
-                else "unknown"
-            ),
-            os=device_info["os"],
-            browser=device_info["browser"],
-            device_name=device_info["device"],
-        )
+        log_visit(request, user_data)
         
+        # Already signed in as this Telegram user: skip the lookup and OTP
+        if TelegramAuthHelper.has_telegram_session(request, tg_id):
+            # login() is skipped, so count the visit towards daily active users here
+            DailyStatsService.record_login(request.user)
+            return redirect('creator:main')
+
         # Check user status and redirect appropriately
         profile = TelegramProfile.objects.select_related("user").filter(tg_id=tg_id).first()
         
@@ -85,6 +69,7 @@ def process_telegram_auth_view(request):
                     return redirect('creator:auth')  
                 
             if request.user.is_authenticated and request.user.id == user.id:
+                DailyStatsService.record_login(user)
                 return redirect('creator:main') 
             
             else:
@@ -226,7 +211,12 @@ def verify_otp_view(request):
     if not user:
         return JsonResponse({"error": "User not found"}, status=404)
 
-    login(request, user)
+    tg_id = request.session.get("otp_tg_id")
+    if tg_id:
+        # Marks the session as a Telegram login so later opens take the fast path
+        TelegramAuthHelper.start_telegram_session(request, user, tg_id)
+    else:
+        login(request, user)
     clear_otp_session_data(request.session)
 
     return JsonResponse({"success": True, "redirect_url": "/main/"})
\ No newline at end of file
@@ -6,7 +6,7 @@ from django.http import HttpResponse
 import json
 import logging
 
-from django.db.models import Sum, F, Prefetch, DecimalField
+from django.db.models import Prefetch
 from datetime import timedelta
 
 from api.serializers.creators import UserPaymentMethodSerializer
@@ -14,7 +14,8 @@ from creators.models import CreatorChannel
 from payments.models import UserPaymentMethod
 from payments.services import BalanceService  
 from core.models import AdPlacement, AdPerformance, Notification
-from miniapp.models import TelegramVisitorLog
+from core.services.creator_dashboard import CreatorDashboardCache
+from core.services.earnings_series import EarningsSeriesService
 from django.contrib.admin.models import LogEntry
 from rest_framework import status, permissions
 from rest_framework.decorators import permission_classes
@@ -22,7 +23,7 @@ from rest_framework.decorators import permission_classes
 from users.models import TelegramProfile, UserType
 from django.contrib.auth import get_user_model
 from .auth_view import process_telegram_auth_view
-from miniapp.utils import get_device_info, get_client_ip
+from miniapp.utils import log_visit
 
 
 logger = logging.getLogger(__name__)
@@ -35,29 +36,7 @@ def landing_view(request):
     
     if request.method == 'GET':
         try:
-            ip = get_client_ip(request)
-            device_info = get_device_info(request)
-
-            TelegramVisitorLog.objects.create(
-                telegram_id=None,  # not available yet
-                username=None,
-                first_name=None,
-                last_name=None,
-                is_premium=False,
-                ip_address=ip,
-                user_agent=device_info["user_agent_str"],
-                device_type=(
-                    "mobile" if device_info["is_mobile"]
-                    else "tablet" if device_info["is_tablet"]
-                    else "pc" if device_info["is_pc"]
-                    else "bot" if device_info["is_bot"]
-                    else "unknown"
-                ),
-                os=device_info["os"],
-                browser=device_info["browser"],
-                device_name=device_info["device"],
-            )
-            request.session["logged_landing_visit"] = True  # Prevent duplicate logging
+            log_visit(request)
         except Exception as e:
             logger.warning(f"Landing visitor logging failed: {e}")
             
@@ -179,76 +158,77 @@ def dashboard_view(request):
         user = request.user
         days = timezone.now().day
         time_threshold = timezone.now() - timezone.timedelta(days=days)
-
-        # Top 3 Channels by Subscribers
-        top_channels = CreatorChannel.objects.filter(
-            owner=user,
-            is_active=True
-        ).order_by('-subscribers')[:3]
-
-        # Active Ad Placements
-        active_ad_placements = AdPlacement.objects.filter(
-            channel__owner=user,
-            status__in=['running', 'approved'],
-            is_active=True
-        ).select_related('ad', 'channel').prefetch_related(
-            Prefetch(
-                'performance',
-                queryset=AdPerformance.objects.filter(date__gte=time_threshold)
-            )
-        )[:5]
-
-        # Weekly performance data
-        weekly_data = AdPerformance.objects.filter(
-            ad_placement__channel__owner=user,
-            date__gte=time_threshold
-        ).values('date__week').annotate(
-            total_impressions=Sum('impressions'),
-            total_earnings=Sum(F('cost') * 0.85, output_field=DecimalField())
-        ).order_by('date__week')
-
-        chart_data = [0, 0, 0, 0]
-        week_labels = []
-
-        i = 1
-        for i, week_data in enumerate(weekly_data):
-            if i < timezone.now().weekday():
-                chart_data[i] = float(week_data['total_earnings'] or 0)
-                week_number = i+1
-                week_labels.append(f"W{week_number}")
-                
-        # Balance summary
-        balance_summary = BalanceService.get_balance_summary(user, role="creator")
-
-        # Payment methods
-        payment_methods = UserPaymentMethod.objects.filter(user=user, is_active=True)
+        fragments = CreatorDashboardCache(user.id)
+
+        def placements_fragment():
+            # Top 3 Channels by Subscribers
+            top_channels = CreatorChannel.objects.filter(
+                owner=user,
+                is_active=True
+            ).order_by('-subscribers')[:3]
+
+            # Active Ad Placements
+            active_ad_placements = AdPlacement.objects.filter(
+                channel__owner=user,
+                status__in=['running', 'approved'],
+                is_active=True
+            ).select_related('ad', 'channel').prefetch_related(
+                Prefetch(
+                    'performance',
+                    queryset=AdPerformance.objects.filter(date__gte=time_threshold)
+                )
+            )[:5]
+            return {
+                'top_channels': list(top_channels),
+                'active_ad_placements': list(active_ad_placements),
+            }
+
+        def balance_fragment():
+            # Balance summary
+            balance_summary = BalanceService.get_balance_summary(user, role="creator")
+
+            # Payment methods
+            payment_methods = UserPaymentMethod.objects.filter(user=user, is_active=True)
+            return {
+                'payment_methods': list(payment_methods),
+                'earning': {
+                    'available': balance_summary['available'],
+                    'locked': balance_summary['escrow'],
+                    'pending_withdrawals': balance_summary['pending_withdrawals'],
+                },
+            }
 
         # Notifications (mark as read)
-        notifications = Notification.active_objects.filter(
-            user=user,
-            is_read=False,
-            is_active=True
-        ).order_by('-created_at')[:5]
+        notifications = fragments.get('notifications', 'miniapp', lambda: list(
+            Notification.active_objects.filter(
+                user=user,
+                is_read=False,
+                is_active=True
+            ).order_by('-created_at')[:5]
+        ))
         # notifications.update(is_read=True)
 
         # Recent Activity Logs
-        activity_logs = LogEntry.objects.filter(
-            user_id=user.id
-        ).order_by('-action_time')[:6]
+        activity_logs = fragments.get('activity', 'miniapp', lambda: list(
+            LogEntry.objects.filter(
+                user_id=user.id
+            ).order_by('-action_time')[:6]
+        ))
+
+        # The placements' performance window depends on the day of the month
+        placements = fragments.get('placements', f"miniapp:{time_threshold:%Y-%m-%d}", placements_fragment)
+        earnings = fragments.get(
+            'earnings', f"month:{timezone.localdate():%Y-%m}",
+            lambda: EarningsSeriesService.month_weeks_chart(user, timezone.localdate())
+        )
+        balance = fragments.get('balance', 'miniapp', balance_fragment)
 
         context = {
             'user': user,
             'bot_link': settings.BOT_LINK,
-            'top_channels': top_channels,
-            'active_ad_placements': active_ad_placements, 
-            'payment_methods': payment_methods,
-            'earning': {
-                'available': balance_summary['available'],
-                'locked': balance_summary['escrow'],
-                'pending_withdrawals': balance_summary['pending_withdrawals'],
-            },
-            'chart_data': chart_data,
-            'week_labels': week_labels,
+            **placements,
+            **earnings,
+            **balance,
             'notifications': notifications,
             'activity_logs': activity_logs
         }